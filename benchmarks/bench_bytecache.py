@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+""" Compile a generated module with many functions, untranslated, once
+without the .qc cache and once loading it. Functions are compiled eagerly
+so the .qc file written after the first run has all their bytecode:
+
+benchmarks/bench_bytecache.py [<functions> ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.builtins.defaults import default_builtins
+from nolang.bytecache import compile_file, cache_path, write_caches
+from nolang.importer import Importer
+from nolang.lexer import get_lexer
+from nolang.objects.space import Space
+from nolang.parser import get_parser
+
+FUNCTION = """
+def f%(i)d(a, b) {
+    var x, i;
+    x = 0;
+    i = 0;
+    while i < a {
+        if i not in [1, 2, 3] {
+            x = x + b * 2 - 1;
+        }
+        i = i + 1;
+    }
+    return `f%(i)d ${x}`;
+}
+"""
+
+
+def compile(space, parser, lexer, fname):
+    source = open(fname).read()
+    importer = Importer(space, os.path.dirname(fname), parser, lexer)
+    start = time.time()
+    compile_file(space, parser, lexer, importer, fname, 'self.bench', source)
+    elapsed = time.time() - start
+    write_caches(space, importer)
+    return elapsed
+
+
+def main(argv):
+    counts = [int(arg) for arg in argv[1:]] or [100, 1000]
+    parser = get_parser()
+    lexer = get_lexer()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        print "%10s%12s%12s%12s" % ("functions", "parse s", "cached s",
+                                    "qc KB")
+        for count in counts:
+            fname = os.path.join(tmpdir, "bench%d.q" % count)
+            with open(fname, "w") as f:
+                f.write("".join([FUNCTION % {'i': i} for i in range(count)]))
+            space = Space()
+            space.setup_builtins(*default_builtins(space))
+            space.eager_compile = True
+            cold = compile(space, parser, lexer, fname)
+            space = Space()
+            space.setup_builtins(*default_builtins(space))
+            space.eager_compile = True
+            warm = compile(space, parser, lexer, fname)
+            size = os.path.getsize(cache_path(fname))
+            print "%10d%12.3f%12.3f%12.1f" % (count, cold, warm, size / 1024.0)
+    finally:
+        shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+""" Run loops that raise and catch an exception on every iteration,
+untranslated, and report the best of three times per raise. The exception
+is caught in the frame that raised it, raised by a dict lookup of a missing
+key or raised a few calls deeper than it is caught:
+
+benchmarks/bench_exceptions.py [<iterations>]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.builtins.defaults import default_builtins
+from nolang.compiler import compile_module
+from nolang.importer import Importer
+from nolang.interpreter import Interpreter
+from nolang.lexer import get_lexer
+from nolang.objects.space import Space
+from nolang.parser import get_parser, ParsingState
+
+PROGRAM = """
+def same_frame(n) {
+    var i;
+    i = 0;
+    while i < n {
+        try {
+            raise KeyError("x");
+        } except KeyError {
+        }
+        i = i + 1;
+    }
+}
+
+def dict_miss(n) {
+    var i, d, v;
+    d = {"a": 1};
+    i = 0;
+    while i < n {
+        try {
+            v = d["b"];
+        } except KeyError {
+            v = 0;
+        }
+        i = i + 1;
+    }
+}
+
+def deep(n) {
+    if n < 1 {
+        raise KeyError("x");
+    }
+    deep(n - 1);
+}
+
+def nested(n) {
+    var i;
+    i = 0;
+    while i < n {
+        try {
+            deep(5);
+        } except KeyError {
+        }
+        i = i + 1;
+    }
+}
+"""
+
+CASES = ["same_frame", "dict_miss", "nested"]
+
+
+def setup_module():
+    space = Space()
+    space.setup_builtins(*default_builtins(space))
+    space.setup(Interpreter())
+    parser = get_parser()
+    lexer = get_lexer()
+    ast = parser.parse(lexer.tokenize('bench', PROGRAM),
+                       ParsingState('bench', PROGRAM))
+    w_mod = compile_module(space, 'bench', 'self.bench', PROGRAM, ast,
+                           Importer(space))
+    w_mod.setup(space)
+    return space, w_mod
+
+
+def run(space, w_mod, name, iterations):
+    start = time.time()
+    space.call_method(w_mod, name, [space.newint(iterations)])
+    return time.time() - start
+
+
+def main(argv):
+    iterations = 10000
+    if len(argv) > 1:
+        iterations = int(argv[1])
+    space, w_mod = setup_module()
+    print "%-14s%12s%16s" % ("case", "ms", "us per raise")
+    for name in CASES:
+        run(space, w_mod, name, 10)  # compile and quicken
+        t = min([run(space, w_mod, name, iterations) for i in range(3)])
+        print "%-14s%12.2f%16.2f" % (name, t * 1000, t * 1e6 / iterations)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+""" Lex generated sources of growing size and report the throughput, which
+should stay flat if lexing is linear. The sources have very long lines,
+like minified code or large data literals. With -c the tokens go into a
+compact TokenBuffer instead of being kept as Token objects, the last column
+is the growth of the peak memory of the process:
+
+benchmarks/bench_lexer.py [-c] [<megabytes> ...]
+"""
+
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.lexer import get_lexer
+
+LINE_ITEMS = 100000  # about half a megabyte per line
+
+
+def generate(size):
+    line = "x = [" + ", ".join(["12345"] * LINE_ITEMS) + "];\n"
+    return "def main() {\n" + line * (size // len(line) + 1) + "}\n"
+
+
+def lex(lexer, source, compact):
+    if compact:
+        tokens = lexer.tokenize('<bench>', source)
+        tokens.fill()
+    else:
+        tokens = list(lexer.lex('<bench>', source))
+    return len(tokens)
+
+
+def maxrss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(argv):
+    compact = '-c' in argv
+    sizes = [float(arg) for arg in argv[1:] if arg != '-c'] or [1, 2, 4]
+    lexer = get_lexer()
+    print "%10s%12s%12s%14s%12s" % ("MB", "tokens", "seconds", "tokens/s",
+                                    "peak MB")
+    for size in sizes:
+        source = generate(int(size * 1024 * 1024))
+        rss = maxrss()
+        start = time.time()
+        count = lex(lexer, source, compact)
+        elapsed = time.time() - start
+        print "%10.2f%12d%12.2f%14d%12.1f" % (
+            len(source) / 1024.0 / 1024.0, count, elapsed, count / elapsed,
+            (maxrss() - rss) / 1024.0)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+""" Set up generated modules with as many imports as functions, untranslated
+and without the .qc cache, and report the best of three times per element,
+which should stay flat as the modules grow:
+
+benchmarks/bench_module.py [<count> ...]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.builtins.defaults import default_builtins
+from nolang.bytecache import compile_file, ProgramCache
+from nolang.importer import Importer
+from nolang.lexer import get_lexer
+from nolang.objects.space import Space
+from nolang.parser import get_parser, ParsingState
+
+
+def write_modules(tmpdir, count):
+    with open(os.path.join(tmpdir, "lib.q"), "w") as f:
+        f.write("".join(["def f%d() { return %d; }\n" % (i, i)
+                         for i in range(count)]))
+    fname = os.path.join(tmpdir, "main%d.q" % count)
+    with open(fname, "w") as f:
+        f.write("".join(["import self.lib.f%d;\n" % i for i in range(count)]))
+        f.write("".join(["def g%d() { return f%d(); }\n" % (i, i)
+                         for i in range(count)]))
+    return fname
+
+
+def parse(parser, lexer, programs, fname):
+    source = open(fname).read()
+    programs.put(fname, source, parser.parse(lexer.tokenize(fname, source),
+                                             ParsingState(fname, source)))
+    return source
+
+
+def setup_module(parser, lexer, fname):
+    space = Space()
+    space.setup_builtins(*default_builtins(space))
+    space.bytecode_cache = False
+    # parse upfront, so only the module setup is measured
+    programs = ProgramCache()
+    parse(parser, lexer, programs,
+          os.path.join(os.path.dirname(fname), "lib.q"))
+    source = parse(parser, lexer, programs, fname)
+    importer = Importer(space, os.path.dirname(fname), parser, lexer,
+                        programs)
+    start = time.time()
+    compile_file(space, parser, lexer, importer, fname, 'self.main', source)
+    return time.time() - start
+
+
+def main(argv):
+    counts = [int(arg) for arg in argv[1:]] or [100, 200, 400, 800, 1600]
+    parser = get_parser()
+    lexer = get_lexer()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        print "%10s%12s%16s" % ("imports", "setup ms", "us per element")
+        for count in counts:
+            fname = write_modules(tmpdir, count)
+            t = min([setup_module(parser, lexer, fname) for i in range(3)])
+            print "%10d%12.2f%16.2f" % (count, t * 1000, t * 1e6 / count)
+    finally:
+        shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
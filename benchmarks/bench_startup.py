@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+""" Report how long building the parser takes untranslated, with the LR
+tables generated, copied from the shipped nolang.parsetab module to an
+empty rply table cache and read from the cache, then run a program with an
+empty main with each given interpreter executable and report the best and
+the mean wall-clock time, which is the interpreter's startup cost
+end-to-end:
+
+benchmarks/bench_startup.py [-n <repeat>] [<executable> ...]
+
+Pass ./nolang-py to compare with running untranslated.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.parser import get_parser, make_parser_generator
+
+PROGRAM = """
+def main() {
+}
+"""
+
+
+def run_once(executable, program):
+    start = time.time()
+    subprocess.check_call([executable, program])
+    return time.time() - start
+
+
+def time_parser(build, cache_home):
+    os.environ['XDG_CACHE_HOME'] = cache_home
+    start = time.time()
+    build()
+    return time.time() - start
+
+
+def generate():
+    make_parser_generator().build()
+
+
+def main(argv):
+    repeat = 20
+    if len(argv) > 2 and argv[1] == '-n':
+        repeat = int(argv[2])
+        argv = argv[:1] + argv[3:]
+    executables = argv[1:]
+    tmpdir = tempfile.mkdtemp()
+    try:
+        print "%-20s%12s" % ("parser tables", "ms")
+        for name, build, cache_home in [
+                ("generated", generate, os.path.join(tmpdir, "empty")),
+                ("shipped", get_parser, os.path.join(tmpdir, "cache")),
+                ("cache read", get_parser, os.path.join(tmpdir, "cache"))]:
+            print "%-20s%12.2f" % (name, time_parser(build, cache_home) * 1000)
+        if not executables:
+            return 0
+        print
+        program = os.path.join(tmpdir, "empty.q")
+        with open(program, "w") as f:
+            f.write(PROGRAM)
+        print "%-20s%12s%12s" % ("executable", "best ms", "mean ms")
+        for executable in executables:
+            run_once(executable, program)  # writes empty.qc
+            times = [run_once(executable, program) for i in range(repeat)]
+            print "%-20s%12.2f%12.2f" % (os.path.basename(executable),
+                                         min(times) * 1000,
+                                         sum(times) * 1000 / len(times))
+    finally:
+        shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
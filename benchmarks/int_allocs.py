@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+""" Count the W_IntObject allocations of a counting loop, untranslated,
+with and without the small int cache:
+
+benchmarks/int_allocs.py [<n> ...]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.builtins.defaults import default_builtins
+from nolang.compiler import compile_module
+from nolang.importer import Importer
+from nolang.interpreter import Interpreter
+from nolang.lexer import get_lexer
+from nolang.objects import int as intmodule
+from nolang.objects.space import Space
+from nolang.parser import get_parser, ParsingState
+
+PROGRAM = """
+def main() {
+    var i;
+    i = 0;
+    while i < %d {
+        i = i + 1;
+    }
+}
+"""
+
+
+class CountingIntObject(intmodule.W_IntObject):
+    allocations = 0
+
+    def __init__(self, intval):
+        CountingIntObject.allocations += 1
+        intmodule.W_IntObject.__init__(self, intval)
+
+
+def count_allocations(n, small_int_max):
+    # an empty range disables the cache
+    space = Space(small_int_min=0, small_int_max=small_int_max)
+    space.setup_builtins(*default_builtins(space))
+    space.setup(Interpreter())
+    source = (PROGRAM % n).lstrip()
+    ast = get_parser().parse(get_lexer().lex('<loop>', source),
+                             ParsingState('<loop>', source))
+    w_mod = compile_module(space, '<loop>', 'self.loop', source, ast,
+                           Importer(space))
+    w_mod.setup(space)
+    CountingIntObject.allocations = 0
+    space.call_method(w_mod, 'main', [])
+    return CountingIntObject.allocations
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv[1:]] or [1000, 10000]
+    orig = intmodule.W_IntObject
+    # space.py imported the class already, patch it where it's used
+    from nolang.objects import space as spacemodule
+    spacemodule.W_IntObject = CountingIntObject
+    try:
+        print "%-10s%16s%16s" % ("n", "no cache", "cache")
+        for n in sizes:
+            print "%-10d%16d%16d" % (n, count_allocations(n, -1),
+                                     count_allocations(n, 1024))
+    finally:
+        spacemodule.W_IntObject = orig
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+""" Compile programs at -O0 and -O1 and report the number of bytecode
+instructions for each, to see how much the optimizer removes:
+
+benchmarks/opt_stats.py [<program.q> ...]
+
+Without arguments all the benchmark programs in this directory are used.
+"""
+
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nolang.builtins.defaults import default_builtins
+from nolang.compiler import compile_module
+from nolang.function import W_Function
+from nolang.importer import Importer
+from nolang.lexer import get_lexer
+from nolang.objects.space import Space
+from nolang.objects.usertype import W_UserType
+from nolang.parser import get_parser, ParsingState
+
+
+def count_instructions(bytecode):
+    count = 0
+    i = 0
+    while i < len(bytecode.bytecode):
+        count += 1
+        i = bytecode.code_next[i]
+    return count
+
+
+def count_module(w_mod):
+    count = 0
+    for w_elem in w_mod.functions:
+        if isinstance(w_elem, W_Function):
+            count += count_instructions(w_elem.bytecode)
+        elif isinstance(w_elem, W_UserType):
+            for w_meth in w_elem.class_elements_w:
+                if isinstance(w_meth, W_Function):
+                    count += count_instructions(w_meth.bytecode)
+    return count
+
+
+def compile_program(fname, opt_level):
+    parser = get_parser()
+    lexer = get_lexer()
+    space = Space()
+    space.setup_builtins(*default_builtins(space))
+    space.opt_level = opt_level
+    source = open(fname).read()
+    ast = parser.parse(lexer.lex(fname, source), ParsingState(fname, source))
+    importer = Importer(space, os.path.dirname(os.path.abspath(fname)),
+                        parser, lexer)
+    return compile_module(space, fname, 'self.stats', source, ast, importer)
+
+
+def main(argv):
+    programs = argv[1:]
+    if not programs:
+        programs = sorted(glob.glob(os.path.join(os.path.dirname(__file__),
+                                                 '*.q')))
+    print "%-20s%10s%10s%10s" % ("program", "-O0", "-O1", "removed")
+    for program in programs:
+        before = count_module(compile_program(program, 0))
+        after = count_module(compile_program(program, 1))
+        removed = 100.0 * (before - after) / before
+        print "%-20s%10d%10d%9.1f%%" % (os.path.basename(program), before,
+                                        after, removed)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+""" Run the benchmark programs in this directory with one or more
+interpreter executables and report the best wall-clock time for each:
+
+benchmarks/run.py [-n <repeat>] <executable> [<executable> ...]
+"""
+
+import glob
+import os
+import subprocess
+import sys
+import time
+
+
+def run_once(executable, program):
+    with open(os.devnull, 'w') as devnull:
+        start = time.time()
+        subprocess.check_call([executable, program], stdout=devnull)
+        return time.time() - start
+
+
+def main(argv):
+    repeat = 3
+    if len(argv) > 2 and argv[1] == '-n':
+        repeat = int(argv[2])
+        argv = argv[:1] + argv[3:]
+    executables = argv[1:]
+    if not executables:
+        print __doc__
+        return 1
+    programs = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.q')))
+    print "%-20s" % "benchmark" + "".join(
+        ["%16s" % os.path.basename(e) for e in executables])
+    for program in programs:
+        times = []
+        for executable in executables:
+            times.append(min([run_once(executable, program)
+                              for i in range(repeat)]))
+        print "%-20s" % os.path.basename(program) + "".join(
+            ["%15.3fs" % t for t in times])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -6,20 +6,16 @@ with compile() interface that produces bytecode
 from nolang import opcodes
 from nolang.function import W_Function
 from nolang.objects.usertype import W_UserType
-from nolang.bytecode import compile_bytecode
+from nolang.bytecode import compile_bytecode, CompilerError, LazyBytecode, \
+    NameAlreadyDefined
 from nolang.compiler import compile_class
 
 from rply.token import BaseBox
 
 
-class NameAlreadyDefined(Exception):
-    def __init__(self, name):
-        self.name = name
-
-
-class StoringIntoGlobal(Exception):
-    def __init__(self, name):
-        self.name = name
+class StoringIntoGlobal(CompilerError):
+    def get_message(self):
+        return "cannot assign to global %s" % self.name
 
 
 class AstNode(BaseBox):
@@ -263,8 +259,14 @@ class Function(AstNode):
             item.compile(state)
 
     def add_global_symbols(self, space, globals_w, source, w_mod):
-        w_g = W_Function(self.name, compile_bytecode(self, source,
-                         w_mod, self.arglist, self.lineno))
+        if space.eager_compile:
+            w_g = W_Function(self.name, compile_bytecode(space, self, source,
+                             w_mod, self.arglist, self.lineno,
+                             opt_level=space.opt_level))
+        else:
+            w_g = W_Function(self.name, None, LazyBytecode(
+                self, source, w_mod, self.arglist, self.lineno,
+                space.opt_level))
         globals_w.append(w_g)
 
 
@@ -286,17 +288,20 @@ class ClassDefinition(AstNode):
     def get_element_list(self):
         return self.body.get_element_list()
 
-    def add_global_symbols(self, space, globals_w, source, w_mod):
+    def get_force_names(self):
         force_names = None
         for item in self.body.get_element_list():
             if isinstance(item, VarDeclaration):
                 if force_names is None:
                     force_names = []
                 force_names.extend([x.name for x in item.vars])
+        return force_names
+
+    def add_global_symbols(self, space, globals_w, source, w_mod):
         t = compile_class(space, source, self, w_mod, self.parent)
         alloc, class_elements_w, w_parent, default_alloc = t
         w_g = W_UserType(alloc, self.name, class_elements_w, w_parent,
-                         default_alloc, force_names)
+                         default_alloc, self.get_force_names())
         globals_w.append(w_g)
 
 
@@ -444,6 +449,11 @@ class Getattr(AstNode):
         no = state.add_str_constant(self.identifier)
         state.emit(self.lhand.getendidx(), opcodes.GETATTR, no)
 
+    def compile_load_method(self, state):
+        self.lhand.compile(state)
+        no = state.add_str_constant(self.identifier)
+        state.emit(self.lhand.getendidx(), opcodes.LOAD_METHOD, no)
+
 
 class Setattr(AstNode):
     def __init__(self, lhand, identifier, rhand, srcpos):
@@ -542,7 +552,7 @@ class Identifier(AstNode):
         self.name = name
 
     def compile(self, state):
-        op, no = state.get_variable(self.name)
+        op, no = state.get_variable(self.name, self.getstartidx())
         state.emit(self.getstartidx(), op, no)
 
 
@@ -554,9 +564,9 @@ class Assignment(AstNode):
 
     def compile(self, state):
         self.expr.compile(state)
-        op, varno = state.get_variable(self.varname)
-        if op == opcodes.LOAD_GLOBAL:
-            raise StoringIntoGlobal(self.varname)
+        op, varno = state.get_variable(self.varname, self.getstartidx())
+        if op == opcodes.LOAD_GLOBAL or op == opcodes.LOAD_BUILTIN:
+            raise StoringIntoGlobal(self.varname, self.getstartidx())
         state.emit(self.expr.getstartidx(), opcodes.STORE, varno)
 
 
@@ -567,6 +577,14 @@ class Call(AstNode):
         self.arglist = arglist
 
     def compile(self, state):
+        if isinstance(self.left_hand, Getattr):
+            # obj.meth(...), don't create a bound method
+            self.left_hand.compile_load_method(state)
+            for arg in self.arglist:
+                arg.compile(state)
+            state.emit(self.left_hand.getendidx(), opcodes.CALL_METHOD,
+                       len(self.arglist))
+            return
         self.left_hand.compile(state)
         for arg in self.arglist:
             arg.compile(state)
@@ -641,7 +659,8 @@ class ExceptClause(AstNode):
         self.block = block
 
     def compile(self, state):
-        no = state.register_exception_setup(self.exception_names)
+        no = state.register_exception_setup(self.exception_names,
+                                            self.getstartidx())
         state.emit(self.getstartidx(), opcodes.COMPARE_EXCEPTION, no, 0)
         pos = state.get_patch_position()
         if self.varname is not None:
@@ -714,28 +733,33 @@ class Import(AstNode):
         AstNode.__init__(self, srcpos)
         self.import_part = import_part
         self.names = names
+        self.global_index = -1  # of the first name, see add_global_symbols
 
-    def add_name(self, mapping):
+    def get_names(self):
+        """ The global names this import binds, import foo binds foo
+        """
         if not self.names:
-            names = self.import_part
-        else:
-            names = self.names
-        for name in names:
+            return self.import_part
+        return self.names
+
+    def add_name(self, mapping):
+        for name in self.get_names():
             if name in mapping:
                 raise NameAlreadyDefined(name)
             mapping[name] = len(mapping)
 
     def add_missing_imports(self, space, w_mod, globals_w, importer):
-        idx = globals_w.index(None)
-        assert idx >= 0
-        importer.import_names(space, self.import_part, self.names,
-                              globals_w, idx)
+        assert self.global_index >= 0
+        if not self.names:
+            importer.import_names(space, [], self.import_part, globals_w,
+                                  self.global_index)
+        else:
+            importer.import_names(space, self.import_part, self.names,
+                                  globals_w, self.global_index)
 
     def add_global_symbols(self, space, globals_w, source, w_mod):
-        if self.names is None:
-            globals_w.append(None)
-        else:
-            globals_w.extend([None] * len(self.names))
+        self.global_index = len(globals_w)
+        globals_w.extend([None] * len(self.get_names()))
 
 
 class IdentifierListPartial(AstNode):
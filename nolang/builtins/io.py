@@ -3,4 +3,4 @@ from nolang.builtins.spec import parameters
 
 @parameters(name='print')
 def magic_print(space, args_w):
-    print space.str(args_w[0])
+    space.output.write_stdout(space.str(args_w[0]) + "\n")
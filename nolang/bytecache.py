@@ -0,0 +1,739 @@
+""" On-disk cache of compiled modules. Running a program writes foo.qc next
+to every module foo.q it compiled, which stores the bytecode of the
+functions and methods compiled by the end of the run together with what's
+needed to rebuild the module: class parents and fields, and imports, see
+write_caches. Loading it produces elements that compile_module accepts in
+place of the AST, so only a stale or missing cache goes through the lexer
+and parser. A function the cache has no bytecode for, because it was not
+called, parses the source when it is first called, see ReparsedBytecode.
+
+The file starts with a header that makes it stale if the format version,
+the optimization level or the builtins changed, or if the source does not
+have the recorded mtime, size and hash. All numbers are zigzag varints,
+strings are a length followed by the bytes.
+"""
+
+import os
+
+from nolang import astnodes as ast, opcodes
+from nolang.bytecode import Bytecode, CompilerError, ExceptionBlock, \
+    InvalidStackDepth, LazyBytecode
+from nolang.compiler import compile_class, compile_module
+from nolang.constants import IntegerConstant, StringConstant
+from nolang.function import W_Function
+from nolang.objects.usertype import W_UserType
+from nolang.optimizer import InlinedCall, jump_arg, uses_constant
+from nolang.parser import ParsingState
+
+from rpython.rlib.rstring import StringBuilder
+
+CACHE_MAGIC = "NQC\x00"
+CACHE_VERSION = 4
+
+ELEM_FUNCTION = 'f'
+ELEM_LAZY_FUNCTION = 'l'
+ELEM_CLASS = 'c'
+ELEM_IMPORT = 'i'
+CONST_INT = 'i'
+CONST_STR = 's'
+
+
+class CacheError(Exception):
+    """ Raised for a stale or malformed cache file, which is then ignored
+    """
+
+
+class FunctionNotInSource(CompilerError):
+    """ The source has no function that a .qc file read for it refers to,
+    the file was corrupted after the checks of load_module
+    """
+    def get_message(self):
+        return "function %s is not in the source its .qc file is for" % (
+            self.name,)
+
+
+def source_hash(s):
+    """ 32bit FNV-1a
+    """
+    h = 0x811c9dc5
+    for c in s:
+        h = ((h ^ ord(c)) * 0x01000193) & 0xffffffff
+    return h
+
+
+def builtins_hash(space):
+    """ Compiled code refers to builtins by index, so the cache is only valid
+    for the same builtins in the same order
+    """
+    if space.builtins_hash == -1:
+        space.builtins_hash = source_hash(
+            "\x00".join([w_b.name for w_b in space.builtins_w]))
+    return space.builtins_hash
+
+
+def cache_path(filename):
+    return filename + "c"
+
+
+def source_mtime(filename):
+    try:
+        return int(os.stat(filename).st_mtime)
+    except OSError:
+        return -1
+
+
+class Writer(object):
+    def __init__(self):
+        self.builder = StringBuilder()
+
+    def write_int(self, v):
+        if v < 0:
+            v = ((-v) << 1) | 1
+        else:
+            v = v << 1
+        while v >= 0x80:
+            self.builder.append(chr((v & 0x7f) | 0x80))
+            v >>= 7
+        self.builder.append(chr(v))
+
+    def write_tag(self, tag):
+        self.builder.append(tag)
+
+    def write_str(self, s):
+        self.write_int(len(s))
+        self.builder.append(s)
+
+    def write_int_list(self, lst):
+        self.write_int(len(lst))
+        for v in lst:
+            self.write_int(v)
+
+    def write_str_list(self, lst):
+        self.write_int(len(lst))
+        for s in lst:
+            self.write_str(s)
+
+    def write_optional_str_list(self, lst):
+        if lst is None:
+            self.write_int(-1)
+        else:
+            self.write_str_list(lst)
+
+    def build(self):
+        return self.builder.build()
+
+
+class Reader(object):
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read_byte(self):
+        if self.pos >= len(self.data):
+            raise CacheError
+        c = self.data[self.pos]
+        self.pos += 1
+        return ord(c)
+
+    def read_int(self):
+        v = 0
+        shift = 0
+        while True:
+            if shift > 63:
+                raise CacheError
+            c = self.read_byte()
+            v |= (c & 0x7f) << shift
+            shift += 7
+            if c < 0x80:
+                break
+        if v & 1:
+            return -(v >> 1)
+        return v >> 1
+
+    def read_tag(self):
+        return chr(self.read_byte())
+
+    def read_str(self):
+        lgt = self.read_int()
+        start = self.pos
+        end = start + lgt
+        if lgt < 0 or end > len(self.data):
+            raise CacheError
+        assert start >= 0
+        assert end >= 0
+        self.pos = end
+        return self.data[start:end]
+
+    def read_int_list(self):
+        lgt = self.read_int()
+        if lgt < 0:
+            raise CacheError
+        return [self.read_int() for i in range(lgt)]
+
+    def read_str_list(self):
+        lgt = self.read_int()
+        if lgt < 0:
+            raise CacheError
+        return [self.read_str() for i in range(lgt)]
+
+    def read_optional_str_list(self):
+        lgt = self.read_int()
+        if lgt < 0:
+            return None
+        return [self.read_str() for i in range(lgt)]
+
+    def at_end(self):
+        return self.pos == len(self.data)
+
+
+def write_header(writer, space, source, mtime):
+    writer.builder.append(CACHE_MAGIC)
+    writer.write_int(CACHE_VERSION)
+    writer.write_int(space.opt_level)
+    writer.write_int(builtins_hash(space))
+    writer.write_int(mtime)
+    writer.write_int(len(source))
+    writer.write_int(source_hash(source))
+
+
+def check_header(reader, space, source, mtime):
+    for c in CACHE_MAGIC:
+        if reader.read_byte() != ord(c):
+            raise CacheError
+    if (reader.read_int() != CACHE_VERSION or
+            reader.read_int() != space.opt_level or
+            reader.read_int() != builtins_hash(space) or
+            reader.read_int() != mtime or
+            reader.read_int() != len(source) or
+            reader.read_int() != source_hash(source)):
+        raise CacheError
+
+
+def global_index(space, w_mod, w_obj):
+    """ The index of w_obj in the module globals, or -1 - its index in the
+    builtins
+    """
+    for i, w_elem in enumerate(w_mod.functions):
+        if w_elem is w_obj:
+            return i
+    for i, w_elem in enumerate(space.builtins_w):
+        if w_elem is w_obj:
+            return -1 - i
+    raise CacheError
+
+
+def get_global(space, w_mod, index):
+    if index < 0:
+        return space.builtins_w[-1 - index]
+    return w_mod.functions[index]
+
+
+def write_bytecode(writer, space, bytecode):
+    writer.write_int_list(bytecode.varnames)
+    writer.write_int(len(bytecode._constants))
+    for constant in bytecode._constants:
+        if isinstance(constant, IntegerConstant):
+            writer.write_tag(CONST_INT)
+            writer.write_int(constant._intval)
+        elif isinstance(constant, StringConstant):
+            writer.write_tag(CONST_STR)
+            writer.write_str(constant._strval)
+        else:
+            raise CacheError
+    writer.write_str(bytecode.bytecode)
+    writer.write_str_list([var.name for var in bytecode.arglist])
+    writer.write_int(len(bytecode.exception_blocks))
+    for block in bytecode.exception_blocks:
+        writer.write_int_list([global_index(space, bytecode.module, w_type)
+                               for w_type in block.types_w])
+    writer.write_int_list(bytecode.lnotab)
+    writer.write_int(len(bytecode.inlined))
+    for inlined in bytecode.inlined:
+        writer.write_str(inlined.name)
+        writer.write_int_list([inlined.srcpos, inlined.start, inlined.end])
+
+
+def write_function(writer, space, name, position, w_func):
+    """ A function that was not compiled yet is written as its name and
+    position in the source, compiling it is left to its first call
+    """
+    assert isinstance(w_func, W_Function)
+    if w_func.bytecode is None:
+        writer.write_tag(ELEM_LAZY_FUNCTION)
+        writer.write_str(name)
+        writer.write_int(position)
+    else:
+        writer.write_tag(ELEM_FUNCTION)
+        writer.write_str(name)
+        write_bytecode(writer, space, w_func.bytecode)
+
+
+def write_class(writer, space, name, parent, force_names, elements, w_type):
+    assert isinstance(w_type, W_UserType)
+    writer.write_tag(ELEM_CLASS)
+    writer.write_str(name)
+    if parent is None:
+        writer.write_str("")
+    else:
+        writer.write_str(parent)
+    writer.write_optional_str_list(force_names)
+    write_elements(writer, space, elements, w_type.class_elements_w, 0)
+
+
+def write_elements(writer, space, elements, globals_w, index):
+    """ Write the elements, either the AST or what was read from a .qc
+    file, each along with what it compiled to, starting at globals_w[index]
+    """
+    count = 0
+    for item in elements:
+        if not isinstance(item, ast.VarDeclaration):
+            count += 1
+    writer.write_int(count)
+    for item in elements:
+        if isinstance(item, ast.Function):
+            write_function(writer, space, item.name, item.getstartidx(),
+                           globals_w[index])
+            index += 1
+        elif isinstance(item, CachedFunction):
+            write_function(writer, space, item.name, item.position,
+                           globals_w[index])
+            index += 1
+        elif isinstance(item, ast.ClassDefinition):
+            write_class(writer, space, item.name, item.parent,
+                        item.get_force_names(), item.get_element_list(),
+                        globals_w[index])
+            index += 1
+        elif isinstance(item, CachedClass):
+            write_class(writer, space, item.name, item.parent,
+                        item.force_names, item.elements, globals_w[index])
+            index += 1
+        elif isinstance(item, ast.Import):
+            writer.write_tag(ELEM_IMPORT)
+            writer.write_str_list(item.import_part)
+            writer.write_optional_str_list(item.names)
+            index += len(item.get_names())
+        elif not isinstance(item, ast.VarDeclaration):
+            raise CacheError
+
+
+def dump_module(space, source, mtime, program, w_mod):
+    writer = Writer()
+    write_header(writer, space, source, mtime)
+    write_elements(writer, space, program.get_element_list(), w_mod.functions,
+                   0)
+    return writer.build()
+
+
+class CachedCode(object):
+    """ The parts of a Bytecode read from the cache, built into one when the
+    module is set up
+    """
+    def __init__(self, varnames, constants, code, argnames, exc_indexes,
+                 lnotab, inlined):
+        self.varnames = varnames
+        self.constants = constants
+        self.code = code
+        self.argnames = argnames
+        self.exc_indexes = exc_indexes
+        self.lnotab = lnotab
+        self.inlined = inlined
+
+    def build(self, space, w_mod, source):
+        exception_blocks = []
+        for indexes in self.exc_indexes:
+            exception_blocks.append(ExceptionBlock(
+                [get_global(space, w_mod, i) for i in indexes]))
+        arglist = [ast.Var(name, None, srcpos=(0, 0))
+                   for name in self.argnames]
+        return Bytecode(w_mod.name, source, self.varnames, w_mod,
+                        self.constants, self.code, arglist, exception_blocks,
+                        self.lnotab, self.inlined)
+
+
+class ModuleSource(object):
+    """ The source of a module loaded from its .qc file, parsed only when
+    a function the cache has no bytecode for is first called
+    """
+    def __init__(self, parser, lexer, filename, source):
+        self.parser = parser
+        self.lexer = lexer
+        self.filename = filename
+        self.source = source
+        self.program = None
+        self.compiled = False  # a function was compiled, see write_caches
+
+    def find_function(self, name, position):
+        if self.program is None:
+            self.program = self.parser.parse(
+                self.lexer.tokenize(self.filename, self.source),
+                ParsingState(self.filename, self.source))
+        func = find_function(self.program.get_element_list(), name, position)
+        if func is None:
+            assert position >= 0  # see read_elements
+            e = FunctionNotInSource(name, position)
+            e.filename = self.filename
+            e.source = self.source
+            raise e
+        return func
+
+
+def find_function(elements, name, position):
+    for item in elements:
+        if isinstance(item, ast.Function):
+            if item.name == name and item.getstartidx() == position:
+                return item
+        elif isinstance(item, ast.ClassDefinition):
+            func = find_function(item.get_element_list(), name, position)
+            if func is not None:
+                return func
+    return None
+
+
+class ReparsedBytecode(LazyBytecode):
+    """ The LazyBytecode of a function that its module's .qc file has no
+    bytecode for, which finds the function's AST in the parsed source
+    """
+    def __init__(self, module_source, name, position, w_mod, opt_level):
+        LazyBytecode.__init__(self, None, module_source.source, w_mod, [], 0,
+                              opt_level)
+        self.module_source = module_source
+        self.name = name
+        self.position = position
+
+    def compile(self, space):
+        if self.ast is None:
+            func = self.module_source.find_function(self.name, self.position)
+            self.ast = func
+            self.arglist = func.arglist
+            self.startlineno = func.lineno
+        bytecode = LazyBytecode.compile(self, space)
+        self.module_source.compiled = True
+        return bytecode
+
+
+class CachedFunction(ast.AstNode):
+    """ code is None for a function that was not compiled when the cache
+    was written, which is at position in module_source
+    """
+    def __init__(self, name, code, position=-1, module_source=None):
+        ast.AstNode.__init__(self, (0, 0))
+        self.name = name
+        self.code = code
+        self.position = position
+        self.module_source = module_source
+
+    def add_name(self, mapping):
+        if self.name in mapping:
+            raise ast.NameAlreadyDefined(self.name)
+        mapping[self.name] = len(mapping)
+
+    def add_global_symbols(self, space, globals_w, source, w_mod):
+        if self.code is not None:
+            w_g = W_Function(self.name, self.code.build(space, w_mod, source))
+        else:
+            lazy_bytecode = ReparsedBytecode(self.module_source, self.name,
+                                             self.position, w_mod,
+                                             space.opt_level)
+            if space.eager_compile:
+                w_g = W_Function(self.name, lazy_bytecode.compile(space))
+            else:
+                w_g = W_Function(self.name, None, lazy_bytecode)
+        globals_w.append(w_g)
+
+
+class CachedClass(ast.AstNode):
+    def __init__(self, name, parent, force_names, elements):
+        ast.AstNode.__init__(self, (0, 0))
+        self.name = name
+        self.parent = parent
+        self.force_names = force_names
+        self.elements = elements
+
+    def add_name(self, mapping):
+        if self.name in mapping:
+            raise ast.NameAlreadyDefined(self.name)
+        mapping[self.name] = len(mapping)
+
+    def get_element_list(self):
+        return self.elements
+
+    def add_global_symbols(self, space, globals_w, source, w_mod):
+        t = compile_class(space, source, self, w_mod, self.parent)
+        alloc, class_elements_w, w_parent, default_alloc = t
+        w_g = W_UserType(alloc, self.name, class_elements_w, w_parent,
+                         default_alloc, self.force_names)
+        globals_w.append(w_g)
+
+
+def check_global_index(space, index, num_globals):
+    if index < 0:
+        if -1 - index >= len(space.builtins_w):
+            raise CacheError
+    elif index >= num_globals:
+        raise CacheError
+
+
+def check_code(space, code, num_globals):
+    """ Check that the instructions of a CachedCode decode, that their
+    arguments are in range of its tables, the module globals and the
+    builtins and that they keep the stack balanced, so a corrupt cache is rejected here instead of
+    failing when the Bytecode is built or run
+    """
+    bc = code.code
+    if (len(code.lnotab) != len(bc) or
+            len(code.argnames) > len(code.varnames)):
+        raise CacheError
+    for indexes in code.exc_indexes:
+        for index in indexes:
+            check_global_index(space, index, num_globals)
+    starts = {}
+    i = 0
+    while i < len(bc):
+        op = ord(bc[i])
+        if op >= len(opcodes.opcodes) or op == opcodes.INVALID:
+            raise CacheError
+        opcode = opcodes.opcodes[op]
+        if opcode.generic is not None:
+            # quickened opcodes only exist in Bytecode.quick_ops
+            raise CacheError
+        starts[i] = None
+        end = i + 1 + 2 * opcode.numargs
+        if end > len(bc):
+            raise CacheError
+        i = end
+    for i in starts:
+        op = ord(bc[i])
+        numargs = opcodes.opcodes[op].numargs
+        args = [(ord(bc[i + 1 + 2 * j]) << 8) + ord(bc[i + 2 + 2 * j])
+                for j in range(numargs)]
+        no = jump_arg(op)
+        if no != -1 and args[no] not in starts:
+            raise CacheError
+        if uses_constant(op):
+            if args[0] >= len(code.constants):
+                raise CacheError
+            if (op != opcodes.LOAD_CONSTANT and
+                    not isinstance(code.constants[args[0]], StringConstant)):
+                raise CacheError
+        elif op == opcodes.LOAD_VARIABLE or op == opcodes.STORE:
+            if args[0] >= len(code.varnames):
+                raise CacheError
+        elif op == opcodes.LOAD_GLOBAL:
+            if args[0] >= num_globals:
+                raise CacheError
+        elif op == opcodes.LOAD_BUILTIN:
+            if args[0] >= len(space.builtins_w):
+                raise CacheError
+        elif op == opcodes.COMPARE_EXCEPTION:
+            if args[0] >= len(code.exc_indexes):
+                raise CacheError
+    try:
+        Bytecode.compute_stack_depth(bc)
+    except InvalidStackDepth:
+        raise CacheError
+
+
+def read_bytecode(reader):
+    varnames = reader.read_int_list()
+    constants = []
+    for i in range(reader.read_int()):
+        tag = reader.read_tag()
+        if tag == CONST_INT:
+            constants.append(IntegerConstant(reader.read_int()))
+        elif tag == CONST_STR:
+            constants.append(StringConstant(reader.read_str()))
+        else:
+            raise CacheError
+    code = reader.read_str()
+    argnames = reader.read_str_list()
+    exc_indexes = []
+    for i in range(reader.read_int()):
+        exc_indexes.append(reader.read_int_list())
+    lnotab = reader.read_int_list()
+    inlined = []
+    for i in range(reader.read_int()):
+        name = reader.read_str()
+        positions = reader.read_int_list()
+        if len(positions) != 3:
+            raise CacheError
+        inlined.append(InlinedCall(name, positions[0], positions[1],
+                                   positions[2]))
+    return CachedCode(varnames, constants, code, argnames, exc_indexes,
+                      lnotab, inlined)
+
+
+def read_elements(reader, module_source):
+    elements = []
+    for i in range(reader.read_int()):
+        tag = reader.read_tag()
+        if tag == ELEM_FUNCTION:
+            name = reader.read_str()
+            elements.append(CachedFunction(name, read_bytecode(reader)))
+        elif tag == ELEM_LAZY_FUNCTION:
+            name = reader.read_str()
+            position = reader.read_int()
+            if position < 0:
+                raise CacheError
+            elements.append(CachedFunction(name, None, position,
+                                           module_source))
+        elif tag == ELEM_CLASS:
+            name = reader.read_str()
+            parent = reader.read_str()
+            if not parent:
+                parent = None
+            force_names = reader.read_optional_str_list()
+            elements.append(CachedClass(name, parent, force_names,
+                                        read_elements(reader, module_source)))
+        elif tag == ELEM_IMPORT:
+            import_part = reader.read_str_list()
+            names = reader.read_optional_str_list()
+            elements.append(ast.Import(import_part, names, srcpos=(0, 0)))
+        else:
+            raise CacheError
+    return elements
+
+
+def check_elements(space, elements, num_globals):
+    for element in elements:
+        if isinstance(element, CachedFunction):
+            if element.code is not None:
+                check_code(space, element.code, num_globals)
+        elif isinstance(element, CachedClass):
+            check_elements(space, element.elements, num_globals)
+
+
+def load_module(space, data, module_source, mtime):
+    """ Returns the program stored in the cache data, which can be compiled
+    with compile_module, or None if the cache is stale
+    """
+    reader = Reader(data)
+    try:
+        check_header(reader, space, module_source.source, mtime)
+        elements = read_elements(reader, module_source)
+        if not reader.at_end():
+            raise CacheError
+        names = {}
+        for element in elements:
+            element.add_name(names)
+        check_elements(space, elements, len(names))
+    except (CacheError, ast.NameAlreadyDefined):
+        return None
+    return ast.Program(elements, srcpos=(0, 0))
+
+
+def read_cache(space, filename, module_source, mtime):
+    try:
+        data = open(cache_path(filename)).read()
+    except (OSError, IOError):
+        return None
+    return load_module(space, data, module_source, mtime)
+
+
+def write_cache(space, filename, source, mtime, program, w_mod):
+    """ Write the cache, going through a temporary file so a concurrent
+    reader never sees a partial one. Failing to write is not an error
+    """
+    try:
+        data = dump_module(space, source, mtime, program, w_mod)
+    except CacheError:
+        return
+    path = cache_path(filename)
+    tmp = path + ".%d.tmp" % os.getpid()
+    try:
+        f = open(tmp, "w")
+        try:
+            f.write(data)
+        finally:
+            f.close()
+        os.rename(tmp, path)
+    except (OSError, IOError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+class PendingCache(object):
+    """ A module whose .qc file is written once the program ran, see
+    write_caches. module_source is None if the module was parsed
+    """
+    def __init__(self, filename, source, mtime, program, w_mod,
+                 module_source):
+        self.filename = filename
+        self.source = source
+        self.mtime = mtime
+        self.program = program
+        self.w_mod = w_mod
+        self.module_source = module_source
+
+
+def write_caches(space, importer):
+    """ Write the .qc files of the modules the importer compiled, once the
+    program ran, so they hold the bytecode of every function compiled by
+    then and functions that were never called, including any with errors,
+    stay uncompiled. A module loaded from its .qc file is only written again
+    if functions were compiled from its source
+    """
+    for pending in importer.pending_caches:
+        if (pending.module_source is None or
+                pending.module_source.compiled):
+            write_cache(space, pending.filename, pending.source,
+                        pending.mtime, pending.program, pending.w_mod)
+    importer.pending_caches = []
+
+
+class ProgramCache(object):
+    """ Programs kept in memory by a long running process, so a module is
+    parsed or read from its .qc file only once as long as its source does
+    not change. Every compile_module of the program still creates a fresh
+    module
+    """
+    def __init__(self):
+        self.sources = {}
+        self.programs = {}
+
+    def get(self, filename, source):
+        if self.sources.get(filename, None) != source:
+            return None
+        return self.programs[filename]
+
+    def put(self, filename, source, program):
+        self.sources[filename] = source
+        self.programs[filename] = program
+
+
+def compile_file(space, parser, lexer, importer, filename, dotted_name,
+                 source):
+    """ Compile the module in filename, from the importer's ProgramCache or
+    the .qc file if they are up to date. Otherwise parse the source. The
+    .qc file is written by write_caches once the program ran
+    """
+    programs = importer.programs
+    if programs is not None:
+        program = programs.get(filename, source)
+        if program is not None:
+            return compile_module(space, filename, dotted_name, source,
+                                  program, importer)
+    mtime = -1
+    if space.bytecode_cache:
+        mtime = source_mtime(filename)
+        module_source = ModuleSource(parser, lexer, filename, source)
+        program = read_cache(space, filename, module_source, mtime)
+        if program is not None:
+            if programs is not None:
+                programs.put(filename, source, program)
+            w_mod = compile_module(space, filename, dotted_name, source,
+                                   program, importer)
+            importer.pending_caches.append(PendingCache(
+                filename, source, mtime, program, w_mod, module_source))
+            return w_mod
+    program = parser.parse(lexer.tokenize(filename, source),
+                           ParsingState(filename, source))
+    if programs is not None:
+        programs.put(filename, source, program)
+    w_mod = compile_module(space, filename, dotted_name, source, program,
+                           importer)
+    if space.bytecode_cache and mtime >= 0:
+        importer.pending_caches.append(PendingCache(
+            filename, source, mtime, program, w_mod, None))
+    return w_mod
@@ -3,62 +3,216 @@ details about bytecodes
 """
 
 from nolang import opcodes
+from nolang.constants import IntegerConstant, StringConstant
+from nolang.function import W_Function
+from nolang.inlinecache import AttrCache
+from nolang.optimizer import optimize, call_search_step, CALL_FOUND
 
 from rpython.rlib.rstring import StringBuilder
 
 
-class BaseConstant(object):
-    pass
-
-
-class IntegerConstant(BaseConstant):
-    def __init__(self, v):
-        self._intval = v
-
-    def wrap(self, space):
-        return space.newint(self._intval)
-
-
-class StringConstant(BaseConstant):
-    def __init__(self, v):
-        self._strval = v
-
-    def wrap(self, space):
-        return space.newtext(self._strval)
+JUMP_OPS = [opcodes.JUMP_IF_FALSE, opcodes.JUMP_IF_TRUE,
+            opcodes.JUMP_IF_TRUE_NOPOP, opcodes.JUMP_IF_FALSE_NOPOP,
+            opcodes.JUMP_ABSOLUTE, opcodes.PUSH_RESUME_STACK]
 
 
 class InvalidStackDepth(Exception):
     pass
 
 
-class UnknownGlobalName(Exception):
+class NameAlreadyDefined(Exception):
     def __init__(self, name):
         self.name = name
 
+
+class CompilerError(Exception):
+    """ An error in the program found while compiling a function, which
+    happens on its first call unless the module was compiled eagerly.
+    index is the position in the source, filename and source are filled
+    in by compile_bytecode
+    """
+    filename = None
+    source = None
+
+    def __init__(self, name, index=0):
+        self.name = name
+        self.index = index
+
+    def get_message(self):
+        raise NotImplementedError("abstract base class")
+
+    def get_lineno(self):
+        if self.source is None:
+            return 0
+        end = self.index
+        if end > len(self.source):
+            end = len(self.source)
+        assert end >= 0
+        return self.source.count("\n", 0, end) + 1
+
+    def get_line(self):
+        if self.source is None:
+            return ""
+        start = self.source.rfind("\n", 0, self.index) + 1
+        end = self.source.find("\n", self.index)
+        if end < 0:
+            end = len(self.source)
+        assert start >= 0
+        return self.source[start:end]
+
+
+class UnknownGlobalName(CompilerError):
+    def get_message(self):
+        return "unknown exception class %s" % self.name
+
     def __str__(self):
         return "<UnknownGlobalName %s>" % self.name
 
 
 class Bytecode(object):
+    _immutable_fields_ = ['filename', 'source', 'varnames[*]', 'module',
+                          'constants[*]', 'bytecode', 'code_ops[*]',
+                          'code_arg0[*]', 'code_arg1[*]', 'code_next[*]',
+                          'attr_caches[*]',
+                          'stack_depth', 'resume_stack_depth', 'arglist[*]',
+                          'exception_blocks[*]', 'lnotab[*]', 'inlined[*]']
+
     def __init__(self, filename, source, varnames, module, constants, bytecode,
-                 arglist, exception_blocks, lnotab):
+                 arglist, exception_blocks, lnotab, inlined):
         self.filename = filename
         self.source = source
-        self.varnames = varnames
+        self.varnames = varnames[:]
         self.module = module
         self._constants = constants
         self.constants = None
         self.bytecode = bytecode
+        self.decode(bytecode)
         r = self.compute_stack_depth(bytecode)
         self.stack_depth, self.resume_stack_depth = r
-        self.arglist = arglist
-        self.exception_blocks = exception_blocks
-        self.lnotab = lnotab
+        self.arglist = arglist[:]
+        self.exception_blocks = exception_blocks[:]
+        self.lnotab = lnotab[:]
+        self.inlined = inlined[:]
+
+    def decode(self, bc):
+        """ Unpack the encoded instructions into parallel arrays indexed by
+        the instruction position, so the interpreter does not have to
+        rebuild the arguments from bytes on every dispatch. The encoded
+        string is kept for repr() and serialization only.
+
+        GETATTR, SETATTR and LOAD_METHOD have a single argument, their
+        code_arg1 is the index of the instruction's inline cache in
+        attr_caches.
+        """
+        lgt = len(bc)
+        self.code_ops = [0] * lgt
+        self.code_arg0 = [0] * lgt
+        self.code_arg1 = [0] * lgt
+        self.code_next = [0] * lgt
+        attr_caches = []
+        i = 0
+        while i < lgt:
+            op = ord(bc[i])
+            numargs = opcodes.opcodes[op].numargs
+            self.code_ops[i] = op
+            if numargs >= 1:
+                self.code_arg0[i] = (ord(bc[i + 1]) << 8) + ord(bc[i + 2])
+            if numargs >= 2:
+                self.code_arg1[i] = (ord(bc[i + 3]) << 8) + ord(bc[i + 4])
+            if (op == opcodes.GETATTR or op == opcodes.SETATTR or
+                    op == opcodes.LOAD_METHOD):
+                const = self._constants[self.code_arg0[i]]
+                assert isinstance(const, StringConstant)
+                self.code_arg1[i] = len(attr_caches)
+                attr_caches.append(AttrCache(const._strval, i))
+            self.code_next[i] = i + 1 + 2 * numargs
+            i = self.code_next[i]
+        self.attr_caches = attr_caches[:]
+        # rewritten by the interpreter, see Interpreter.quicken, and by
+        # link, which also rewrites quick_arg0
+        self.quick_ops = self.code_ops[:]
+        self.quick_arg0 = self.code_arg0[:]
 
     def setup(self, space):
-        self.constants = [None] * len(self._constants)
+        if self.constants is not None:
+            return
+        pool = self.module.constant_pool
+        constants = [None] * len(self._constants)
         for i, constant in enumerate(self._constants):
-            self.constants[i] = constant.wrap(space)
+            constants[i] = constant.wrap(space, pool)
+        if self.module.linked:
+            constants = constants + self.link(len(constants))
+        self.constants = constants
+
+    def link(self, num_constants):
+        """ Module globals never change once the module is linked, see
+        compiler.link_module, so LOAD_GLOBAL becomes LOAD_CONSTANT of the
+        global and a CALL of a global function becomes CALL_FUNCTION in
+        quick_ops. Only quick_ops and quick_arg0 change, code_ops and
+        code_arg0 keep LOAD_GLOBAL for the JIT, which must not see immutable
+        arrays change. Returns the globals to add to the constants
+        """
+        globals_w = self.module.functions
+        linked_w = []
+        linked = {}
+        jump_targets = self.jump_targets()
+        i = 0
+        while i < len(self.code_ops):
+            if self.code_ops[i] == opcodes.LOAD_GLOBAL:
+                no = self.code_arg0[i]
+                w_global = globals_w[no]
+                if w_global is not None:
+                    try:
+                        const = linked[no]
+                    except KeyError:
+                        const = num_constants + len(linked_w)
+                        linked_w.append(w_global)
+                        linked[no] = const
+                    self.quick_ops[i] = opcodes.LOAD_CONSTANT
+                    self.quick_arg0[i] = const
+                    if isinstance(w_global, W_Function):
+                        call = self.find_call(i, jump_targets)
+                        if call >= 0:
+                            self.quick_ops[call] = opcodes.CALL_FUNCTION
+            i = self.code_next[i]
+        return linked_w
+
+    def jump_targets(self):
+        targets = {}
+        i = 0
+        while i < len(self.code_ops):
+            if self.code_ops[i] in JUMP_OPS:
+                targets[self.code_arg0[i]] = None
+            elif self.code_ops[i] == opcodes.COMPARE_EXCEPTION:
+                targets[self.code_arg1[i]] = None
+            i = self.code_next[i]
+        return targets
+
+    def find_call(self, index, jump_targets):
+        """ Returns the index of the CALL that calls what the instruction at
+        index pushes, -1 if it's not a straight line of code away
+        """
+        depth = 1  # values on the stack from the callable up
+        i = self.code_next[index]
+        while i < len(self.code_ops):
+            if i in jump_targets:
+                return -1
+            depth = call_search_step(self.code_ops[i], self.code_arg0[i],
+                                     depth)
+            if depth == CALL_FOUND:
+                return i
+            if depth < 0:
+                return -1
+            i = self.code_next[i]
+        return -1
+
+    def find_inlined(self, position):
+        """ The InlinedCall whose code is at position, or None
+        """
+        for inlined in self.inlined:
+            if inlined.start <= position < inlined.end:
+                return inlined
+        return None
 
     def repr(self, numbers=True):
         i = 0
@@ -102,6 +256,9 @@ class Bytecode(object):
             elif opcode.stack_effect == 254:
                 var = (ord(bc[i + 1]) << 8) + ord(bc[i + 2])
                 stack_depth -= var - 1
+            elif opcode.stack_effect == 253:
+                var = (ord(bc[i + 1]) << 8) + ord(bc[i + 2])
+                stack_depth -= var + 1
             else:
                 stack_depth += opcode.stack_effect
             if ord(bc[i]) == opcodes.PUSH_RESUME_STACK:
@@ -123,17 +280,19 @@ class Bytecode(object):
         return max_stack_depth, max_resume_stack_depth
 
 
-class UndeclaredVariable(Exception):
-    def __init__(self, name):
-        self.name = name
+class UndeclaredVariable(CompilerError):
+    def get_message(self):
+        return "undeclared variable %s" % self.name
 
     def __str__(self):
         return '<UndeclaredVariable %s>' % self.name
 
 
 class ExceptionBlock(object):
+    _immutable_fields_ = ['types_w[*]']
+
     def __init__(self, types_w):
-        self.types_w = types_w
+        self.types_w = types_w[:]
         self.position = 0
 
     def match(self, space, w_exception):
@@ -144,17 +303,21 @@ class ExceptionBlock(object):
 
 
 class _BytecodeBuilder(object):
-    def __init__(self, w_mod, arglist):
+    def __init__(self, space, w_mod, arglist):
+        self.space = space
         self.vars = {}
         self.varnames = []
         self.builder = []
-        self.constants = []  # XXX implement interning of integers, strings etc.
+        self.constants = []
+        self.int_constants = {}
+        self.str_constants = {}
         self.exception_blocks = []
         self.w_mod = w_mod
         for var in arglist:
             self.register_variable(var.name, var.tp)
         self.arglist = arglist
         self.lnotab = []
+        self.inlined = []
         self.accumulator = []
 
     def add_constant(self, const):
@@ -163,12 +326,22 @@ class _BytecodeBuilder(object):
         return no
 
     def add_int_constant(self, v):
-        return self.add_constant(IntegerConstant(v))
+        try:
+            return self.int_constants[v]
+        except KeyError:
+            no = self.add_constant(IntegerConstant(v))
+            self.int_constants[v] = no
+            return no
 
     def add_str_constant(self, v):
-        return self.add_constant(StringConstant(v))
+        try:
+            return self.str_constants[v]
+        except KeyError:
+            no = self.add_constant(StringConstant(v))
+            self.str_constants[v] = no
+            return no
 
-    def get_variable(self, name):
+    def get_variable(self, name, index=0):
         try:
             return opcodes.LOAD_VARIABLE, self.vars[name]
         except KeyError:
@@ -177,7 +350,11 @@ class _BytecodeBuilder(object):
             return opcodes.LOAD_GLOBAL, self.w_mod.name2index[name]
         except KeyError:
             pass
-        raise UndeclaredVariable(name)
+        try:
+            return opcodes.LOAD_BUILTIN, self.space.builtin_index[name]
+        except KeyError:
+            pass
+        raise UndeclaredVariable(name, index)
 
     def register_variable(self, v, tp):
         no = len(self.vars)
@@ -186,14 +363,40 @@ class _BytecodeBuilder(object):
         assert len(self.vars) == len(self.varnames)
         return no
 
-    def register_exception_setup(self, exc_names):
+    def get_inline_callee(self, no):
+        """ The function at index no of the module globals if calls of it
+        may be inlined, compiling it if needed, or None. Once the module is
+        linked its globals never change, and only functions of the module
+        itself are inlined, so their lnotab refers to the same source
+        """
+        if not self.w_mod.linked:
+            return None
+        w_func = self.w_mod.functions[no]
+        if not isinstance(w_func, W_Function):
+            return None
+        lazy_bytecode = w_func.lazy_bytecode
+        if lazy_bytecode is not None and lazy_bytecode.compiling:
+            return None  # recursion
+        try:
+            bytecode = w_func.get_bytecode(self.space)
+        except CompilerError:
+            return None  # reported when it's called
+        if bytecode.module is not self.w_mod:
+            return None
+        return w_func
+
+    def register_exception_setup(self, exc_names, index=0):
         types_w = []
         for name in exc_names:
             try:
                 no = self.w_mod.name2index[name]
             except KeyError:
-                raise UnknownGlobalName(name)
-            types_w.append(self.w_mod.functions[no])
+                try:
+                    types_w.append(self.space.builtin_dict[name])
+                except KeyError:
+                    raise UnknownGlobalName(name, index)
+            else:
+                types_w.append(self.w_mod.functions[no])
         self.exception_blocks.append(ExceptionBlock(types_w))
         return len(self.exception_blocks) - 1
 
@@ -239,15 +442,49 @@ class _BytecodeBuilder(object):
         return Bytecode(filename, source, self.varnames, self.w_mod,
                         self.constants,
                         "".join(self.builder), self.arglist,
-                        self.exception_blocks, self._packlnotab(self.lnotab))
+                        self.exception_blocks, self._packlnotab(self.lnotab),
+                        self.inlined)
 
 
-def compile_bytecode(ast, source, w_mod, arglist=[], startlineno=0):
-    """ Compile the bytecode from produced AST.
+def compile_bytecode(space, ast, source, w_mod, arglist=[], startlineno=0,
+                     opt_level=0):
+    """ Compile the bytecode from produced AST. With opt_level > 0 the
+    peephole optimizer is run over the result, with opt_level > 1 small
+    functions are inlined too, see optimizer.py
     """
-    builder = _BytecodeBuilder(w_mod, arglist[:])
-    ast.compile(builder)
+    builder = _BytecodeBuilder(space, w_mod, arglist[:])
+    try:
+        ast.compile(builder)
+    except CompilerError as e:
+        e.filename = w_mod.name
+        e.source = source
+        raise
     # hack to enable building for now
     builder.emit(ast.getendidx(), opcodes.LOAD_NONE)
     builder.emit(ast.getendidx(), opcodes.RETURN)
+    if opt_level > 0:
+        optimize(builder, inline=opt_level > 1)
     return builder.build(w_mod.name, source)
+
+
+class LazyBytecode(object):
+    """ Everything compile_bytecode needs for a function that is only
+    compiled when it's first called, see W_Function.get_bytecode
+    """
+    def __init__(self, ast, source, w_mod, arglist, startlineno, opt_level):
+        self.ast = ast
+        self.source = source
+        self.w_mod = w_mod
+        self.arglist = arglist
+        self.startlineno = startlineno
+        self.opt_level = opt_level
+        self.compiling = False
+
+    def compile(self, space):
+        self.compiling = True
+        try:
+            return compile_bytecode(space, self.ast, self.source, self.w_mod,
+                                    self.arglist, self.startlineno,
+                                    opt_level=self.opt_level)
+        finally:
+            self.compiling = False
@@ -1,6 +1,7 @@
 """ Main module compiler
 """
 
+from nolang.bytecode import NameAlreadyDefined
 from nolang.module import W_Module
 from nolang.objects.userobject import W_UserObject
 from nolang.builtins.spec import wrap_function
@@ -8,30 +9,38 @@ from nolang.builtins.spec import wrap_function
 from rpython.rlib.objectmodel import specialize
 
 
-def _gather_names(ast, builtins):
+def _gather_names(ast, builtin_index):
     name_mapping = {}
-    if builtins is not None:
-        for item in builtins:
-            name_mapping[item.name] = len(name_mapping)
     for item in ast.get_element_list():
         item.add_name(name_mapping)
+    for name in name_mapping:
+        if name in builtin_index:
+            raise NameAlreadyDefined(name)
     return name_mapping
 
 
 def compile_module(space, filename, dotted_name, source, ast, importer):
-    name_mapping = _gather_names(ast, space.builtins_w)
-    if space.builtins_w is not None:
-        globals_w = space.builtins_w[:]
-    else:
-        globals_w = []
+    """ The module globals only hold what the module defines and imports,
+    builtins are shared by all modules, see Space.builtins_w
+    """
+    name_mapping = _gather_names(ast, space.builtin_index)
+    globals_w = []
     w_mod = W_Module(filename, name_mapping, globals_w)
     for item in ast.get_element_list():
         item.add_global_symbols(space, globals_w, source, w_mod)
     importer.register_module(space, dotted_name, w_mod)
     importer.add_missing_imports(space, ast, w_mod, globals_w)
+    link_module(space, w_mod)
     return w_mod
 
 
+def link_module(space, w_mod):
+    """ With the imports in place the module globals are final, bytecode
+    set up from now on loads them as constants, see Bytecode.link
+    """
+    w_mod.linked = True
+
+
 def new_user_object(space, args_w):
     return W_UserObject(args_w[0])
 
@@ -43,7 +52,10 @@ def get_alloc(space):
 
 def compile_class(space, source, ast, w_mod, parent=None):
     if parent is not None:
-        w_parent = w_mod.functions[w_mod.name2index[parent]]
+        try:
+            w_parent = w_mod.functions[w_mod.name2index[parent]]
+        except KeyError:
+            w_parent = space.builtin_dict[parent]
     else:
         w_parent = None
     if w_parent is not None:
@@ -0,0 +1,48 @@
+""" Compile-time constants stored in bytecode and wrapped into app-level
+objects when the bytecode is set up
+"""
+
+
+class BaseConstant(object):
+    pass
+
+
+class IntegerConstant(BaseConstant):
+    def __init__(self, v):
+        self._intval = v
+
+    def wrap(self, space, pool):
+        return pool.wrap_int(space, self._intval)
+
+
+class StringConstant(BaseConstant):
+    def __init__(self, v):
+        self._strval = v
+
+    def wrap(self, space, pool):
+        return pool.wrap_str(space, self._strval)
+
+
+class ConstantPool(object):
+    """ Wrapped immutable constants shared by all the bytecode in a module,
+    so equal literals and attribute names are the same app-level object
+    """
+    def __init__(self):
+        self.ints_w = {}
+        self.strs_w = {}
+
+    def wrap_int(self, space, v):
+        try:
+            return self.ints_w[v]
+        except KeyError:
+            w_res = space.newint(v)
+            self.ints_w[v] = w_res
+            return w_res
+
+    def wrap_str(self, space, v):
+        try:
+            return self.strs_w[v]
+        except KeyError:
+            w_res = space.newtext(v)
+            self.strs_w[v] = w_res
+            return w_res
@@ -1,22 +1,93 @@
 """ Common errors and error handling
 """
 
+# entries kept by TracebackRing
+TRACEBACK_RING_SIZE = 1024
+
 
 class TracebackElem(object):
-    def __init__(self, frame, position, bytecode, next):
-        self.frame = frame
+    def __init__(self, name, position, bytecode, next):
+        self.name = name
         self.position = position
         self.bytecode = bytecode
         self.next = next
 
 
+class TracebackRing(object):
+    """ The positions exceptions pass through while unwinding, the name of
+    the function, its bytecode and the position in it, stored in arrays
+    allocated once and reused in a circle, so raising and catching an
+    exception allocates no traceback. An AppError refers to its entries
+    by their number and builds TracebackElems only when its traceback is
+    needed, see AppError.get_traceback
+    """
+    def __init__(self, size=TRACEBACK_RING_SIZE):
+        self.names = [None] * size
+        self.bytecodes = [None] * size
+        self.positions = [0] * size
+        self.count = 0  # entries recorded so far
+
+    def record(self, name, bytecode, position):
+        """ Returns the number of the new entry
+        """
+        i = self.count % len(self.positions)
+        self.names[i] = name
+        self.bytecodes[i] = bytecode
+        self.positions[i] = position
+        self.count += 1
+        return self.count - 1
+
+    def is_valid(self, no):
+        """ Entry no was not overwritten yet
+        """
+        return self.count - no <= len(self.positions)
+
+    def get_elem(self, no, next):
+        i = no % len(self.positions)
+        return TracebackElem(self.names[i], self.positions[i],
+                             self.bytecodes[i], next)
+
+
 class AppError(Exception):
+    """ traceback is the materialized part of the traceback, the most
+    recently recorded (outermost) entry first, and the ring entries from
+    tb_start to tb_end come on top of it
+    """
     def __init__(self, w_exception):
         self.w_exception = w_exception
         self.traceback = None
+        self.ring = None
+        self.tb_start = 0
+        self.tb_end = 0
+
+    def record_position(self, ring, name, bytecode, index):
+        if self.ring is not None and (
+                self.ring is not ring or self.tb_end != ring.count or
+                self.tb_end - self.tb_start == len(ring.positions)):
+            # the entries would not stay one run of the ring, or the new
+            # one would overwrite the first, keep those we have
+            self.materialize()
+        no = ring.record(name, bytecode, index)
+        if self.ring is None:
+            self.ring = ring
+            self.tb_start = no
+        self.tb_end = no + 1
+
+    def materialize(self):
+        """ Move the ring entries to traceback. Entries already overwritten
+        by other exceptions are gone
+        """
+        ring = self.ring
+        if ring is None:
+            return
+        for no in range(self.tb_start, self.tb_end):
+            if ring.is_valid(no):
+                self.traceback = ring.get_elem(no, self.traceback)
+        self.ring = None
 
-    def record_position(self, frame, bytecode, index):
-        self.traceback = TracebackElem(frame, index, bytecode, self.traceback)
+    def get_traceback(self):
+        self.materialize()
+        return self.traceback
 
     def match(self, space, w_expected):
         return space.issubclass(space.type(self.w_exception), w_expected)
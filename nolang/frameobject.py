@@ -2,20 +2,40 @@ from nolang.objects.root import W_Root
 
 
 class Frame(W_Root):
-    def __init__(self, bytecode, name=None):
+    """ A frame does not own its values. Locals and the operand stack are
+    a window in Interpreter.valuestack_w, locals starting at base and the
+    operand stack right after them, so arguments pushed by the caller are
+    already in place as the first locals.
+
+    Calls between bytecode functions don't recurse natively, the dispatch
+    loop continues in the callee's frame, see Interpreter.enter. back is the
+    calling frame, which keeps the position of the call and its current
+    exception in index and cur_exc until the callee returns. An entry frame
+    was called natively, by Interpreter.interpret, and returning from it
+    leaves the dispatch loop.
+    """
+    _immutable_fields_ = ['bytecode', 'stack_w', 'base',
+                          'stack_base', 'resume_stack']
+
+    def __init__(self, bytecode, name, stack_w, base, num_args):
         self.name = name
         self.bytecode = bytecode
-        if bytecode.module is not None:  # for tests
-            self.globals_w = bytecode.module.functions
-        self.locals_w = [None] * len(bytecode.varnames)
-        self.stack_w = [None] * bytecode.stack_depth
-        self.resume_stack = [0] * bytecode.resume_stack_depth
+        self.stack_w = stack_w
+        self.base = base
+        self.stack_base = base + len(bytecode.varnames)
+        self.pos = self.stack_base
+        for i in range(base + num_args, self.stack_base):
+            stack_w[i] = None
+        if bytecode.resume_stack_depth:
+            self.resume_stack = [0] * bytecode.resume_stack_depth
+        else:
+            self.resume_stack = NO_RESUME_STACK
         self.resume_stack_depth = 0
-        self.pos = 0
-
-    def populate_args(self, args_w):
-        for i in range(len(args_w)):
-            self.locals_w[i] = args_w[i]
+        self.back = None
+        self.entry = False
+        self.depth = 0
+        self.index = 0
+        self.cur_exc = None
 
     def push(self, w_val):
         self.stack_w[self.pos] = w_val
@@ -23,23 +43,42 @@ class Frame(W_Root):
 
     def pop(self):
         new_pos = self.pos - 1
-        w_res = self.stack_w[new_pos]
         assert new_pos >= 0
+        w_res = self.stack_w[new_pos]
         self.pos = new_pos
         return w_res
 
     def peek(self):
         return self.stack_w[self.pos - 1]
 
+    def clear_stack(self):
+        self.pos = self.stack_base
+
+    def clear(self):
+        """ Drop what the frame's window of the value stack refers to, its
+        locals and whatever its operand stack held, once the frame is done,
+        so the values do not outlive it
+        """
+        for i in range(self.base, self.stack_base + self.bytecode.stack_depth):
+            self.stack_w[i] = None
+
+    def load_var(self, index):
+        return self.stack_w[self.base + index]
+
     def store_var(self, index):
-        self.locals_w[index] = self.pop()
+        self.stack_w[self.base + index] = self.pop()
+
+
+NO_RESUME_STACK = []
 
 
 def find_line(bytecode, target_pc):
-    src = bytecode.source
+    return find_source_line(bytecode.source, bytecode.lnotab[target_pc])
+
+
+def find_source_line(src, target_position):
     pos = 0
     lineno = 0
-    target_position = bytecode.lnotab[target_pc]
     prev_pos = 0
     while pos < target_position:
         prev_pos = pos
@@ -50,24 +89,32 @@ def find_line(bytecode, target_pc):
     return src[prev_pos + 1:pos], lineno
 
 
+def format_entry(lines, bytecode, position, name):
+    line, lineno = find_source_line(bytecode.source, position)
+    lines.append("file \"%s\", line %d, in %s" % (bytecode.filename, lineno,
+                                                  name))
+    lines.append("  " + line.strip())
+
+
 def format_traceback(space, apperr):
     lines = []
     w_exception = apperr.w_exception
     tb_list = []
-    tb = apperr.traceback
+    tb = apperr.get_traceback()
     while tb:
         tb_list.append(tb)
         tb = tb.next
 
     for i in range(len(tb_list) - 1, -1, -1):
         tb = tb_list[i]
-        line, lineno = find_line(tb.bytecode, tb.position)
-        lines.append("file \"%s\", line %d, in %s" % (
-            tb.bytecode.filename,
-            lineno,
-            tb.frame.name or '<unknown>',
-        ))
-        lines.append("  " + line.strip())
+        name = tb.name or '<unknown>'
+        position = tb.bytecode.lnotab[tb.position]
+        inlined = tb.bytecode.find_inlined(tb.position)
+        if inlined is not None:
+            # the frame the inlined function would have had
+            format_entry(lines, tb.bytecode, position, inlined.name)
+            position = inlined.srcpos
+        format_entry(lines, tb.bytecode, position, name)
     lines.append("%s: %s" % (space.type(w_exception).name, w_exception.message))
     lines.append("")
     return "\n".join(lines)
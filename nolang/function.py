@@ -6,28 +6,73 @@ from nolang.frameobject import Frame
 
 
 class W_Function(W_Root):
-    def __init__(self, name, bytecode):
+    """ A function is either created with its bytecode or with a
+    LazyBytecode that compiles it on the first call
+    """
+    _immutable_fields_ = ['bytecode?']
+    binds_receiver = True
+
+    def __init__(self, name, bytecode, lazy_bytecode=None):
         self.name = name
         self.bytecode = bytecode
+        self.lazy_bytecode = lazy_bytecode
 
     def setup(self, space):
-        self.bytecode.setup(space)
+        if self.bytecode is not None:
+            self.bytecode.setup(space)
+
+    def get_bytecode(self, space):
+        bytecode = self.bytecode
+        if bytecode is None:
+            bytecode = self.lazy_bytecode.compile(space)
+            bytecode.setup(space)
+            self.bytecode = bytecode
+            self.lazy_bytecode = None
+        return bytecode
 
     def call(self, space, interpreter, args_w):
-        frame = Frame(self.bytecode, self.name)
-        exp = len(self.bytecode.arglist)
-        if exp != len(args_w):
+        base = interpreter.stack_top()
+        self.check_call(space, interpreter, base, len(args_w))
+        stack_w = interpreter.valuestack_w
+        for i in range(len(args_w)):
+            stack_w[base + i] = args_w[i]
+        return self.call_in_place(space, interpreter, base, len(args_w))
+
+    def call_in_place(self, space, interpreter, base, num_args):
+        """ Call with the arguments already on the interpreter's value
+        stack, starting at base
+        """
+        frame = self.make_frame(space, interpreter, base, num_args)
+        return interpreter.interpret(space, frame.bytecode, frame)
+
+    def make_frame(self, space, interpreter, base, num_args):
+        """ The frame of a call with the arguments already on the
+        interpreter's value stack, starting at base
+        """
+        self.check_call(space, interpreter, base, num_args)
+        return Frame(self.bytecode, self.name, interpreter.valuestack_w,
+                     base, num_args)
+
+    def check_call(self, space, interpreter, base, num_args):
+        bytecode = self.get_bytecode(space)
+        exp = len(bytecode.arglist)
+        if exp != num_args:
             msg = "Function %s got %d arguments, expected %d" % (
-                self.name, len(args_w), exp)
+                self.name, num_args, exp)
             raise space.apperr(space.w_argerror, msg)
-        frame.populate_args(args_w)
-        return interpreter.interpret(space, self.bytecode, frame)
+        size = len(bytecode.varnames) + bytecode.stack_depth
+        if base + size > len(interpreter.valuestack_w):
+            raise space.apperr(space.w_recursionerror,
+                               "maximum recursion depth exceeded")
 
     def bind(self, space, w_obj):
         return W_BoundMethod(w_obj, self)
 
 
 class W_BuiltinFunction(W_Root):
+    _immutable_fields_ = ['num_args', 'callable']
+    binds_receiver = True
+
     def __init__(self, name, callable, num_args):
         self.name = name
         self.num_args = num_args
@@ -64,6 +109,8 @@ class W_Property(W_Root):
 
 
 class W_BoundMethod(W_Root):
+    _immutable_fields_ = ['w_self', 'w_function']
+
     def __init__(self, w_self, w_function):
         self.w_self = w_self
         self.w_function = w_function
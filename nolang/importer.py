@@ -4,22 +4,87 @@
 import os
 
 from nolang.module import create_module
-from nolang.parser import ParsingState
-from nolang.compiler import compile_module
+from nolang.bytecache import compile_file
 
 
 # XXX wrap up in AppErr
 class ImportError(Exception):
-    pass
+    def __init__(self, name):
+        self.name = name
+
+
+def parse_search_path(value):
+    """ Split a NOLANG_PATH or --path value, directories separated by colons
+    """
+    return [p for p in value.split(":") if p]
+
+
+class ModuleFinder(object):
+    """ Finds the files of self modules in the search path. Every directory
+    is listed at most once and every lookup, found or not, is done at most
+    once, so nested and missing imports cost no more filesystem probes
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.listings = {}
+        self.found = {}
+
+    def listdir(self, dirname):
+        try:
+            return self.listings[dirname]
+        except KeyError:
+            pass
+        names = {}
+        try:
+            for name in os.listdir(dirname):
+                names[name] = None
+        except OSError:
+            pass
+        self.listings[dirname] = names
+        return names
+
+    def find(self, path):
+        """ Returns the file name of the module path (a list of names) or
+        None if it's nowhere in the search path
+        """
+        key = ".".join(path)
+        try:
+            return self.found[key]
+        except KeyError:
+            pass
+        filename = self._find(path)
+        self.found[key] = filename
+        return filename
+
+    def _find(self, path):
+        last = len(path) - 1
+        assert last >= 0
+        name = path[last] + ".q"
+        for base in self.path:
+            dirname = base
+            if last > 0:
+                dirname = os.path.join(base, os.path.sep.join(path[:last]))
+            if name in self.listdir(dirname):
+                return os.path.join(dirname, name)
+        return None
 
 
 class Importer(object):
-    def __init__(self, space, basepath=None, parser=None, lexer=None):
+    def __init__(self, space, basepath=None, parser=None, lexer=None,
+                 programs=None):
         # XXX basepath is a hack
         self.basepath = basepath
         self.selfmod = create_module('self', [])
         self.parser = parser
         self.lexer = lexer
+        self.programs = programs  # a bytecache.ProgramCache or None
+        # modules to write .qc files for, see bytecache.write_caches
+        self.pending_caches = []
+        search_path = space.search_path[:]
+        if basepath is not None:
+            search_path.insert(0, basepath)
+        self.finder = ModuleFinder(search_path)
         self.cache = {'core': space.coremod, 'self': self.selfmod}
 
     def add_missing_imports(self, space, ast, w_mod, globals_w):
@@ -28,16 +93,16 @@ class Importer(object):
 
     def import_module(self, space, path):
         # XXX error handling
-        pth = os.path.join(self.basepath, os.path.sep.join(path)) + ".q"
+        pth = self.finder.find(path)
+        if pth is None:
+            raise ImportError(".".join(path))
         try:
             source = open(pth).read()
         except (IOError, OSError):
-            raise ImportError("foo")
-        ast = self.parser.parse(self.lexer.lex(pth, source),
-                                ParsingState(pth, source))
+            raise ImportError(".".join(path))
         dotted_name = ".".join(['self'] + path)
-        w_mod = compile_module(space, pth, dotted_name, source, ast, self)
-        return w_mod
+        return compile_file(space, self.parser, self.lexer, self, pth,
+                            dotted_name, source)
 
     def register_module(self, space, dotted_name, w_mod):
         parts = dotted_name.split(".")
@@ -64,7 +129,9 @@ class Importer(object):
         except KeyError:
             pass
         else:
-            return space.getattr(w_mod, imp_path[last_elem])
+            # self only has the modules imported so far
+            if imp_path[last_elem] in w_mod.name2index:
+                return space.getattr(w_mod, imp_path[last_elem])
         if imp_path[0] == 'self':
             # allow extra self imports
             try:
@@ -73,6 +140,8 @@ class Importer(object):
                 if len(imp_path) == 2:
                     raise
                 w_mod = self.import_module(space, imp_path[1:last_elem])
+                if imp_path[last_elem] not in w_mod.name2index:
+                    raise ImportError(".".join(imp_path))
                 return space.getattr(w_mod, imp_path[last_elem])
         raise ImportError(".".join(imp_path))
 
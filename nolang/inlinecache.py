@@ -0,0 +1,132 @@
+""" Inline caches for attribute access. Every GETATTR, SETATTR and
+LOAD_METHOD instruction gets its own AttrCache, created when the bytecode
+is decoded, that remembers the layout of the last receiver together with
+where the attribute was found. The caches are only consulted by the interpreter,
+the JIT relies on promoting the map and the type instead.
+"""
+
+from nolang.frameobject import find_line
+from nolang.function import W_Function
+from nolang.objects.userobject import W_UserObject
+from nolang.objects.usertype import W_UserType
+
+
+class AttrCache(object):
+    """ For user objects the cache is keyed on the map, which also
+    determines the type, and remembers the storage index of the attribute.
+    For everything else it's keyed on the type alone.
+    """
+    _immutable_fields_ = ['attrname', 'position']
+
+    def __init__(self, attrname, position):
+        self.attrname = attrname
+        self.position = position
+        self.w_type = None
+        self.map = None
+        self.index = -1
+        self.new_map = None  # the map after adding the attribute
+        self.w_value = None  # the attribute found on the type, unbound
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, space, w_obj):
+        """ Check the cache against w_obj and return the attribute if it's
+        stored on the object itself, None otherwise
+        """
+        if isinstance(w_obj, W_UserObject):
+            map = w_obj.map
+            if self.map is map:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.map = map
+                self.index = map.find(self.attrname)
+                self.w_type = w_obj.w_type
+                self.w_value = None
+            if self.index >= 0:
+                return w_obj.storage_w[self.index]
+            return None
+        w_type = space.type(w_obj)
+        if self.map is None and self.w_type is w_type:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.map = None
+            self.w_type = w_type
+            self.w_value = None
+        w_res = w_obj.getattr(space, self.attrname)
+        if w_res is space.w_NotImplemented:
+            return None
+        return w_res
+
+    def type_attr(self, space):
+        if self.w_value is None:
+            self.w_value = space.getattr(self.w_type, self.attrname)
+        return self.w_value
+
+    def getattr(self, space, w_obj):
+        w_res = self.find(space, w_obj)
+        if w_res is not None:
+            return w_res
+        return self.type_attr(space).bind(space, w_obj)
+
+    def load_method(self, space, w_obj):
+        """ Cached version of Space.load_method
+        """
+        w_res = self.find(space, w_obj)
+        if w_res is not None:
+            return w_res, None
+        w_res = self.type_attr(space)
+        if w_res.binds_receiver:
+            return w_res, w_obj
+        return w_res.bind(space, w_obj), None
+
+    def setattr(self, space, w_obj, w_value):
+        if not isinstance(w_obj, W_UserObject):
+            space.setattr(w_obj, self.attrname, w_value)
+            return
+        map = w_obj.map
+        if self.map is map:
+            self.hits += 1
+            if self.index >= 0:
+                w_obj.storage_w[self.index] = w_value
+            else:
+                w_obj.add_attribute(self.new_map, w_value)
+            return
+        self.misses += 1
+        # may raise if the type does not allow the attribute
+        w_obj.setattr(space, self.attrname, w_value)
+        self.map = map
+        self.index = map.find(self.attrname)
+        self.w_type = w_obj.w_type
+        self.w_value = None
+        if self.index < 0:
+            self.new_map = w_obj.map
+
+
+def format_cache_stats(bytecode, name):
+    """ One line per attribute access in the bytecode, with the number
+    of cache hits and misses
+    """
+    lines = []
+    if bytecode is None:  # never called, so never compiled
+        return ""
+    for cache in bytecode.attr_caches:
+        lineno = find_line(bytecode, cache.position)[1]
+        lines.append("%s:%d %s .%s hits=%d misses=%d\n" % (
+            bytecode.filename, lineno, name, cache.attrname, cache.hits,
+            cache.misses))
+    return "".join(lines)
+
+
+def format_module_cache_stats(w_mod):
+    lines = []
+    for w_elem in w_mod.functions:
+        if isinstance(w_elem, W_Function):
+            lines.append(format_cache_stats(w_elem.bytecode, w_elem.name))
+        elif isinstance(w_elem, W_UserType):
+            for w_meth in w_elem.class_elements_w:
+                if isinstance(w_meth, W_Function):
+                    name = w_elem.name + "." + w_meth.name
+                    lines.append(format_cache_stats(w_meth.bytecode, name))
+    return "".join(lines)
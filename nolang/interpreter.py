@@ -1,11 +1,15 @@
 """ This is the main interpreter file that contains bytecode
 dispatch loop.
 """
+from rpython.rlib import jit
 from rpython.rlib.rstring import StringBuilder
 
 from nolang import opcodes
-from nolang.error import AppError
+from nolang.error import AppError, TracebackRing
 from nolang.builtins.exception import W_Exception
+from nolang.function import W_Function
+from nolang.objects.int import W_IntObject, int_add, int_sub, int_mul
+from nolang.objects.unicode import W_StrObject
 
 
 class InvalidOpcode(Exception):
@@ -23,33 +27,95 @@ class UninitializedVariable(Exception):
     pass  # XXX add logic to present the error
 
 
+def get_printable_location(index, bytecode):
+    op = bytecode.code_ops[index]
+    return "%s:%d %s" % (bytecode.filename, index, opcodes.opcodes[op].name)
+
+
+driver = jit.JitDriver(greens=['index', 'bytecode'],
+                       reds=['cur_exc', 'frame', 'space', 'self'],
+                       get_printable_location=get_printable_location,
+                       is_recursive=True)
+
+
+# number of slots in the value stack, shared by all the frames
+VALUE_STACK_SIZE = 256 * 1024
+
+
 class Interpreter(object):
-    def __init__(self):
+    def __init__(self, stack_size=VALUE_STACK_SIZE):
         self.topframeref = None
+        self.valuestack_w = [None] * stack_size
+        self.traceback_ring = TracebackRing()
+
+    def stack_top(self):
+        """ First free slot of the value stack
+        """
+        if self.topframeref is None:
+            return 0
+        return self.topframeref.pos
 
     def interpret(self, space, bytecode, frame):
+        """ Run frame called natively, as an entry frame of the dispatch loop
+        """
         back = self.topframeref
+        if back is not None:
+            self.check_depth(space, back)
+            frame.depth = back.depth + 1
+        frame.back = back
+        frame.entry = True
         try:
             self.topframeref = frame
             return self._interpret(space, bytecode, frame)
         finally:
+            frame.clear()
             self.topframeref = back
 
+    def check_depth(self, space, frame):
+        if frame.depth >= space.recursion_limit:
+            raise space.apperr(space.w_recursionerror,
+                               "maximum recursion depth exceeded")
+
+    def enter(self, space, frame, index, cur_exc, w_func, base, num_args,
+              result_pos):
+        """ Returns the frame of a call of w_func from frame at index, for
+        the dispatch loop to continue in. The result goes to result_pos of
+        the value stack once the callee returns, see leave
+        """
+        self.check_depth(space, frame)
+        new_frame = w_func.make_frame(space, self, base, num_args)
+        frame.index = index
+        frame.cur_exc = cur_exc
+        frame.pos = result_pos
+        new_frame.back = frame
+        new_frame.depth = frame.depth + 1
+        self.topframeref = new_frame
+        return new_frame
+
+    def leave(self, frame):
+        """ Returns the frame to continue in once frame is done
+        """
+        back = frame.back
+        assert back is not None
+        frame.clear()
+        self.topframeref = back
+        return back
+
     def _interpret(self, space, bytecode, frame):
         index = 0
-        # make annotator happy
-        arg0 = 0
-        arg1 = 0
-        bc = bytecode.bytecode
         cur_exc = None
         while True:
+            driver.jit_merge_point(index=index, bytecode=bytecode,
+                                   cur_exc=cur_exc, frame=frame,
+                                   space=space, self=self)
             try:
-                op = ord(bc[index])
-                numargs = opcodes.opcodes[op].numargs
-                if numargs >= 1:
-                    arg0 = (ord(bc[index + 1]) << 8) + ord(bc[index + 2])
-                if numargs >= 2:
-                    arg1 = (ord(bc[index + 3]) << 8) + ord(bc[index + 4])
+                if jit.we_are_jitted():
+                    op = bytecode.code_ops[index]
+                    arg0 = bytecode.code_arg0[index]
+                else:
+                    op = bytecode.quick_ops[index]
+                    arg0 = bytecode.quick_arg0[index]
+                arg1 = bytecode.code_arg1[index]
 
                 if op == opcodes.LOAD_NONE:
                     frame.push(space.w_None)
@@ -58,7 +124,9 @@ class Interpreter(object):
                 elif op == opcodes.LOAD_VARIABLE:
                     self.load_variable(space, frame, index, arg0)
                 elif op == opcodes.LOAD_GLOBAL:
-                    self.load_global(space, frame, index, arg0)
+                    self.load_global(space, frame, bytecode, arg0)
+                elif op == opcodes.LOAD_BUILTIN:
+                    frame.push(space.builtins_w[arg0])
                 elif op == opcodes.LOAD_TRUE:
                     frame.push(space.w_True)
                 elif op == opcodes.LOAD_FALSE:
@@ -66,17 +134,40 @@ class Interpreter(object):
                 elif op == opcodes.DISCARD:
                     frame.pop()
                 elif op == opcodes.ADD:
+                    self.quicken(frame, bytecode, index)
                     self.binop_add(space, frame)
                 elif op == opcodes.SUB:
+                    self.quicken(frame, bytecode, index)
                     self.binop_sub(space, frame)
                 elif op == opcodes.MUL:
+                    self.quicken(frame, bytecode, index)
+                    self.binop_mul(space, frame)
+                elif op == opcodes.ADD_GENERIC:
+                    self.binop_add(space, frame)
+                elif op == opcodes.SUB_GENERIC:
+                    self.binop_sub(space, frame)
+                elif op == opcodes.MUL_GENERIC:
                     self.binop_mul(space, frame)
+                elif op == opcodes.LT_GENERIC:
+                    self.binop_lt(space, frame)
+                elif op == opcodes.EQ_GENERIC:
+                    self.binop_eq(space, frame)
                 elif op == opcodes.TRUEDIV:
                     self.binop_truediv(space, frame)
                 elif op == opcodes.LT:
+                    self.quicken(frame, bytecode, index)
                     self.binop_lt(space, frame)
                 elif op == opcodes.EQ:
+                    self.quicken(frame, bytecode, index)
                     self.binop_eq(space, frame)
+                elif (op == opcodes.ADD_INT or op == opcodes.SUB_INT or
+                      op == opcodes.MUL_INT or op == opcodes.LT_INT or
+                      op == opcodes.EQ_INT):
+                    if not self.binop_int(space, frame, bytecode, index, op):
+                        continue  # deoptimized, run the generic version
+                elif op == opcodes.ADD_STR or op == opcodes.EQ_STR:
+                    if not self.binop_str(space, frame, bytecode, index, op):
+                        continue
                 elif op == opcodes.IN:
                     self.binop_in(space, frame)
                 elif op == opcodes.NOT:
@@ -84,9 +175,9 @@ class Interpreter(object):
                 elif op == opcodes.STORE:
                     frame.store_var(arg0)
                 elif op == opcodes.SETATTR:
-                    self.setattr(space, frame, bytecode, arg0)
+                    self.setattr(space, frame, bytecode, arg1)
                 elif op == opcodes.GETATTR:
-                    self.getattr(space, frame, bytecode, arg0)
+                    self.getattr(space, frame, bytecode, arg1)
                 elif op == opcodes.SETITEM:
                     self.setitem(space, frame)
                 elif op == opcodes.GETITEM:
@@ -99,7 +190,6 @@ class Interpreter(object):
                     w_exception = frame.pop()
                     if not isinstance(w_exception, W_Exception):
                         raise Exception("handle this correctly")
-                    w_exception.frame = frame
                     raise AppError(w_exception)
                 elif op == opcodes.COMPARE_EXCEPTION:
                     index = self.compare_exception(space, frame,
@@ -110,10 +200,16 @@ class Interpreter(object):
                         raise AppError(cur_exc)
                 elif op == opcodes.PUSH_CURRENT_EXC:
                     frame.push(cur_exc)
+                elif op == opcodes.CLEAR_CURRENT_EXC:
+                    cur_exc = None
                 elif op == opcodes.JUMP_IF_FALSE:
                     if not space.is_true(frame.pop()):
                         index = arg0
                         continue
+                elif op == opcodes.JUMP_IF_TRUE:
+                    if space.is_true(frame.pop()):
+                        index = arg0
+                        continue
                 elif op == opcodes.JUMP_IF_TRUE_NOPOP:
                     if space.is_true(frame.peek()):
                         index = arg0
@@ -123,12 +219,35 @@ class Interpreter(object):
                         index = arg0
                         continue
                 elif op == opcodes.JUMP_ABSOLUTE:
+                    if arg0 <= index:
+                        # backward jump, closes a loop
+                        driver.can_enter_jit(index=arg0, bytecode=bytecode,
+                                             cur_exc=cur_exc, frame=frame,
+                                             space=space, self=self)
                     index = arg0
                     continue
-                elif op == opcodes.CALL:
-                    self.call(space, frame, index, arg0)
+                elif (op == opcodes.CALL or op == opcodes.CALL_FUNCTION or
+                      op == opcodes.CALL_METHOD):
+                    new_frame = self.call(space, frame, index, cur_exc, op,
+                                          arg0)
+                    if new_frame is not None:
+                        frame = new_frame
+                        bytecode = frame.bytecode
+                        index = 0
+                        cur_exc = None
+                        continue
+                elif op == opcodes.LOAD_METHOD:
+                    self.load_method(space, frame, bytecode, arg1)
                 elif op == opcodes.RETURN:
-                    return frame.pop()
+                    w_res = frame.pop()
+                    if frame.entry:
+                        return w_res
+                    frame = self.leave(frame)
+                    frame.push(w_res)
+                    bytecode = frame.bytecode
+                    index = bytecode.code_next[frame.index]
+                    cur_exc = frame.cur_exc
+                    continue
                 elif op == opcodes.LIST_BUILD:
                     self.list_build(space, frame, bytecode, arg0)
                 elif op == opcodes.DICT_BUILD:
@@ -138,21 +257,23 @@ class Interpreter(object):
                 else:
                     raise InvalidOpcode(op)
 
-                if numargs == 0:
-                    index += 1
-                elif numargs == 1:
-                    index += 3
-                else:
-                    index += 5
+                index = bytecode.code_next[index]
             except AppError as ae:
-                ae.record_position(frame, bytecode, index)
-                res = self.handle_error(space, frame, ae.w_exception)
-                if res:
-                    cur_exc = ae.w_exception
-                    frame.stack_depth = 0  # clear stack
-                    index = res
-                    continue
-                raise ae  # reraise the error if not handled
+                while True:
+                    ae.record_position(self.traceback_ring, frame.name,
+                                       bytecode, index)
+                    res = self.handle_error(space, frame, ae.w_exception)
+                    if res:
+                        break
+                    if frame.entry:
+                        raise ae  # reraise the error if not handled
+                    # unwind to the caller, as if raised by the call
+                    frame = self.leave(frame)
+                    bytecode = frame.bytecode
+                    index = frame.index
+                cur_exc = ae.w_exception
+                frame.clear_stack()
+                index = res
 
     def handle_error(self, space, frame, w_exception):
         if frame.resume_stack_depth:
@@ -165,24 +286,75 @@ class Interpreter(object):
                           cur_pos):
         block = bytecode.exception_blocks[arg0]
         if block.match(space, cur_exc):
-            return cur_pos + 5
+            return bytecode.code_next[cur_pos]
         return arg1
 
     def load_variable(self, space, frame, bytecode_index, no):
-        w_res = frame.locals_w[no]
+        w_res = frame.load_var(no)
         if w_res is None:
             raise UninitializedVariable()
         frame.push(w_res)
 
-    def load_global(self, space, frame, bytecode_index, no):
-        frame.push(frame.globals_w[no])
-
-    def call(self, space, frame, bytecode_index, no):
+    def load_global(self, space, frame, bytecode, no):
+        # only in code of modules that are not linked or when jitted, see
+        # Bytecode.link
+        frame.push(bytecode.module.functions[no])
+
+    def call(self, space, frame, index, cur_exc, op, no):
+        """ CALL, CALL_FUNCTION or CALL_METHOD with no arguments. Functions
+        get a frame that's returned, see enter, anything else is called
+        natively and None is returned
+        """
+        if op == opcodes.CALL_METHOD:
+            return self.call_method(space, frame, index, cur_exc, no)
+        w_callable = frame.stack_w[frame.pos - no - 1]
+        if op == opcodes.CALL_FUNCTION or isinstance(w_callable, W_Function):
+            assert isinstance(w_callable, W_Function)
+            # the arguments are already where the callee expects them
+            base = frame.pos - no
+            return self.enter(space, frame, index, cur_exc, w_callable, base,
+                              no, base - 1)
         args = [None] * no
         for i in range(no - 1, -1, -1):
             args[i] = frame.pop()
         w_callable = frame.pop()
         frame.push(space.call(w_callable, args))
+        return None
+
+    def load_method(self, space, frame, bytecode, no):
+        w_obj = frame.pop()
+        cache = bytecode.attr_caches[no]
+        if jit.we_are_jitted():
+            w_callable, w_self = space.load_method(w_obj, cache.attrname)
+        else:
+            w_callable, w_self = cache.load_method(space, w_obj)
+        frame.push(w_callable)
+        frame.push(w_self)
+
+    def call_method(self, space, frame, index, cur_exc, no):
+        # w_self is None if LOAD_METHOD found something already bound
+        w_self = frame.stack_w[frame.pos - no - 1]
+        w_callable = frame.stack_w[frame.pos - no - 2]
+        result_pos = frame.pos - no - 2
+        if isinstance(w_callable, W_Function):
+            if w_self is None:
+                return self.enter(space, frame, index, cur_exc, w_callable,
+                                  frame.pos - no, no, result_pos)
+            return self.enter(space, frame, index, cur_exc, w_callable,
+                              frame.pos - no - 1, no + 1, result_pos)
+        if w_self is None:
+            args = [None] * no
+            for i in range(no - 1, -1, -1):
+                args[i] = frame.pop()
+        else:
+            args = [None] * (no + 1)
+            for i in range(no, 0, -1):
+                args[i] = frame.pop()
+            args[0] = w_self
+        frame.pop()
+        w_callable = frame.pop()
+        frame.push(space.call(w_callable, args))
+        return None
 
     def list_build(self, space, frame, bytecode, no):
         items = [None] * no
@@ -211,11 +383,19 @@ class Interpreter(object):
     def setattr(self, space, frame, bytecode, no):
         w_arg = frame.pop()
         w_lhand = frame.pop()
-        space.setattr(w_lhand, space.utf8_w(bytecode.constants[no]), w_arg)
+        cache = bytecode.attr_caches[no]
+        if jit.we_are_jitted():
+            space.setattr(w_lhand, cache.attrname, w_arg)
+        else:
+            cache.setattr(space, w_lhand, w_arg)
 
     def getattr(self, space, frame, bytecode, no):
         w_lhand = frame.pop()
-        frame.push(space.getattr(w_lhand, space.utf8_w(bytecode.constants[no])))
+        cache = bytecode.attr_caches[no]
+        if jit.we_are_jitted():
+            frame.push(space.getattr(w_lhand, cache.attrname))
+        else:
+            frame.push(cache.getattr(space, w_lhand))
 
     def setitem(self, space, frame):
         w_arg = frame.pop()
@@ -235,6 +415,87 @@ class Interpreter(object):
     def pop_resume_stack(self, frame):
         frame.resume_stack_depth -= 1
 
+    def quicken(self, frame, bytecode, index):
+        """ Replace the generic binary operation at index in quick_ops with
+        a version specialized for the types of the operands on the stack
+        """
+        if jit.we_are_jitted():
+            return
+        w_right = frame.peek()
+        w_left = frame.stack_w[frame.pos - 2]
+        op = bytecode.code_ops[index]
+        quick_op = -1
+        if (isinstance(w_left, W_IntObject) and
+                isinstance(w_right, W_IntObject)):
+            if op == opcodes.ADD:
+                quick_op = opcodes.ADD_INT
+            elif op == opcodes.SUB:
+                quick_op = opcodes.SUB_INT
+            elif op == opcodes.MUL:
+                quick_op = opcodes.MUL_INT
+            elif op == opcodes.LT:
+                quick_op = opcodes.LT_INT
+            elif op == opcodes.EQ:
+                quick_op = opcodes.EQ_INT
+        elif (isinstance(w_left, W_StrObject) and
+                isinstance(w_right, W_StrObject)):
+            if op == opcodes.ADD:
+                quick_op = opcodes.ADD_STR
+            elif op == opcodes.EQ:
+                quick_op = opcodes.EQ_STR
+        if quick_op != -1:
+            bytecode.quick_ops[index] = quick_op
+
+    def deoptimize(self, bytecode, index, op):
+        """ The operands at index changed type, from now on it runs the
+        generic operation without trying to quicken it again, so a site that
+        sees both ints and strs does not keep switching between versions
+        """
+        generic_op = opcodes.opcodes[op].generic_op
+        bytecode.quick_ops[index] = opcodes.opcodes[generic_op].sticky_op
+
+    def binop_int(self, space, frame, bytecode, index, op):
+        w_right = frame.peek()
+        w_left = frame.stack_w[frame.pos - 2]
+        if (not isinstance(w_left, W_IntObject) or
+                not isinstance(w_right, W_IntObject)):
+            self.deoptimize(bytecode, index, op)
+            return False
+        frame.pop()
+        frame.pop()
+        left = w_left._intval
+        right = w_right._intval
+        if op == opcodes.ADD_INT:
+            w_res = int_add(space, left, right)
+        elif op == opcodes.SUB_INT:
+            w_res = int_sub(space, left, right)
+        elif op == opcodes.MUL_INT:
+            w_res = int_mul(space, left, right)
+        elif op == opcodes.LT_INT:
+            w_res = space.newbool(left < right)
+        else:
+            assert op == opcodes.EQ_INT
+            w_res = space.newbool(left == right)
+        frame.push(w_res)
+        return True
+
+    def binop_str(self, space, frame, bytecode, index, op):
+        w_right = frame.peek()
+        w_left = frame.stack_w[frame.pos - 2]
+        if (not isinstance(w_left, W_StrObject) or
+                not isinstance(w_right, W_StrObject)):
+            self.deoptimize(bytecode, index, op)
+            return False
+        frame.pop()
+        frame.pop()
+        if op == opcodes.ADD_STR:
+            w_res = space.newtext(w_left.utf8val + w_right.utf8val)
+        else:
+            assert op == opcodes.EQ_STR
+            w_res = space.newbool(w_left.utf8val == w_right.utf8val)
+        frame.push(w_res)
+        return True
+
     def binop_lt(self, space, frame):
         w_right = frame.pop()
         w_left = frame.pop()
@@ -1,3 +1,6 @@
+import sre_constants
+import sre_parse
+
 from rply.lexergenerator import Rule
 from rply.token import Token as RplyToken
 
@@ -20,17 +23,30 @@ class SourceRange(object):
 
 
 class ParseError(Exception):
-    def __init__(self, msg, line, filename, lineno, start_colno, end_colno):
+    def __init__(self, msg, source, line_start, filename, lineno, start_colno,
+                 end_colno):
         self.msg = msg
-        self.line = line
+        self.source = source
+        self.line_start = line_start
         self.filename = filename
         self.lineno = lineno
         self.start_colno = start_colno
         self.end_colno = end_colno
 
+    def get_line(self):
+        """ The source line where the error happened, only extracted when
+        the error is reported
+        """
+        start = self.line_start
+        assert start >= 0
+        end = self.source.find("\n", start)
+        if end < 0:
+            end = len(self.source)
+        return self.source[start:end]
+
     def __str__(self):
         # 6 comes from formatting of ParseError by pytest
-        return (self.line + "\n" + " " * (self.start_colno - 6) +
+        return (self.get_line() + "\n" + " " * (self.start_colno - 6) +
                 "^" * (self.end_colno - self.start_colno))
 
 
@@ -134,9 +150,137 @@ TOKENS = [x[0] for x in QUILL_RULES + INTERP_STRING_RULES + RAW_DQ_STRING_RULES]
 
 KEYWORD_DICT = dict.fromkeys(KEYWORDS)
 
+TOKEN_TYPES = dict([(name, i) for i, name in enumerate(TOKENS)])
+SEMICOLON_TYPE = TOKEN_TYPES['SEMICOLON']
+# a newline after these tokens ends the statement
+SEMICOLON_AFTER = [name in ('RIGHT_CURLY_BRACE', 'RIGHT_PAREN', 'IDENTIFIER',
+                            'INTEGER', 'TRUE', 'FALSE', 'RIGHT_SQUARE_BRACKET')
+                   for name in TOKENS]
+
+
+def keyword_hash(word, size, mult):
+    return (ord(word[0]) * mult + ord(word[len(word) - 1]) + len(word)) % size
+
+
+def make_keyword_table(keywords):
+    """ Find the smallest table with a multiplier for which keyword_hash
+    is a perfect hash of the keywords, so recognizing a keyword costs one
+    string comparison
+    """
+    for size in range(len(keywords), 4 * len(keywords)):
+        for mult in range(1, 256):
+            table = [None] * size
+            for word in keywords:
+                index = keyword_hash(word, size, mult)
+                if table[index] is not None:
+                    break
+                table[index] = word
+            else:
+                return size, mult, [word or "" for word in table]
+    raise ValueError("no perfect hash found for the keywords")
+
+
+KEYWORD_TABLE_SIZE, KEYWORD_MULT, KEYWORD_TABLE = make_keyword_table(KEYWORDS)
+KEYWORD_TYPES = [TOKEN_TYPES.get(word.upper(), -1) for word in KEYWORD_TABLE]
+
+
+def keyword_type(s, start, end):
+    """ The token type if s[start:end] is a keyword, -1 otherwise
+    """
+    length = end - start
+    if length <= 0:
+        return -1
+    # keyword_hash without slicing out the word
+    index = (ord(s[start]) * KEYWORD_MULT + ord(s[end - 1]) +
+             length) % KEYWORD_TABLE_SIZE
+    word = KEYWORD_TABLE[index]
+    if len(word) != length:
+        return -1
+    for i in range(length):
+        if s[start + i] != word[i]:
+            return -1
+    return KEYWORD_TYPES[index]
+
+
+CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: '0123456789',
+    sre_constants.CATEGORY_SPACE: ' \t\n\r\f\v',
+    sre_constants.CATEGORY_WORD: ('abcdefghijklmnopqrstuvwxyz'
+                                  'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_'),
+}
+
+
+def parse_charset(op, av, flags):
+    """ The set of characters matched by a single regex item, as a list
+    of 256 bools, or None if the item matches more than one character
+    """
+    if op == sre_constants.LITERAL:
+        return [i == av for i in range(256)]
+    if op == sre_constants.NOT_LITERAL:
+        return [i != av for i in range(256)]
+    if op == sre_constants.ANY:
+        return [i != ord('\n') or bool(flags & sre_constants.SRE_FLAG_DOTALL)
+                for i in range(256)]
+    if op != sre_constants.IN:
+        return None
+    charset = [False] * 256
+    negate = False
+    for kind, value in av:
+        if kind == sre_constants.NEGATE:
+            negate = True
+        elif kind == sre_constants.LITERAL:
+            charset[value] = True
+        elif kind == sre_constants.RANGE:
+            for i in range(value[0], value[1] + 1):
+                charset[i] = True
+        elif kind == sre_constants.CATEGORY and value in CATEGORY_CHARS:
+            for c in CATEGORY_CHARS[value]:
+                charset[ord(c)] = True
+        else:
+            return None
+    if negate:
+        charset = [not x for x in charset]
+    return charset
+
+
+def parse_repeat(op, av, flags):
+    """ (min, charset) for a greedy repetition of a single character set,
+    None for anything else
+    """
+    if op != sre_constants.MAX_REPEAT:
+        return None
+    min, max, items = av
+    if max != sre_constants.MAXREPEAT or len(items) != 1:
+        return None
+    charset = parse_charset(items[0][0], items[0][1], flags)
+    if charset is None:
+        return None
+    return min, charset
+
+
+def first_charset(items, flags):
+    """ The characters a match of the pattern can start with, as a list of
+    256 bools. Errs on the side of too many
+    """
+    if items:
+        op, av = items[0]
+        charset = parse_charset(op, av, flags)
+        if charset is not None:
+            return charset
+        repeat = parse_repeat(op, av, flags)
+        if repeat is not None and repeat[0] >= 1:
+            return repeat[1]
+        if op == sre_constants.SUBPATTERN:
+            return first_charset(list(av[-1]), flags)
+    return [True] * 256
+
 
 class QuillLexerStream(object):
-    _last_token = None
+    """ Produces the tokens of the source one at a time. next_type() only
+    records the type and the offsets of the token, next() wraps them into
+    a Token
+    """
+    _last_type = -1
 
     def __init__(self, lexer, filename, s, state='INITIAL'):
         self.lexer = lexer
@@ -147,6 +291,12 @@ class QuillLexerStream(object):
 
         self.idx = 0
         self._lineno = 1
+        self._line_start = 0  # offset of the first character of _lineno
+        self.line_starts = [0]  # offsets of the first character of each line
+        self.tok_start = 0
+        self.tok_end = 0
+        self.tok_lineno = 0
+        self.tok_colno = 0
 
     @property
     def state(self):
@@ -165,75 +315,180 @@ class QuillLexerStream(object):
         return self.next()
 
     def _update_pos(self, match_start, match_end):
-        lineno = self._lineno
+        self.tok_start = match_start
+        self.tok_end = match_end
+        self.tok_lineno = self._lineno
+        self.tok_colno = match_start - self._line_start + 1
         self.idx = match_end
-        self._lineno += self.s.count("\n", match_start, match_end)
-        last_nl = self.s.rfind("\n", 0, match_start)
-        if last_nl < 0:
-            colno = match_start + 1
-        else:
-            colno = match_start - last_nl
-        return SourceRange(match_start, match_end, lineno, colno)
-
-    def next(self):
+        # only look inside the match, never back across the line
+        pos = self.s.find("\n", match_start, match_end)
+        while pos >= 0:
+            self._lineno += 1
+            self._line_start = pos + 1
+            self.line_starts.append(pos + 1)
+            pos = self.s.find("\n", pos + 1, match_end)
+
+    def _match(self, dispatch):
+        """ Try the rules that can start with the current character in
+        order, returns the first rule that matches and the end of the match
+        """
+        start = self.idx
+        for rule in dispatch[ord(self.s[start])]:
+            end = rule.match(self.s, start)
+            if end >= 0:
+                return rule, end
+        return None, -1
+
+    def next_type(self):
+        """ Find the next token and return its index in TOKENS, the
+        position is stored in the tok_* fields
+        """
         while True:
             if self.idx >= len(self.s):
                 if not self.state.end_allowed:
                     raise self.parse_error("unterminated string")
                 raise StopIteration
-            if self.state.name == 'INITIAL':
-                assert len(self.state.ignore_rules) == 1
-                whitespace_rule = self.state.ignore_rules[0]
-                match = whitespace_rule.matches(self.s, self.idx)
-                if match is not None:
-                    source_range = self._update_pos(match.start, match.end)
-                    if "\n" in self.s[match.start:match.end]:
-                        if self._last_token.name not in \
-                           ('RIGHT_CURLY_BRACE', 'RIGHT_PAREN', 'IDENTIFIER',
-                           'INTEGER', 'TRUE', 'FALSE', 'RIGHT_SQUARE_BRACKET'):
-                            continue
-                        token = Token(
-                            'SEMICOLON', self.s[match.start:match.end], source_range
-                        )
-                        self._last_token = token
-                        return token
-                else:
-                    break
-            else:
-                for rule in self.state.ignore_rules:
-                    match = rule.matches(self.s, self.idx)
-                    if match:
-                        self._update_pos(match.start, match.end)
-                        break
-                else:
-                    break
-
-        for rule in self.state.rules:
-            match = rule.matches(self.s, self.idx)
-            if match:
-                source_range = self._update_pos(match.start, match.end)
-                val = self.s[match.start:match.end]
-                if val in KEYWORD_DICT:
-                    name = val.upper()
-                else:
-                    name = rule.name
-                token = Token(name, val, source_range)
-                self._last_token = token
-                if name in self.state.transitions:
-                    self.transition_state(self.state.transitions[name])
-                return token
-        else:
+            start = self.idx
+            rule, end = self._match(self.state.ignore_dispatch)
+            if rule is None:
+                break
+            assert start >= 0
+            assert end >= 0
+            lineno = self._lineno
+            self._update_pos(start, end)
+            if self.state.name == 'INITIAL' and lineno != self._lineno:
+                if self._last_type < 0 or \
+                   not SEMICOLON_AFTER[self._last_type]:
+                    continue
+                self._last_type = SEMICOLON_TYPE
+                return SEMICOLON_TYPE
+
+        start = self.idx
+        rule, end = self._match(self.state.dispatch)
+        if rule is None:
             raise self.parse_error("unrecognized token")
+        assert start >= 0
+        assert end >= 0
+        self._update_pos(start, end)
+        tp = -1
+        if rule.may_be_keyword:
+            tp = keyword_type(self.s, start, end)
+        if tp < 0:
+            tp = rule.type
+        self._last_type = tp
+        name = TOKENS[tp]
+        if name in self.state.transitions:
+            self.transition_state(self.state.transitions[name])
+        return tp
+
+    def next(self):
+        tp = self.next_type()
+        start = self.tok_start
+        end = self.tok_end
+        assert start >= 0
+        assert end >= 0
+        return Token(TOKENS[tp], self.s[start:end],
+                     SourceRange(start, end, self.tok_lineno, self.tok_colno))
 
     def parse_error(self, msg):
-        last_nl = self.s.rfind("\n", 0, self.idx)
-        if last_nl < 0:
+        if self._line_start == 0:
             colno = self.idx - 1
         else:
-            colno = self.idx - last_nl - 1
-        return ParseError(msg,
-                          self.s.splitlines()[self._lineno - 1],
-                          self._filename, self._lineno, colno, colno + 1)
+            colno = self.idx - self._line_start
+        return ParseError(msg, self.s, self._line_start, self._filename,
+                          self._lineno, colno, colno + 1)
+
+
+class TokenBuffer(object):
+    """ A compact token stream, filled as the parser pulls tokens. Every
+    token is its type and offsets in three flat lists, the text and the
+    line and column are only computed from the source when asked for.
+    Iterating gives BufferedTokens, the thin adapter rply needs
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.source = stream.s
+        self.types = []
+        self.starts = []
+        self.ends = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def next(self):
+        tp = self.stream.next_type()
+        self.types.append(tp)
+        self.starts.append(self.stream.tok_start)
+        self.ends.append(self.stream.tok_end)
+        return BufferedToken(self, len(self.types) - 1)
+
+    def fill(self):
+        """ Lex the rest of the source into the buffer
+        """
+        while True:
+            try:
+                self.next()
+            except StopIteration:
+                break
+
+    def __len__(self):
+        return len(self.types)
+
+    def getname(self, i):
+        return TOKENS[self.types[i]]
+
+    def getstr(self, i):
+        start = self.starts[i]
+        end = self.ends[i]
+        assert start >= 0
+        assert end >= 0
+        return self.source[start:end]
+
+    def getsrcpos(self, i):
+        return (self.starts[i], self.ends[i])
+
+    def find_line(self, pos):
+        """ The index of the line containing pos, by bisecting the line starts
+        """
+        line_starts = self.stream.line_starts
+        lo = 0
+        hi = len(line_starts)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if line_starts[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def getsourcepos(self, i):
+        start = self.starts[i]
+        line = self.find_line(start)
+        colno = start - self.stream.line_starts[line] + 1
+        return SourceRange(start, self.ends[i], line + 1, colno)
+
+
+class BufferedToken(RplyToken):
+    """ A token that is an index into a TokenBuffer
+    """
+    def __init__(self, buffer, index):
+        self.buffer = buffer
+        self.index = index
+
+    def gettokentype(self):
+        return self.buffer.getname(self.index)
+
+    def getstr(self):
+        return self.buffer.getstr(self.index)
+
+    def getsrcpos(self):
+        return self.buffer.getsrcpos(self.index)
+
+    def getsourcepos(self):
+        return self.buffer.getsourcepos(self.index)
 
 
 class QuillLexer(object):
@@ -246,6 +501,84 @@ class QuillLexer(object):
     def lex(self, filename, s):
         return QuillLexerStream(self, filename, s)
 
+    def tokenize(self, filename, s):
+        return TokenBuffer(QuillLexerStream(self, filename, s))
+
+
+class LexerRule(object):
+    """ A rule that matches literals and runs of a character set directly,
+    and everything else with a regex. The pattern is analyzed when the lexer
+    is built, which also finds the characters a match can start with
+    """
+    KIND_LITERAL, KIND_RUN, KIND_REGEX = range(3)
+
+    def __init__(self, name, pattern, flags=0):
+        self.name = name
+        self.type = TOKEN_TYPES.get(name, -1)
+        self.may_be_keyword = name == 'IDENTIFIER'
+        self.rule = Rule(name, pattern, flags=flags)
+        self.literal = ""
+        self.head = None
+        self.tail = None
+        items = list(sre_parse.parse(pattern, flags))
+        self.first_chars = first_charset(items, flags)
+        if items and all([op == sre_constants.LITERAL for op, _ in items]):
+            self.kind = self.KIND_LITERAL
+            self.literal = "".join([chr(av) for _, av in items])
+            return
+        self.kind = self.KIND_REGEX
+        if len(items) == 1:
+            op, av = items[0]
+            head = parse_charset(op, av, flags)
+            if head is not None:
+                self.kind = self.KIND_RUN
+                self.head = head
+                self.tail = [False] * 256
+                return
+            repeat = parse_repeat(op, av, flags)
+            if repeat is not None and repeat[0] == 1:
+                self.kind = self.KIND_RUN
+                self.head = self.tail = repeat[1]
+        elif len(items) == 2:
+            head = parse_charset(items[0][0], items[0][1], flags)
+            repeat = parse_repeat(items[1][0], items[1][1], flags)
+            if head is not None and repeat is not None and repeat[0] == 0:
+                self.kind = self.KIND_RUN
+                self.head = head
+                self.tail = repeat[1]
+
+    def match(self, s, pos):
+        """ The end of the match at pos, or -1
+        """
+        if self.kind == self.KIND_LITERAL:
+            literal = self.literal
+            if pos + len(literal) > len(s):
+                return -1
+            for i in range(len(literal)):
+                if s[pos + i] != literal[i]:
+                    return -1
+            return pos + len(literal)
+        elif self.kind == self.KIND_RUN:
+            if not self.head[ord(s[pos])]:
+                return -1
+            pos += 1
+            tail = self.tail
+            while pos < len(s) and tail[ord(s[pos])]:
+                pos += 1
+            return pos
+        match = self.rule.matches(s, pos)
+        if match is None:
+            return -1
+        return match.end
+
+
+def make_dispatch(rules):
+    """ For every character, the rules that can match starting with it,
+    in their original order
+    """
+    return [[rule for rule in rules if rule.first_chars[i]]
+            for i in range(256)]
+
 
 class LexerState(object):
     def __init__(self, name, end_allowed):
@@ -254,12 +587,18 @@ class LexerState(object):
         self.rules = []
         self.ignore_rules = []
         self.transitions = {}
+        self.dispatch = None
+        self.ignore_dispatch = None
 
     def add(self, name, pattern, flags=0):
-        self.rules.append(Rule(name, pattern, flags=flags))
+        self.rules.append(LexerRule(name, pattern, flags=flags))
 
     def ignore(self, pattern, flags=0):
-        self.ignore_rules.append(Rule("", pattern, flags=flags))
+        self.ignore_rules.append(LexerRule("", pattern, flags=flags))
+
+    def build(self):
+        self.dispatch = make_dispatch(self.rules)
+        self.ignore_dispatch = make_dispatch(self.ignore_rules)
 
     def push_state(self, name, state):
         assert name not in self.transitions
@@ -280,6 +619,8 @@ class QuillLexerGenerator(object):
         return self.states[name]
 
     def build(self):
+        for state in self.states.values():
+            state.build()
         return QuillLexer(self.states)
 
 
@@ -1,20 +1,40 @@
 
 """ Execute:
 
-nolang-c <program.no>
+nolang-c [-O<level>] [--attr-stats] [--no-cache] [--eager] [--path=<dirs>]
+         [--recursion-limit=<n>] <program.no>
+nolang-c [-O<level>] [--no-cache] [--eager] [--path=<dirs>]
+         [--recursion-limit=<n>] --serve <socket>
+nolang-c --connect <socket> (<program.no> | --stop)
+
+-O0 disables the bytecode optimizer, -O1 (the default) enables it, -O2 also
+inlines calls of small functions
+--attr-stats prints attribute inline cache hits and misses when done
+--no-cache neither reads nor writes the compiled .qc files
+--eager compiles every function when loading its module, instead of on the
+first call, so compiler errors are reported before anything runs
+--path=<dirs> adds colon separated directories to look for self.* modules
+in, after the program's directory and before the ones in $NOLANG_PATH
+--recursion-limit=<n> raises RecursionError for calls nested deeper than n
+(10000 by default)
+--serve runs programs sent by --connect clients over a unix socket, keeping
+the parsed modules between them, until a client sends --stop
 """
 
 import os
 import sys
 
 from nolang.interpreter import Interpreter
-from nolang.parser import get_parser, ParsingState, ParseError
-from nolang.compiler import compile_module
+from nolang.parser import get_parser, ParseError
+from nolang.bytecache import compile_file, builtins_hash, write_caches
+from nolang.bytecode import CompilerError
 from nolang.builtins.defaults import default_builtins
 from nolang.lexer import get_lexer
 from nolang.frameobject import format_traceback
-from nolang.importer import Importer
+from nolang.importer import Importer, ImportError, parse_search_path
+from nolang.inlinecache import format_module_cache_stats
 from nolang.objects.space import Space
+from nolang.server import serve, connect
 from nolang.error import AppError
 
 
@@ -39,24 +59,101 @@ def path_split(p):
     return head, tail
 
 
+def parse_number(s):
+    """ Parse a non-negative decimal number, returns -1 if s is not one
+    """
+    if not s:
+        return -1
+    value = 0
+    for c in s:
+        if not c.isdigit():
+            return -1
+        value = value * 10 + (ord(c) - ord('0'))
+    return value
+
+
+def parse_opt_level(arg):
+    """ Parse -O<level>, returns -1 if the argument is not a valid one
+    """
+    if not arg.startswith("-O"):
+        return -1
+    return parse_number(arg[2:])
+
+
 def main(argv):
-    if len(argv) != 2:
+    args = []
+    attr_stats = False
+    serve_mode = False
+    connect_mode = False
+    stop = False
+    search_path = []
+    for arg in argv[1:]:
+        if arg == "--attr-stats":
+            attr_stats = True
+        elif arg == "--serve":
+            serve_mode = True
+        elif arg == "--connect":
+            connect_mode = True
+        elif arg == "--stop":
+            stop = True
+        elif arg == "--no-cache":
+            space.bytecode_cache = False
+        elif arg == "--eager":
+            space.eager_compile = True
+        elif arg.startswith("--path="):
+            search_path += parse_search_path(arg[len("--path="):])
+        elif arg.startswith("-O"):
+            level = parse_opt_level(arg)
+            if level < 0:
+                print __doc__
+                return 1
+            space.opt_level = level
+        elif arg.startswith("--recursion-limit="):
+            limit = parse_number(arg[len("--recursion-limit="):])
+            if limit <= 0:
+                print __doc__
+                return 1
+            space.recursion_limit = limit
+        else:
+            args.append(arg)
+    env_path = os.environ.get("NOLANG_PATH")
+    if env_path is not None:
+        search_path += parse_search_path(env_path)
+    space.search_path = search_path
+    if connect_mode:
+        if stop and len(args) == 1:
+            return connect(args[0], None)
+        if not stop and len(args) == 2:
+            return connect(args[0], args[1])
         print __doc__
         return 1
-    return run_code(argv[1])
+    if len(args) != 1 or stop:
+        print __doc__
+        return 1
+    if serve_mode:
+        return serve(space, args[0], run_code)
+    return run_code(args[0], attr_stats)
 
 
+# Everything built here is built at translation time for nolang-c, so the
+# LR tables, the lexer dispatch tables, the wrapped builtins and the core
+# modules are prebuilt data in the binary and cost nothing at startup
 parser = get_parser()
 lexer = get_lexer()
 space = Space()
 space.setup_builtins(*default_builtins(space))
+builtins_hash(space)
 
 
 def format_parser_error(pe):
-    print "Error parsing input file %s, line %d: %s" % (pe.filename, pe.lineno,
-        pe.msg)
-    print "  " + pe.line
-    print "  " + " " * pe.start_colno + "^" * (pe.end_colno - pe.start_colno)
+    return "Error parsing input file %s, line %d: %s\n  %s\n  %s\n" % (
+        pe.filename, pe.lineno, pe.msg, pe.get_line(),
+        " " * pe.start_colno + "^" * (pe.end_colno - pe.start_colno))
+
+
+def format_compiler_error(ce):
+    return "Error compiling file %s, line %d: %s\n  %s\n" % (
+        ce.filename, ce.get_lineno(), ce.get_message(), ce.get_line())
 
 
 def parse_name(fname):
@@ -68,30 +165,54 @@ def parse_name(fname):
     return "self." + name
 
 
-def run_code(fname):
+def run_code(fname, attr_stats=False, programs=None):
+    """ Run main() of the program in fname, with programs a ProgramCache
+    in server mode
+    """
+    try:
+        return _run_code(fname, attr_stats, programs)
+    finally:
+        space.output.flush()
+
+
+def _run_code(fname, attr_stats, programs):
+    output = space.output
     interpreter = Interpreter()
     space.setup(interpreter)
     try:
         source = open(fname).read()
     except (OSError, IOError):
-        print "Error reading file %s" % fname
+        output.write_stdout("Error reading file %s\n" % fname)
         return 1
+    importer = Importer(space, dirname(os.path.abspath(fname)), parser, lexer,
+                        programs)
+    dotted_name = parse_name(fname)
     # XXX error handling
     try:
-        ast = parser.parse(lexer.lex(fname, source), ParsingState(fname,
-                           source))
+        w_mod = compile_file(space, parser, lexer, importer, fname,
+                             dotted_name, source)
     except ParseError as pe:
-        format_parser_error(pe)
+        output.write_stdout(format_parser_error(pe))
+        return 1
+    except CompilerError as ce:
+        output.write_stdout(format_compiler_error(ce))
+        return 1
+    except ImportError as ie:
+        output.write_stdout("Error importing module %s\n" % ie.name)
         return 1
-    importer = Importer(space, dirname(os.path.abspath(fname)), parser, lexer)
-    dotted_name = parse_name(fname)
-    w_mod = compile_module(space, fname, dotted_name, source, ast, importer)
     w_mod.setup(space)
     try:
         space.call_method(w_mod, 'main', [])
     except AppError as e:
-        os.write(2, format_traceback(space, e))
+        output.write_stderr(format_traceback(space, e))
+        return 1
+    except CompilerError as ce:
+        output.write_stdout(format_compiler_error(ce))
         return 1
+    finally:
+        if attr_stats:
+            output.write_stderr(format_module_cache_stats(w_mod))
+        write_caches(space, importer)
     return 0
 
 
@@ -3,6 +3,7 @@
 """
 
 from nolang.objects.root import W_Root
+from nolang.constants import ConstantPool
 
 
 def create_module(name, functions):
@@ -17,6 +18,8 @@ class W_Module(W_Root):
         self.name = name
         self.name2index = name2index
         self.functions = functions
+        self.constant_pool = ConstantPool()
+        self.linked = False  # see compiler.link_module
 
     def setup(self, space):
         for item in self.functions:
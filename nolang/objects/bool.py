@@ -2,6 +2,8 @@ from nolang.objects.root import W_Root
 
 
 class W_BoolObject(W_Root):
+    _immutable_fields_ = ['_boolval']
+
     def __init__(self, boolval):
         self._boolval = boolval
 
@@ -2,6 +2,7 @@
 """
 
 from rpython.rlib.objectmodel import compute_hash
+from rpython.rlib.rarithmetic import ovfcheck
 
 from nolang.error import AppError
 from nolang.objects.root import W_Root
@@ -9,6 +10,8 @@ from nolang.builtins.spec import TypeSpec, unwrap_spec
 
 
 class W_IntObject(W_Root):
+    _immutable_fields_ = ['_intval']
+
     def __init__(self, intval):
         self._intval = intval
 
@@ -21,8 +24,13 @@ class W_IntObject(W_Root):
     def int_w(self, space):
         return self._intval
 
+    def other_int(self, space, w_other):
+        if not isinstance(w_other, W_IntObject):
+            raise space.apperr(space.w_typeerror, 'unsupported operand type')
+        return w_other._intval
+
     def lt(self, space, w_other):
-        return space.newbool(self._intval < w_other._intval)
+        return space.newbool(self._intval < self.other_int(space, w_other))
 
     def eq(self, space, w_other):
         try:
@@ -34,21 +42,46 @@ class W_IntObject(W_Root):
         return space.newbool(self._intval == other)
 
     def add(self, space, w_other):
-        return space.newint(self._intval + w_other._intval)
+        return int_add(space, self._intval, self.other_int(space, w_other))
 
     def sub(self, space, w_other):
-        return space.newint(self._intval - w_other._intval)
+        return int_sub(space, self._intval, self.other_int(space, w_other))
 
     def mul(self, space, w_other):
-        return space.newint(self._intval * w_other._intval)
+        return int_mul(space, self._intval, self.other_int(space, w_other))
 
     def truediv(self, space, w_other):
-        return space.newint(self._intval // w_other._intval)
+        return space.newint(self._intval // self.other_int(space, w_other))
 
     def is_true(self, space):
         return self._intval != 0
 
 
+def overflow(space):
+    return space.apperr(space.w_overflowerror, 'integer overflow')
+
+
+def int_add(space, left, right):
+    try:
+        return space.newint(ovfcheck(left + right))
+    except OverflowError:
+        raise overflow(space)
+
+
+def int_sub(space, left, right):
+    try:
+        return space.newint(ovfcheck(left - right))
+    except OverflowError:
+        raise overflow(space)
+
+
+def int_mul(space, left, right):
+    try:
+        return space.newint(ovfcheck(left * right))
+    except OverflowError:
+        raise overflow(space)
+
+
 @unwrap_spec(value='int')
 def new_int(space, value):
     return space.newint(value)
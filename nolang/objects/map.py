@@ -0,0 +1,46 @@
+""" Maps (also known as hidden classes or shapes) describe the layout of
+user objects. All objects of a type that got the same attributes in the
+same order share a map, which maps attribute names to indexes into the
+object's flat storage_w list.
+"""
+
+from rpython.rlib import jit
+
+
+class Map(object):
+    _immutable_fields_ = ['indexes', 'size']
+
+    def __init__(self, indexes):
+        self.indexes = indexes
+        self.size = len(indexes)
+        self.transitions = {}
+
+    @jit.elidable
+    def find(self, attrname):
+        return self.indexes.get(attrname, -1)
+
+    @jit.elidable
+    def add_attribute(self, attrname):
+        """ Return the map of an object that got attrname added to
+        this layout
+        """
+        try:
+            return self.transitions[attrname]
+        except KeyError:
+            indexes = self.indexes.copy()
+            indexes[attrname] = self.size
+            new_map = Map(indexes)
+            self.transitions[attrname] = new_map
+            return new_map
+
+
+def root_map(names):
+    """ Initial map for a type, laid out for the declared attribute names
+    if there are any
+    """
+    indexes = {}
+    if names is not None:
+        for name in names:
+            if name not in indexes:
+                indexes[name] = len(indexes)
+    return Map(indexes)
@@ -5,6 +5,9 @@ objects of everything wrapped and presented to the user
 
 class W_Root(object):
     cls_w_type = None
+    # bind() creates a W_BoundMethod, so calling the result is the same as
+    # calling self with the object prepended to the arguments
+    binds_receiver = False
 
     def int_w(self, space):
         raise space.apperr(space.w_typeerror, 'expected integer')
@@ -24,6 +27,24 @@ class W_Root(object):
     def getattr(self, space, attrname):
         return space.w_NotImplemented
 
+    def eq(self, space, w_other):
+        return space.w_NotImplemented
+
+    def lt(self, space, w_other):
+        raise space.apperr(space.w_typeerror, 'unsupported operand type')
+
+    def add(self, space, w_other):
+        raise space.apperr(space.w_typeerror, 'unsupported operand type')
+
+    def sub(self, space, w_other):
+        raise space.apperr(space.w_typeerror, 'unsupported operand type')
+
+    def mul(self, space, w_other):
+        raise space.apperr(space.w_typeerror, 'unsupported operand type')
+
+    def truediv(self, space, w_other):
+        raise space.apperr(space.w_typeerror, 'unsupported operand type')
+
     def bind(self, space, w_obj):
         return self
 
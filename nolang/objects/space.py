@@ -2,6 +2,8 @@
 on objects
 """
 
+from rpython.rlib import jit
+
 from nolang.error import AppError
 from nolang.objects.root import W_None, W_Root
 from nolang.objects.int import W_IntObject
@@ -13,45 +15,80 @@ from nolang.objects.unicode import W_StrObject
 from nolang.objects.usertype import W_UserType
 from nolang.builtins.spec import wrap_builtin
 from nolang.builtins.exception import W_Exception
+from nolang.output import Output
+
+
+# range of preallocated integers returned by Space.newint
+SMALL_INT_MIN = -5
+SMALL_INT_MAX = 1024
 
 
 class Space(object):
-    def __init__(self):
+    # builtins_w is assigned once, by setup_builtins, after every builtin
+    # is registered
+    _immutable_fields_ = ['small_int_min', 'small_int_max', 'small_ints_w[*]',
+                          'builtins_w[*]']
+
+    def __init__(self, small_int_min=SMALL_INT_MIN,
+                 small_int_max=SMALL_INT_MAX):
         self.w_None = W_None()  # singleton
         self.w_True = W_BoolObject(True)
         self.w_False = W_BoolObject(False)
+        self.small_int_min = small_int_min
+        self.small_int_max = small_int_max
+        self.small_ints_w = [W_IntObject(i) for i in
+                             range(small_int_min, small_int_max + 1)]
         self.w_NotImplemented = W_Root()
+        self.opt_level = 1  # passed to compile_bytecode, see optimizer.py
+        self.bytecode_cache = True  # read and write .qc files, see bytecache.py
+        self.eager_compile = False  # compile functions on load, not first call
+        self.recursion_limit = 10000  # nested frames, see Interpreter.enter
+        self.builtins_hash = -1  # memoized by bytecache.builtins_hash
+        # directories to look for self modules in after the program's
+        # directory, see importer.py
+        self.search_path = []
+        self.output = Output()
 
     def setup(self, interpreter):
         self.interpreter = interpreter
 
     def setup_builtins(self, builtins, coremod, non_builtins):
-        self.builtins_w = []
+        # builtins are not part of the module globals, compiled code loads
+        # them from builtins_w by the index in builtin_index
+        builtins_w = []
         self.builtin_dict = {}
+        self.builtin_index = {}
         for builtin in builtins:
-            self.setup_builtin(wrap_builtin(self, builtin))
+            self.setup_builtin(builtins_w, wrap_builtin(self, builtin))
         self.coremod = coremod
         for non_builtin in non_builtins:
             wrap_builtin(self, non_builtin)
         self.w_exception = self.builtin_dict['Exception']
-        self.w_indexerror = self.make_exception('IndexError')
-        self.w_typeerror = self.make_exception('TypeError')
-        self.w_argerror = self.make_exception('ArgumentError')
-        self.w_attrerror = self.make_exception('AttributeError')
-        self.w_keyerror = self.make_exception('KeyError')
-
-    def setup_builtin(self, builtin):
-        self.builtins_w.append(builtin)
+        self.w_indexerror = self.make_exception(builtins_w, 'IndexError')
+        self.w_typeerror = self.make_exception(builtins_w, 'TypeError')
+        self.w_argerror = self.make_exception(builtins_w, 'ArgumentError')
+        self.w_attrerror = self.make_exception(builtins_w, 'AttributeError')
+        self.w_keyerror = self.make_exception(builtins_w, 'KeyError')
+        self.w_recursionerror = self.make_exception(builtins_w,
+                                                    'RecursionError')
+        self.w_overflowerror = self.make_exception(builtins_w,
+                                                   'OverflowError')
+        self.builtins_w = builtins_w[:]
+        self.builtins_hash = -1
+
+    def setup_builtin(self, builtins_w, builtin):
+        self.builtin_index[builtin.name] = len(builtins_w)
+        builtins_w.append(builtin)
         self.builtin_dict[builtin.name] = builtin
         return builtin
 
     def make_subclass(self, w_tp, name):
         return W_UserType(w_tp.allocate, name, [], w_tp, w_tp.default_alloc)
 
-    def make_exception(self, name, parent=None):
+    def make_exception(self, builtins_w, name, parent=None):
         if parent is None:
             parent = self.w_exception
-        return self.setup_builtin(self.make_subclass(parent, name))
+        return self.setup_builtin(builtins_w, self.make_subclass(parent, name))
 
     def setattr(self, w_obj, attrname, w_value):
         w_obj.setattr(self, attrname, w_value)
@@ -59,9 +96,24 @@ class Space(object):
     def getattr(self, w_obj, attrname):
         w_res = w_obj.getattr(self, attrname)
         if w_res is self.w_NotImplemented:
-            return self.getattr(self.type(w_obj), attrname).bind(self, w_obj)
+            w_type = jit.promote(self.type(w_obj))
+            return self.getattr(w_type, attrname).bind(self, w_obj)
         return w_res
 
+    def load_method(self, w_obj, attrname):
+        """ Like getattr, but returns the unbound callable and the object
+        to pass as the first argument if the attribute is a method. The
+        object is None if the callable should be called as it is.
+        """
+        w_res = w_obj.getattr(self, attrname)
+        if w_res is not self.w_NotImplemented:
+            return w_res, None
+        w_type = jit.promote(self.type(w_obj))
+        w_res = self.getattr(w_type, attrname)
+        if w_res.binds_receiver:
+            return w_res, w_obj
+        return w_res.bind(self, w_obj), None
+
     def setitem(self, w_obj, w_index, w_value):
         w_obj.setitem(self, w_index, w_value)
 
@@ -90,6 +142,10 @@ class Space(object):
 
     # newfoo wrappers
     def newint(self, intval):
+        # in jitted code a fresh object can be virtual, a cached one can't
+        if (not jit.we_are_jitted() and
+                self.small_int_min <= intval <= self.small_int_max):
+            return self.small_ints_w[intval - self.small_int_min]
         return W_IntObject(intval)
 
     def newbool(self, boolval):
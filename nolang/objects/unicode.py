@@ -5,6 +5,8 @@ from nolang.objects.root import W_Root
 
 
 class W_StrObject(W_Root):
+    _immutable_fields_ = ['utf8val']
+
     def __init__(self, utf8val):
         self.utf8val = utf8val
 
@@ -25,3 +27,8 @@ class W_StrObject(W_Root):
                 return space.w_NotImplemented
             raise
         return space.newbool(self.utf8val == other)
+
+    def add(self, space, w_other):
+        if not isinstance(w_other, W_StrObject):
+            raise space.apperr(space.w_typeerror, 'unsupported operand type')
+        return space.newtext(self.utf8val + w_other.utf8val)
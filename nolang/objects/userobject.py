@@ -1,27 +1,44 @@
 """ User supplied objects
 """
 
+from rpython.rlib import jit
+
 from nolang.objects.root import W_Root
+from nolang.objects.usertype import W_UserType
 
 
 class W_UserObject(W_Root):
     def __init__(self, w_type):
+        assert isinstance(w_type, W_UserType)
         self.w_type = w_type
-        self._dict_w = {}
+        self.map = w_type.root_map
+        # slots of declared attributes that were never set stay None
+        self.storage_w = [None] * self.map.size
 
     def gettype(self, space):
         return self.w_type
 
     def setattr(self, space, attrname, w_val):
+        map = jit.promote(self.map)
+        index = map.find(attrname)
+        if index >= 0:
+            self.storage_w[index] = w_val
+            return
         if self.w_type.force_names is not None:
-            if attrname not in self.w_type.force_names:
-                msg = '%s is not an allowed attribute of object of class %s' % (
-                    attrname, self.w_type.name)
-                raise space.apperr(space.w_attrerror, msg)
-        self._dict_w[attrname] = w_val
+            msg = '%s is not an allowed attribute of object of class %s' % (
+                attrname, self.w_type.name)
+            raise space.apperr(space.w_attrerror, msg)
+        self.add_attribute(map.add_attribute(attrname), w_val)
+
+    def add_attribute(self, new_map, w_val):
+        assert new_map.size == len(self.storage_w) + 1
+        self.map = new_map
+        self.storage_w.append(w_val)
 
     def getattr(self, space, attrname):
-        try:
-            return self._dict_w[attrname]
-        except KeyError:
-            return space.w_NotImplemented
+        index = jit.promote(self.map).find(attrname)
+        if index >= 0:
+            w_res = self.storage_w[index]
+            if w_res is not None:
+                return w_res
+        return space.w_NotImplemented
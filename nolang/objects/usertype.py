@@ -1,10 +1,15 @@
 """ Basic declaration of user type defined with class
 """
 
+from rpython.rlib import jit
+
 from nolang.objects.root import W_Root
+from nolang.objects.map import root_map
 
 
 class W_UserType(W_Root):
+    _immutable_fields_ = ['class_elements_w']
+
     def __init__(self, allocate, name, class_elements_w, w_parent,
                  default_alloc=True, force_names=None):
         self.name = name
@@ -18,6 +23,7 @@ class W_UserType(W_Root):
         for item in class_elements_w:
             self._dict_w[item.name] = item
         self.w_parent = w_parent
+        self.root_map = root_map(force_names)
         if force_names is None:
             self.force_names = None
         else:
@@ -41,8 +47,17 @@ class W_UserType(W_Root):
                     " expecting no arguments")
         return w_obj
 
+    @jit.elidable
+    def lookup(self, attrname):
+        # the class dict is never modified after creation, so with a
+        # promoted type and a constant name the JIT can fold this away
+        return self._dict_w.get(attrname, None)
+
     def getattr(self, space, attrname):
-        return self._dict_w[attrname]
+        w_res = self.lookup(attrname)
+        if w_res is None:
+            raise KeyError(attrname)
+        return w_res
 
     def issubclass(self, w_type):
         cur = self
@@ -3,11 +3,15 @@
 
 
 class Opcode(object):
-    def __init__(self, name, numargs, stack_effect, description):
+    def __init__(self, name, numargs, stack_effect, description,
+                 generic=None):
         self.name = name
         self.numargs = numargs
         self.stack_effect = stack_effect
         self.description = description
+        self.generic = generic
+        self.generic_op = -1
+        self.sticky_op = -1  # the _GENERIC version, see Interpreter.deoptimize
 
     def __repr__(self):
         return '<%s>' % self.name
@@ -18,6 +22,8 @@ opcodes = [
     Opcode('LOAD_NONE', 0, 1, 'load None onto stack'),
     Opcode('LOAD_VARIABLE', 1, 1, 'load variable onto stack'),
     Opcode('LOAD_GLOBAL', 1, 1, 'load global variable'),
+    Opcode('LOAD_BUILTIN', 1, 1, 'load builtin from the table shared by all '
+                                 'modules'),
     Opcode('LOAD_CONSTANT', 1, 1, 'load constant onto stack'),
     Opcode('LOAD_TRUE', 0, 1, 'load true onto stack'),
     Opcode('LOAD_FALSE', 0, 1, 'load false onto stack'),
@@ -26,6 +32,9 @@ opcodes = [
     Opcode('GETATTR', 1, 0, 'get attribute from the object on top of the stack '
                             'with string constant as an argument'),
     Opcode('SETATTR', 1, -2, 'set attribute on an object'),
+    Opcode('LOAD_METHOD', 1, 1, 'replace the object on top of the stack with '
+                                'the attribute named by the string constant '
+                                'and the object to pass as self, or None'),
     Opcode('GETITEM', 0, -1, 'get item from the object on top of the stack '
                              'with next value as index'),
     Opcode('SETITEM', 0, -3, 'set item on an object'),
@@ -64,6 +73,8 @@ opcodes = [
     # jumps
     Opcode('JUMP_IF_FALSE', 1, -1, 'pop value from the stack and jump if false'
                                    ' to a given position'),
+    Opcode('JUMP_IF_TRUE', 1, -1, 'pop value from the stack and jump if true'
+                                  ' to a given position'),
     Opcode('JUMP_IF_TRUE_NOPOP', 1, 0, 'peek value from the stack and jump if '
                                        'true to a given position'),
     Opcode('JUMP_IF_FALSE_NOPOP', 1, 0, 'peek value from the stack and jump if '
@@ -71,13 +82,41 @@ opcodes = [
     Opcode('JUMP_ABSOLUTE', 1, 0, 'jump to an absolute position'),
     Opcode('CALL', 1, 255, 'take N arguments from the stack, pack them into'
                            'args and call the next element'),
-    Opcode('RETURN', 0, -1, 'return the top of stack')
+    Opcode('CALL_METHOD', 1, 253, 'take N arguments, the self pushed by '
+                                  'LOAD_METHOD and the callable from the stack'
+                                  ' and call it'),
+    Opcode('RETURN', 0, -1, 'return the top of stack'),
+    # quickened opcodes, never emitted by the compiler, the interpreter
+    # replaces a generic opcode with one of those after seeing the operand
+    # types, see Bytecode.quick_ops
+    Opcode('ADD_INT', 0, -1, 'ADD of two integers', generic='ADD'),
+    Opcode('SUB_INT', 0, -1, 'SUB of two integers', generic='SUB'),
+    Opcode('MUL_INT', 0, -1, 'MUL of two integers', generic='MUL'),
+    Opcode('LT_INT', 0, -1, 'LT of two integers', generic='LT'),
+    Opcode('EQ_INT', 0, -1, 'EQ of two integers', generic='EQ'),
+    Opcode('ADD_STR', 0, -1, 'ADD of two strings', generic='ADD'),
+    Opcode('EQ_STR', 0, -1, 'EQ of two strings', generic='EQ'),
+    # what Interpreter.deoptimize puts back, the generic operation of a site
+    # that saw more than one type of operands, which is not quickened again
+    Opcode('ADD_GENERIC', 0, -1, 'ADD, not quickened', generic='ADD'),
+    Opcode('SUB_GENERIC', 0, -1, 'SUB, not quickened', generic='SUB'),
+    Opcode('MUL_GENERIC', 0, -1, 'MUL, not quickened', generic='MUL'),
+    Opcode('LT_GENERIC', 0, -1, 'LT, not quickened', generic='LT'),
+    Opcode('EQ_GENERIC', 0, -1, 'EQ, not quickened', generic='EQ'),
+    # set by Bytecode.link, not by the interpreter
+    Opcode('CALL_FUNCTION', 1, 255, 'CALL of a function known when linking',
+           generic='CALL'),
 ]
 
 
 def setup():
     for i, opcode in enumerate(opcodes):
         globals()[opcode.name] = i
+    for opcode in opcodes:
+        if opcode.generic is not None:
+            opcode.generic_op = globals()[opcode.generic]
+            if opcode.name.endswith('_GENERIC'):
+                opcodes[opcode.generic_op].sticky_op = globals()[opcode.name]
 
 
 setup()
@@ -0,0 +1,641 @@
+""" Peephole optimizer. Runs over the instructions emitted by
+_BytecodeBuilder, before they are packed into a Bytecode object, and does
+constant folding, jump threading and dead code removal. Jump targets
+(including exception handlers) and lnotab are kept in sync.
+
+With inlining on (-O2) calls of small leaf functions of the same module are
+replaced by the function's code first, see Optimizer.inline. The inlined
+instructions keep their own source positions in lnotab, the ranges they
+end up in are recorded as InlinedCall so tracebacks can show the call.
+"""
+
+from rpython.rlib.rarithmetic import ovfcheck
+
+from nolang import opcodes
+from nolang.constants import IntegerConstant, StringConstant
+
+MAX_PASSES = 4
+# callees up to that many bytes of bytecode are inlined, each function grows
+# by no more than INLINE_BUDGET bytes
+MAX_INLINE_SIZE = 32
+INLINE_BUDGET = 256
+
+# a callee using any of those is not inlined
+NOT_INLINABLE = [opcodes.CALL, opcodes.CALL_METHOD, opcodes.PUSH_RESUME_STACK,
+                 opcodes.POP_RESUME_STACK, opcodes.COMPARE_EXCEPTION,
+                 opcodes.RERAISE, opcodes.PUSH_CURRENT_EXC,
+                 opcodes.CLEAR_CURRENT_EXC]
+
+
+class InlinedCall(object):
+    """ Code of the function name inlined at the call at srcpos, which
+    occupies bytecode positions start to end
+    """
+    _immutable_fields_ = ['name', 'srcpos', 'start', 'end']
+
+    def __init__(self, name, srcpos, start=0, end=0):
+        self.name = name
+        self.srcpos = srcpos
+        self.start = start
+        self.end = end
+
+
+class Instruction(object):
+    """ Single decoded instruction. Jump targets are stored as indexes
+    into the instruction list, not as bytecode positions
+    """
+    def __init__(self, opcode, arg0, arg1, srcpos, inlined=None):
+        self.opcode = opcode
+        self.arg0 = arg0
+        self.arg1 = arg1
+        self.srcpos = srcpos
+        self.inlined = inlined
+
+    def derive(self, opcode, arg0=-1, arg1=-1):
+        """ A new instruction at the same source position
+        """
+        return Instruction(opcode, arg0, arg1, self.srcpos, self.inlined)
+
+    def get_target(self):
+        which = jump_arg(self.opcode)
+        if which == 0:
+            return self.arg0
+        elif which == 1:
+            return self.arg1
+        return -1
+
+    def set_target(self, target):
+        which = jump_arg(self.opcode)
+        if which == 0:
+            self.arg0 = target
+        else:
+            assert which == 1
+            self.arg1 = target
+
+    def size(self):
+        return 1 + 2 * opcodes.opcodes[self.opcode].numargs
+
+    def stack_effect(self):
+        effect = opcodes.opcodes[self.opcode].stack_effect
+        if effect == 255:
+            return -self.arg0
+        elif effect == 254:
+            return -(self.arg0 - 1)
+        elif effect == 253:
+            return -(self.arg0 + 1)
+        return effect
+
+    def resume_stack_effect(self):
+        if self.opcode == opcodes.PUSH_RESUME_STACK:
+            return 1
+        elif self.opcode == opcodes.POP_RESUME_STACK:
+            return -1
+        return 0
+
+
+def jump_arg(opcode):
+    """ Which of the arguments of an opcode is a jump target, -1 for none
+    """
+    if opcode in (opcodes.JUMP_IF_FALSE, opcodes.JUMP_IF_TRUE,
+                  opcodes.JUMP_IF_TRUE_NOPOP, opcodes.JUMP_IF_FALSE_NOPOP,
+                  opcodes.JUMP_ABSOLUTE, opcodes.PUSH_RESUME_STACK):
+        return 0
+    elif opcode == opcodes.COMPARE_EXCEPTION:
+        return 1
+    return -1
+
+
+def uses_constant(opcode):
+    return opcode in (opcodes.LOAD_CONSTANT, opcodes.GETATTR,
+                      opcodes.SETATTR, opcodes.LOAD_METHOD)
+
+
+def ends_block(opcode):
+    return opcode in (opcodes.RETURN, opcodes.RAISE, opcodes.JUMP_ABSOLUTE)
+
+
+def changes_flow(opcode):
+    return jump_arg(opcode) >= 0 or opcode in (
+        opcodes.RETURN, opcodes.RAISE, opcodes.RERAISE,
+        opcodes.POP_RESUME_STACK, opcodes.PUSH_CURRENT_EXC,
+        opcodes.CLEAR_CURRENT_EXC)
+
+
+# returned by call_search_step for the CALL looked for
+CALL_FOUND = -2
+
+
+def call_search_step(op, arg0, depth):
+    """ One instruction of the search for the CALL of a callable with depth
+    values on the stack from it up, in straight line code following the
+    instruction that pushed it, see Bytecode.find_call and
+    Optimizer.find_call. Returns the depth after the instruction,
+    CALL_FOUND if it's the CALL or -1 if the search has to stop there
+    """
+    if op == opcodes.CALL and depth == arg0 + 1:
+        return CALL_FOUND
+    if changes_flow(op):
+        return -1
+    effect = opcodes.opcodes[op].stack_effect
+    if effect == 255:
+        pops, effect = arg0 + 1, -arg0
+    elif effect == 254:
+        pops, effect = arg0, 1 - arg0
+    elif effect == 253:
+        pops, effect = arg0 + 2, -arg0 - 1
+    elif op == opcodes.LOAD_METHOD:
+        pops = 1
+    else:
+        pops = max(0, 1 - effect)  # an upper bound
+    if pops >= depth:
+        return -1
+    return depth + effect
+
+
+def decode(code, lnotab):
+    """ Decode the instructions, with jump targets as indexes into the
+    returned list
+    """
+    instrs = []
+    index_of = [-1] * (len(code) + 1)
+    i = 0
+    while i < len(code):
+        op = ord(code[i])
+        numargs = opcodes.opcodes[op].numargs
+        arg0 = -1
+        arg1 = -1
+        if numargs >= 1:
+            arg0 = (ord(code[i + 1]) << 8) + ord(code[i + 2])
+        if numargs >= 2:
+            arg1 = (ord(code[i + 3]) << 8) + ord(code[i + 4])
+        index_of[i] = len(instrs)
+        instrs.append(Instruction(op, arg0, arg1, lnotab[i]))
+        i += 1 + 2 * numargs
+    index_of[len(code)] = len(instrs)
+    for instr in instrs:
+        target = instr.get_target()
+        if target >= 0:
+            assert index_of[target] >= 0
+            instr.set_target(index_of[target])
+    return instrs
+
+
+class Optimizer(object):
+    def __init__(self, builder, inline=False):
+        self.builder = builder
+        self.inline_calls = inline
+        self.instrs = []
+        self.changed = False
+        self.inline_vars = []
+
+    # decoding and encoding
+
+    def decode(self):
+        self.instrs = decode("".join(self.builder.builder),
+                             self.builder.lnotab)
+
+    def encode(self):
+        positions = [0] * (len(self.instrs) + 1)
+        pos = 0
+        for i in range(len(self.instrs)):
+            positions[i] = pos
+            pos += self.instrs[i].size()
+        positions[len(self.instrs)] = pos
+        self.builder.builder = []
+        self.builder.lnotab = []
+        self.builder.inlined = []
+        start = 0
+        for i in range(len(self.instrs)):
+            instr = self.instrs[i]
+            target = instr.get_target()
+            if target >= 0:
+                instr.set_target(positions[target])
+            self.builder.emit(instr.srcpos, instr.opcode, instr.arg0,
+                              instr.arg1)
+            call = instr.inlined
+            if call is None:
+                continue
+            if i == 0 or self.instrs[i - 1].inlined is not call:
+                start = i
+            if i + 1 == len(self.instrs) or self.instrs[i + 1].inlined is not call:
+                self.builder.inlined.append(InlinedCall(
+                    call.name, call.srcpos, positions[start],
+                    positions[i + 1]))
+
+    # helpers
+
+    def jump_targets(self):
+        targets = [False] * (len(self.instrs) + 1)
+        for instr in self.instrs:
+            target = instr.get_target()
+            if target >= 0:
+                targets[target] = True
+        return targets
+
+    def remap(self, new_instrs, mapping):
+        """ Replace the instruction list, mapping[i] is the new index of
+        what was instruction i (or of the one following it if it's gone)
+        """
+        for instr in new_instrs:
+            target = instr.get_target()
+            if target >= 0:
+                instr.set_target(mapping[target])
+        self.instrs = new_instrs
+
+    def compact(self, keep):
+        mapping = [0] * (len(self.instrs) + 1)
+        new_instrs = []
+        for i in range(len(self.instrs)):
+            mapping[i] = len(new_instrs)
+            if keep[i]:
+                new_instrs.append(self.instrs[i])
+            else:
+                self.changed = True
+        mapping[len(self.instrs)] = len(new_instrs)
+        self.remap(new_instrs, mapping)
+
+    def get_constant(self, instr):
+        if instr.opcode != opcodes.LOAD_CONSTANT:
+            return None
+        return self.builder.constants[instr.arg0]
+
+    def is_constant_load(self, instr):
+        return (instr.opcode == opcodes.LOAD_CONSTANT or
+                instr.opcode == opcodes.LOAD_TRUE or
+                instr.opcode == opcodes.LOAD_FALSE or
+                instr.opcode == opcodes.LOAD_NONE)
+
+    def truth_value(self, instr):
+        """ 1 or 0 if the instruction loads a constant with known truth
+        value, -1 otherwise
+        """
+        if instr.opcode == opcodes.LOAD_TRUE:
+            return 1
+        elif instr.opcode == opcodes.LOAD_FALSE:
+            return 0
+        const = self.get_constant(instr)
+        if isinstance(const, IntegerConstant):
+            if const._intval != 0:
+                return 1
+            return 0
+        return -1
+
+    def load_bool(self, like, value):
+        if value:
+            return like.derive(opcodes.LOAD_TRUE)
+        return like.derive(opcodes.LOAD_FALSE)
+
+    # inlining
+
+    def find_call(self, index, targets):
+        """ Returns the index of the CALL that calls what the instruction at
+        index pushes, -1 if it's not a straight line of code away
+        """
+        depth = 1  # values on the stack from the callable up
+        for i in range(index + 1, len(self.instrs)):
+            if targets[i]:
+                return -1
+            instr = self.instrs[i]
+            depth = call_search_step(instr.opcode, instr.arg0, depth)
+            if depth == CALL_FOUND:
+                return i
+            if depth < 0:
+                return -1
+        return -1
+
+    def add_constant(self, const):
+        if isinstance(const, IntegerConstant):
+            return self.builder.add_int_constant(const._intval)
+        elif isinstance(const, StringConstant):
+            return self.builder.add_str_constant(const._strval)
+        return self.builder.add_constant(const)
+
+    def inline_body(self, w_func, call):
+        """ The instructions replacing call, which store the arguments and
+        run the code of w_func leaving its result on the stack, or None if
+        w_func can't be inlined. Jump targets are relative to the first
+        of them
+        """
+        callee = w_func.bytecode
+        num_args = len(callee.arglist)
+        if (len(callee.bytecode) > MAX_INLINE_SIZE or
+                len(callee.varnames) != num_args or
+                callee.exception_blocks or callee.inlined):
+            return None
+        instrs = decode(callee.bytecode, callee.lnotab[:])
+        last = len(instrs) - 1
+        if instrs[last].opcode != opcodes.RETURN:
+            return None
+        for i in range(last):
+            op = instrs[i].opcode
+            if op in NOT_INLINABLE or op == opcodes.RETURN:
+                return None
+        # the arguments are stored right before the code that uses them,
+        # so all the inlined calls can share the variables
+        while len(self.inline_vars) < num_args:
+            self.inline_vars.append(self.builder.register_variable(
+                "<inlined %d>" % len(self.inline_vars), None))
+        body = []
+        for k in range(num_args - 1, -1, -1):
+            body.append(call.derive(opcodes.STORE, self.inline_vars[k]))
+        inlined = InlinedCall(w_func.name, call.srcpos)
+        for i in range(last):
+            instr = instrs[i]
+            if (instr.opcode == opcodes.LOAD_VARIABLE or
+                    instr.opcode == opcodes.STORE):
+                instr.arg0 = self.inline_vars[instr.arg0]
+            elif uses_constant(instr.opcode):
+                instr.arg0 = self.add_constant(callee._constants[instr.arg0])
+            target = instr.get_target()
+            if target >= 0:
+                # the RETURN is gone, jumps to it continue after the call
+                instr.set_target(num_args + target)
+            instr.inlined = inlined
+            body.append(instr)
+        return body
+
+    def inline(self):
+        """ Replace calls of module functions with their code, where the
+        function is known at compile time, small and a leaf with a single
+        RETURN at the end, see _BytecodeBuilder.get_inline_callee. The
+        LOAD_GLOBAL of the function goes away and the CALL becomes the
+        function's code
+        """
+        targets = self.jump_targets()
+        n = len(self.instrs)
+        bodies = [None] * n
+        dropped = [False] * n
+        budget = INLINE_BUDGET
+        for i in range(n):
+            instr = self.instrs[i]
+            if instr.opcode != opcodes.LOAD_GLOBAL:
+                continue
+            w_func = self.builder.get_inline_callee(instr.arg0)
+            if w_func is None or len(w_func.bytecode.bytecode) > budget:
+                continue
+            call = self.find_call(i, targets)
+            if (call < 0 or
+                    self.instrs[call].arg0 != len(w_func.bytecode.arglist)):
+                continue
+            body = self.inline_body(w_func, self.instrs[call])
+            if body is None:
+                continue
+            budget -= len(w_func.bytecode.bytecode)
+            bodies[call] = body
+            dropped[i] = True
+        mapping = [0] * (n + 1)
+        new_instrs = []
+        own = []
+        for i in range(n):
+            mapping[i] = len(new_instrs)
+            body = bodies[i]
+            if body is not None:
+                start = len(new_instrs)
+                for instr in body:
+                    target = instr.get_target()
+                    if target >= 0:
+                        instr.set_target(start + target)
+                    new_instrs.append(instr)
+            elif not dropped[i]:
+                own.append(self.instrs[i])
+                new_instrs.append(self.instrs[i])
+        mapping[n] = len(new_instrs)
+        for instr in own:
+            target = instr.get_target()
+            if target >= 0:
+                instr.set_target(mapping[target])
+        self.instrs = new_instrs
+
+    # passes
+
+    def fold_binop(self, left, right, instr):
+        """ Return a single instruction that replaces two constant loads
+        followed by a binary operation, or None
+        """
+        op = instr.opcode
+        w_left = self.get_constant(left)
+        w_right = self.get_constant(right)
+        if (isinstance(w_left, IntegerConstant) and
+                isinstance(w_right, IntegerConstant)):
+            a = w_left._intval
+            b = w_right._intval
+            if op == opcodes.LT:
+                return self.load_bool(left, a < b)
+            elif op == opcodes.EQ:
+                return self.load_bool(left, a == b)
+            try:
+                if op == opcodes.ADD:
+                    res = ovfcheck(a + b)
+                elif op == opcodes.SUB:
+                    res = ovfcheck(a - b)
+                elif op == opcodes.MUL:
+                    res = ovfcheck(a * b)
+                elif op == opcodes.TRUEDIV and b != 0:
+                    res = ovfcheck(a // b)
+                else:
+                    return None
+            except OverflowError:
+                return None
+            no = self.builder.add_int_constant(res)
+            return left.derive(opcodes.LOAD_CONSTANT, no)
+        if (isinstance(w_left, StringConstant) and
+                isinstance(w_right, StringConstant)):
+            if op == opcodes.EQ:
+                return self.load_bool(left, w_left._strval == w_right._strval)
+            elif op == opcodes.ADD:
+                no = self.builder.add_str_constant(w_left._strval +
+                                                   w_right._strval)
+                return left.derive(opcodes.LOAD_CONSTANT, no)
+        return None
+
+    def fold_text_build(self, out, out_targeted, instr):
+        """ TEXT_BUILD of constants only, returns the string or None
+        """
+        count = instr.arg0
+        if count > len(out):
+            return None
+        start = len(out) - count
+        parts = []
+        for i in range(start, len(out)):
+            if i > start and out_targeted[i]:
+                return None
+            const = self.get_constant(out[i])
+            if isinstance(const, StringConstant):
+                parts.append(const._strval)
+            elif isinstance(const, IntegerConstant):
+                parts.append(str(const._intval))
+            else:
+                return None
+        return "".join(parts)
+
+    def peephole(self):
+        """ Single pass over instructions that looks at the tail of the
+        already emitted ones. Only the first instruction of any replaced
+        sequence is allowed to be a jump target
+        """
+        targets = self.jump_targets()
+        mapping = [0] * (len(self.instrs) + 1)
+        out = []
+        out_targeted = []
+        for i in range(len(self.instrs)):
+            instr = self.instrs[i]
+            mapping[i] = len(out)
+            op = instr.opcode
+            last = None
+            if out and not targets[i]:
+                last = out[-1]
+            if last is not None:
+                if op == opcodes.DISCARD and self.is_constant_load(last):
+                    # LOAD_NONE; DISCARD and friends
+                    out.pop()
+                    out_targeted.pop()
+                    self.changed = True
+                    continue
+                if (op == opcodes.NOT and
+                        self.truth_value(last) != -1):
+                    out[-1] = self.load_bool(last,
+                                             not self.truth_value(last))
+                    self.changed = True
+                    continue
+                if (op == opcodes.JUMP_IF_FALSE or
+                        op == opcodes.JUMP_IF_TRUE):
+                    if last.opcode == opcodes.NOT:
+                        # invert the branch instead of the value
+                        if op == opcodes.JUMP_IF_FALSE:
+                            new_op = opcodes.JUMP_IF_TRUE
+                        else:
+                            new_op = opcodes.JUMP_IF_FALSE
+                        out[-1] = last.derive(new_op, instr.arg0)
+                        self.changed = True
+                        continue
+                    truth = self.truth_value(last)
+                    if truth != -1:
+                        out.pop()
+                        out_targeted.pop()
+                        if (truth == 0) == (op == opcodes.JUMP_IF_FALSE):
+                            out.append(last.derive(opcodes.JUMP_ABSOLUTE,
+                                                   instr.arg0))
+                            out_targeted.append(False)
+                        self.changed = True
+                        continue
+                if (op in (opcodes.ADD, opcodes.SUB, opcodes.MUL,
+                           opcodes.TRUEDIV, opcodes.LT, opcodes.EQ) and
+                        len(out) >= 2 and not out_targeted[-1]):
+                    new_instr = self.fold_binop(out[-2], last, instr)
+                    if new_instr is not None:
+                        out.pop()
+                        out_targeted.pop()
+                        out[-1] = new_instr
+                        self.changed = True
+                        continue
+                if op == opcodes.TEXT_BUILD:
+                    s = self.fold_text_build(out, out_targeted, instr)
+                    if s is not None:
+                        start = len(out) - instr.arg0
+                        first = out[start]
+                        for j in range(instr.arg0 - 1):
+                            out.pop()
+                            out_targeted.pop()
+                        no = self.builder.add_str_constant(s)
+                        out[start] = first.derive(opcodes.LOAD_CONSTANT, no)
+                        self.changed = True
+                        continue
+            out.append(instr)
+            out_targeted.append(targets[i])
+        mapping[len(self.instrs)] = len(out)
+        self.remap(out, mapping)
+
+    def thread_jumps(self):
+        """ Jumps that land on an unconditional jump go straight to its
+        target instead
+        """
+        for instr in self.instrs:
+            orig_target = instr.get_target()
+            if orig_target < 0:
+                continue
+            target = orig_target
+            steps = 0
+            while (target < len(self.instrs) and steps < len(self.instrs) and
+                   self.instrs[target].opcode == opcodes.JUMP_ABSOLUTE):
+                next_target = self.instrs[target].arg0
+                if next_target == target:
+                    break
+                target = next_target
+                steps += 1
+            if target != orig_target:
+                instr.set_target(target)
+                self.changed = True
+
+    def remove_dead_code(self):
+        """ Remove code that cannot be reached as well as jumps to the next
+        instruction. Dead code is removed only if it does not change the
+        overall stack balance, since Bytecode.compute_stack_depth walks
+        the code linearly
+        """
+        n = len(self.instrs)
+        reachable = [False] * n
+        todo = [0]
+        while todo:
+            i = todo.pop()
+            while i < n and not reachable[i]:
+                reachable[i] = True
+                instr = self.instrs[i]
+                target = instr.get_target()
+                if target >= 0:
+                    todo.append(target)
+                if ends_block(instr.opcode):
+                    break
+                i += 1
+        keep = [True] * n
+        i = 0
+        while i < n:
+            if reachable[i]:
+                instr = self.instrs[i]
+                if (instr.opcode == opcodes.JUMP_ABSOLUTE and
+                        instr.arg0 == i + 1):
+                    keep[i] = False
+                i += 1
+                continue
+            start = i
+            stack = 0
+            resume_stack = 0
+            while i < n and not reachable[i]:
+                stack += self.instrs[i].stack_effect()
+                resume_stack += self.instrs[i].resume_stack_effect()
+                i += 1
+            if stack == 0 and resume_stack == 0:
+                for j in range(start, i):
+                    keep[j] = False
+        self.compact(keep)
+
+    def prune_constants(self):
+        constants = self.builder.constants
+        mapping = [-1] * len(constants)
+        new_constants = []
+        for instr in self.instrs:
+            if uses_constant(instr.opcode):
+                if mapping[instr.arg0] == -1:
+                    mapping[instr.arg0] = len(new_constants)
+                    new_constants.append(constants[instr.arg0])
+                instr.arg0 = mapping[instr.arg0]
+        self.builder.constants = new_constants
+
+    def optimize(self):
+        self.decode()
+        if self.inline_calls:
+            self.inline()
+        for i in range(MAX_PASSES):
+            self.changed = False
+            self.peephole()
+            self.thread_jumps()
+            self.remove_dead_code()
+            if not self.changed:
+                break
+        self.prune_constants()
+        self.encode()
+
+
+def optimize(builder, inline=False):
+    """ Optimize the code in the builder in place
+    """
+    Optimizer(builder, inline).optimize()
@@ -0,0 +1,49 @@
+""" Where a running program's output goes. It's the process's stdout and
+stderr, except in server mode where it's sent to the client, see server.py
+
+Stdout is buffered and written out when BUFFER_SIZE bytes are collected and
+on flush(), which run_code calls when the program ends and server.handle
+at the end of each request. Stderr is not buffered, writing to it flushes
+stdout first so the two stay in order.
+"""
+
+import os
+
+BUFFER_SIZE = 8192
+
+
+def write_all(fd, data):
+    while data:
+        n = os.write(fd, data)
+        assert n >= 0
+        data = data[n:]
+
+
+class Output(object):
+    def __init__(self):
+        self.buffer = []
+        self.buffered = 0  # bytes in buffer
+
+    def write_stdout(self, s):
+        self.buffer.append(s)
+        self.buffered += len(s)
+        if self.buffered >= BUFFER_SIZE:
+            self.flush()
+
+    def write_stderr(self, s):
+        self.flush()
+        self.send_stderr(s)
+
+    def flush(self):
+        if self.buffered == 0:
+            return
+        data = "".join(self.buffer)
+        self.buffer = []
+        self.buffered = 0
+        self.send_stdout(data)
+
+    def send_stdout(self, data):
+        write_all(1, data)
+
+    def send_stderr(self, data):
+        write_all(2, data)
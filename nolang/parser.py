@@ -1,5 +1,11 @@
 
+import json
+import os
+import shutil
+import tempfile
+
 import rply
+from appdirs import AppDirs
 from rpython.rlib.runicode import str_decode_utf_8, unicode_encode_utf_8, UNICHR
 
 from nolang.lexer import TOKENS, ParseError
@@ -23,15 +29,12 @@ def errorhandler(state, lookahead, msg="Parsing error"):
     last_nl = source.rfind("\n", 0, idx)
     lineno = source.count("\n", 0, idx)
     if last_nl < 0:
-        last_nl = 0
+        line_start = 0
         colno = idx - 1
     else:
+        line_start = last_nl + 1
         colno = idx - last_nl - 1
-    next_nl = source.find("\n", idx)
-    if next_nl < 0:
-        next_nl = len(source)
-    line = source[last_nl:next_nl]
-    raise ParseError(msg, line, state.filename, lineno, colno - 1,
+    raise ParseError(msg, source, line_start, state.filename, lineno, colno - 1,
                      (sourcepos[1] - sourcepos[0]) + colno - 1)
 
 
@@ -41,7 +44,18 @@ def hex_to_utf8(s):
 
 
 def get_parser():
-    pg = rply.ParserGenerator(TOKENS, precedence=[
+    pg = make_parser_generator()
+    install_shipped_table(pg)
+    res = pg.build()
+    if res.lr_table.sr_conflicts:
+        raise Exception("shift reduce conflicts")
+    return res
+
+
+def make_parser_generator():
+    # cache_id makes rply keep the LR tables in its user cache directory
+    # and only generate them again when the grammar changes
+    pg = rply.ParserGenerator(TOKENS, cache_id='nolang', precedence=[
         ('left', ['AND']),
         ('left', ['OR']),
         ('left', ['EQ', 'LT', 'GT', 'IN', 'NE']),
@@ -450,7 +464,72 @@ def get_parser():
     def dict_pair_sublist_expression(state, p):
         return ast.ExpressionListPartial([p[1], p[3]] + p[4].get_element_list())
 
-    res = pg.build()
-    if res.lr_table.sr_conflicts:
-        raise Exception("shift reduce conflicts")
-    return res
+    return pg
+
+
+# The functions below only run on the host, either untranslated or when
+# nolang.main is imported at translation time
+
+def table_cache_name(grammar_hash):
+    # the name rply's ParserGenerator.build gives the table cache file
+    return "nolang-%d-%s.json" % (rply.ParserGenerator.VERSION, grammar_hash)
+
+
+def install_shipped_table(pg):
+    """ Copy the tables shipped in nolang.parsetab to rply's table cache
+    unless it has them, so nolang-py does not generate them on a fresh
+    checkout or with an empty cache. rply checks them against the grammar
+    when it reads them, a stale parsetab is ignored. Failing to write is
+    not an error
+    """
+    from nolang import parsetab
+    if parsetab.RPLY_VERSION != pg.VERSION:
+        return
+    cache_dir = AppDirs("rply").user_cache_dir
+    path = os.path.join(cache_dir, table_cache_name(parsetab.GRAMMAR_HASH))
+    if os.path.exists(path):
+        return
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        fd, tmpname = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(parsetab.TABLE)
+        os.rename(tmpname, path)
+    except (IOError, OSError):
+        pass
+
+
+def write_shipped_table(filename):
+    """ Write the module with the tables that ships with the package, the
+    table cache file rply writes for the grammar when its cache is empty
+    """
+    cache_home = tempfile.mkdtemp()
+    os.environ["XDG_CACHE_HOME"] = cache_home
+    try:
+        make_parser_generator().build()
+        cache_dir = AppDirs("rply").user_cache_dir
+        [name] = os.listdir(cache_dir)
+        with open(os.path.join(cache_dir, name)) as f:
+            data = json.dumps(json.load(f), sort_keys=True)
+    finally:
+        shutil.rmtree(cache_home)
+    prefix = table_cache_name("")[:-len(".json")]
+    grammar_hash = name[len(prefix):-len(".json")]
+    assert name == table_cache_name(grammar_hash)
+    lines = ["# Generated by python -m nolang.parser, do not edit\n",
+             "\n",
+             "RPLY_VERSION = %d\n" % rply.ParserGenerator.VERSION,
+             "\n",
+             "GRAMMAR_HASH = %r\n" % str(grammar_hash),
+             "\n",
+             "TABLE = (\n"]
+    for i in range(0, len(data), 72):
+        lines.append("    %r\n" % data[i:i + 72])
+    lines.append(")\n")
+    with open(filename, "w") as f:
+        f.write("".join(lines))
+
+
+if __name__ == '__main__':
+    write_shipped_table(os.path.join(os.path.dirname(__file__), "parsetab.py"))
@@ -0,0 +1,734 @@
+# Generated by python -m nolang.parser, do not edit
+
+RPLY_VERSION = 1
+
+GRAMMAR_HASH = 'bca1704cd8ef4c39b08c0596be6e9690ccd32cdd'
+
+TABLE = (
+    '{"default_reductions": [-2, 0, 0, -4, -3, -6, -5, -7, 0, 0, 0, 0, 0, 0, '
+    '0, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0, 0, -23, 0, 0, 0, 0, 0, -14, -41, 0, -1'
+    '1, 0, -19, 0, 0, -8, -39, 0, 0, -2, 0, 0, 0, 0, 0, -13, 0, -66, -17, 0, '
+    '-18, -15, -43, 0, -63, -63, 0, -54, -54, 0, 0, -54, 0, -68, 0, 0, 0, 0, '
+    '-21, 0, -10, 0, -67, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -14, 0, 0, 0, 0'
+    ', 0, 0, 0, 0, 0, 0, -16, 0, 0, 0, 0, 0, 0, 0, 0, 0, -42, -12, -37, 0, 0,'
+    ' -27, -30, -14, -70, 0, -64, -45, -65, -44, -73, 0, -48, 0, -58, -59, -6'
+    '2, -56, -57, -61, -60, -55, -47, 0, 0, 0, 0, -46, -14, -72, -86, 0, 0, 0'
+    ', -81, 0, 0, 0, 0, 0, -80, 0, 0, 0, 0, -71, 0, -24, 0, 0, 0, -69, 0, 0, '
+    '0, 0, 0, -74, -28, -91, 0, -54, -31, 0, 0, 0, 0, 0, -29, -89, 0, 0, -14,'
+    ' 0, -14, 0, -25, 0, 0, -14, 0, 0, -26, 0, -35, 0, 0, -36, -94, 0, -14, -'
+    '33, 0, 0, -34], "lr_action": [{"$end": -2, "CLASS": -2, "DEF": -2, "IMPO'
+    'RT": -2, "SEMICOLON": -2, "VAR": -2}, {"$end": -1, "CLASS": 8, "DEF": 11'
+    ', "IMPORT": 10, "SEMICOLON": 5, "VAR": 9}, {"$end": 0}, {"$end": -4, "CL'
+    'ASS": -4, "DEF": -4, "IMPORT": -4, "RIGHT_CURLY_BRACE": -4, "SEMICOLON":'
+    ' -4, "VAR": -4}, {"$end": -3, "CLASS": -3, "DEF": -3, "IMPORT": -3, "RIG'
+    'HT_CURLY_BRACE": -3, "SEMICOLON": -3, "VAR": -3}, {"$end": -6, "CLASS": '
+    '-6, "DEF": -6, "IMPORT": -6, "RIGHT_CURLY_BRACE": -6, "SEMICOLON": -6, "'
+    'VAR": -6}, {"$end": -5, "CLASS": -5, "DEF": -5, "IMPORT": -5, "RIGHT_CUR'
+    'LY_BRACE": -5, "SEMICOLON": -5, "VAR": -5}, {"$end": -7, "CLASS": -7, "D'
+    'EF": -7, "IMPORT": -7, "RIGHT_CURLY_BRACE": -7, "SEMICOLON": -7, "VAR": '
+    '-7}, {"IDENTIFIER": 12}, {"IDENTIFIER": 13}, {"IDENTIFIER": 14}, {"IDENT'
+    'IFIER": 15}, {"LEFT_CURLY_BRACE": 16, "LEFT_PAREN": 17}, {"COLON": 18, "'
+    'COMMA": -22, "SEMICOLON": -22}, {"DOT": 21, "LEFT_CURLY_BRACE": -40, "SE'
+    'MICOLON": -40}, {"LEFT_PAREN": 23}, {"CLASS": -2, "DEF": -2, "IMPORT": -'
+    '2, "RIGHT_CURLY_BRACE": -2, "SEMICOLON": -2, "VAR": -2}, {"IDENTIFIER": '
+    '25}, {"IDENTIFIER": 26}, {"COMMA": 28, "SEMICOLON": -20}, {"LEFT_CURLY_B'
+    'RACE": 29, "SEMICOLON": -9}, {"IDENTIFIER": 31}, {"LEFT_CURLY_BRACE": 32'
+    '}, {"IDENTIFIER": 34, "RIGHT_PAREN": 33}, {"CLASS": 8, "DEF": 11, "IMPOR'
+    'T": 10, "RIGHT_CURLY_BRACE": 35, "SEMICOLON": 5, "VAR": 9}, {"RIGHT_PARE'
+    'N": 36}, {"COMMA": -23, "RIGHT_PAREN": -23, "SEMICOLON": -23}, {"SEMICOL'
+    'ON": 37}, {"IDENTIFIER": 38}, {"IDENTIFIER": 39}, {"SEMICOLON": 40}, {"D'
+    'OT": 21, "LEFT_CURLY_BRACE": -40, "SEMICOLON": -40}, {"FALSE": -14, "IDE'
+    'NTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14, "LEFT'
+    '_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN": -14, "'
+    'RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "ST_INTE'
+    'RP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14, "ST_S'
+    'Q_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14}, {"LE'
+    'FT_CURLY_BRACE": -41}, {"COLON": 18, "COMMA": -22, "RIGHT_PAREN": -22}, '
+    '{"$end": -11, "CLASS": -11, "DEF": -11, "IMPORT": -11, "RIGHT_CURLY_BRAC'
+    'E": -11, "SEMICOLON": -11, "VAR": -11}, {"LEFT_CURLY_BRACE": 44}, {"$end'
+    '": -19, "CLASS": -19, "DEF": -19, "FALSE": -19, "IDENTIFIER": -19, "IF":'
+    ' -19, "IMPORT": -19, "INTEGER": -19, "LEFT_CURLY_BRACE": -19, "LEFT_PARE'
+    'N": -19, "LEFT_SQUARE_BRACKET": -19, "RAISE": -19, "RETURN": -19, "RIGHT'
+    '_CURLY_BRACE": -19, "SEMICOLON": -19, "ST_DQ_STRING": -19, "ST_INTERP_ST'
+    'RING": -19, "ST_RAW_DQ_STRING": -19, "ST_RAW_SQ_STRING": -19, "ST_SQ_STR'
+    'ING": -19, "TRUE": -19, "TRY": -19, "VAR": -19, "WHILE": -19}, {"COLON":'
+    ' 18, "COMMA": -22, "RIGHT_PAREN": -22, "SEMICOLON": -22}, {"COMMA": 46, '
+    '"RIGHT_CURLY_BRACE": -38}, {"$end": -8, "CLASS": -8, "DEF": -8, "IMPORT"'
+    ': -8, "RIGHT_CURLY_BRACE": -8, "SEMICOLON": -8, "VAR": -8}, {"LEFT_CURLY'
+    '_BRACE": -39, "SEMICOLON": -39}, {"FALSE": 68, "IDENTIFIER": 58, "IF": 6'
+    '7, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE'
+    '_BRACKET": 69, "RAISE": 49, "RETURN": 48, "RIGHT_CURLY_BRACE": 50, "SEMI'
+    'COLON": 53, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRIN'
+    'G": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52, "TRY": 6'
+    '4, "VAR": 9, "WHILE": 51}, {"COMMA": 28, "RIGHT_PAREN": -20}, {"CLASS": '
+    '-2, "DEF": -2, "IMPORT": -2, "RIGHT_CURLY_BRACE": -2, "SEMICOLON": -2, "'
+    'VAR": -2}, {"COMMA": 28, "RIGHT_PAREN": -20, "SEMICOLON": -20}, {"IDENTI'
+    'FIER": 74}, {"RIGHT_CURLY_BRACE": 75}, {"FALSE": 68, "IDENTIFIER": 77, "'
+    'INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRA'
+    'CKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING'
+    '": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE"'
+    ': 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAR'
+    'EN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRIN'
+    'G": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": '
+    '66, "TRUE": 52}, {"$end": -13, "CLASS": -13, "DEF": -13, "IMPORT": -13, '
+    '"RIGHT_CURLY_BRACE": -13, "SEMICOLON": -13, "VAR": -13}, {"FALSE": 68, "'
+    'IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54'
+    ', "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62,'
+    ' "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TR'
+    'UE": 52}, {"AND": -66, "COLON": -66, "COMMA": -66, "DOT": -66, "EQ": -66'
+    ', "GT": -66, "IN": -66, "LEFT_CURLY_BRACE": -66, "LEFT_PAREN": -66, "LEF'
+    'T_SQUARE_BRACKET": -66, "LT": -66, "MINUS": -66, "NE": -66, "NOT": -66, '
+    '"OR": -66, "PLUS": -66, "RIGHT_CURLY_BRACE": -66, "RIGHT_PAREN": -66, "R'
+    'IGHT_SQUARE_BRACKET": -66, "SEMICOLON": -66, "STAR": -66, "TRUEDIV": -66'
+    '}, {"FALSE": -17, "IDENTIFIER": -17, "IF": -17, "INTEGER": -17, "LEFT_CU'
+    'RLY_BRACE": -17, "LEFT_PAREN": -17, "LEFT_SQUARE_BRACKET": -17, "RAISE":'
+    ' -17, "RETURN": -17, "RIGHT_CURLY_BRACE": -17, "SEMICOLON": -17, "ST_DQ_'
+    'STRING": -17, "ST_INTERP_STRING": -17, "ST_RAW_DQ_STRING": -17, "ST_RAW_'
+    'SQ_STRING": -17, "ST_SQ_STRING": -17, "TRUE": -17, "TRY": -17, "VAR": -1'
+    '7, "WHILE": -17}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_C'
+    'URLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STR'
+    'ING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STR'
+    'ING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": -18, "IDENTIFIER": '
+    '-18, "IF": -18, "INTEGER": -18, "LEFT_CURLY_BRACE": -18, "LEFT_PAREN": -'
+    '18, "LEFT_SQUARE_BRACKET": -18, "RAISE": -18, "RETURN": -18, "RIGHT_CURL'
+    'Y_BRACE": -18, "SEMICOLON": -18, "ST_DQ_STRING": -18, "ST_INTERP_STRING"'
+    ': -18, "ST_RAW_DQ_STRING": -18, "ST_RAW_SQ_STRING": -18, "ST_SQ_STRING":'
+    ' -18, "TRUE": -18, "TRY": -18, "VAR": -18, "WHILE": -18}, {"FALSE": -15,'
+    ' "IDENTIFIER": -15, "IF": -15, "INTEGER": -15, "LEFT_CURLY_BRACE": -15, '
+    '"LEFT_PAREN": -15, "LEFT_SQUARE_BRACKET": -15, "RAISE": -15, "RETURN": -'
+    '15, "RIGHT_CURLY_BRACE": -15, "SEMICOLON": -15, "ST_DQ_STRING": -15, "ST'
+    '_INTERP_STRING": -15, "ST_RAW_DQ_STRING": -15, "ST_RAW_SQ_STRING": -15, '
+    '"ST_SQ_STRING": -15, "TRUE": -15, "TRY": -15, "VAR": -15, "WHILE": -15},'
+    ' {"AND": -43, "COLON": -43, "COMMA": -43, "EQ": -43, "GT": -43, "IN": -4'
+    '3, "LEFT_CURLY_BRACE": -43, "LT": -43, "MINUS": -43, "NE": -43, "NOT": -'
+    '43, "OR": -43, "PLUS": -43, "RIGHT_CURLY_BRACE": -43, "RIGHT_PAREN": -43'
+    ', "RIGHT_SQUARE_BRACKET": -43, "SEMICOLON": -43, "STAR": -43, "TRUEDIV":'
+    ' -43}, {"AND": -67, "ASSIGN": 82, "DOT": -67, "EQ": -67, "GT": -67, "IN"'
+    ': -67, "LEFT_PAREN": -67, "LEFT_SQUARE_BRACKET": -67, "LT": -67, "MINUS"'
+    ': -67, "NE": -67, "NOT": -67, "OR": -67, "PLUS": -67, "SEMICOLON": -67, '
+    '"STAR": -67, "TRUEDIV": -67}, {"RAW_CHAR": -63, "RAW_ESC": -63, "ST_ENDR'
+    'AW": -63}, {"RAW_CHAR": -63, "RAW_ESC": -63, "ST_ENDRAW": -63}, {"FALSE"'
+    ': 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAR'
+    'EN": 54, "LEFT_SQUARE_BRACKET": 69, "RIGHT_CURLY_BRACE": -90, "ST_DQ_STR'
+    'ING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STR'
+    'ING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"CHAR": -54, "ESC_ESC": -54,'
+    ' "ESC_HEX_16": -54, "ESC_HEX_8": -54, "ESC_HEX_ANY": -54, "ESC_QUOTE": -'
+    '54, "ESC_SIMPLE": -54, "ESC_UNRECOGNISED": -54, "ST_ENDSTRING": -54, "ST'
+    '_INTERP": -54}, {"CHAR": -54, "ESC_ESC": -54, "ESC_HEX_16": -54, "ESC_HE'
+    'X_8": -54, "ESC_HEX_ANY": -54, "ESC_QUOTE": -54, "ESC_SIMPLE": -54, "ESC'
+    '_UNRECOGNISED": -54, "ST_ENDSTRING": -54}, {"LEFT_CURLY_BRACE": 90}, {"A'
+    'ND": -49, "DOT": 93, "EQ": -49, "GT": -49, "IN": -49, "LEFT_PAREN": 91, '
+    '"LEFT_SQUARE_BRACKET": 92, "LT": -49, "MINUS": -49, "NE": -49, "NOT": -4'
+    '9, "OR": -49, "PLUS": -49, "SEMICOLON": -49, "STAR": -49, "TRUEDIV": -49'
+    '}, {"CHAR": -54, "ESC_ESC": -54, "ESC_HEX_16": -54, "ESC_HEX_8": -54, "E'
+    'SC_HEX_ANY": -54, "ESC_QUOTE": -54, "ESC_SIMPLE": -54, "ESC_UNRECOGNISED'
+    '": -54, "ST_ENDSTRING": -54}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER":'
+    ' 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69'
+    ', "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "S'
+    'T_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"AND": -68, "COL'
+    'ON": -68, "COMMA": -68, "DOT": -68, "EQ": -68, "GT": -68, "IN": -68, "LE'
+    'FT_CURLY_BRACE": -68, "LEFT_PAREN": -68, "LEFT_SQUARE_BRACKET": -68, "LT'
+    '": -68, "MINUS": -68, "NE": -68, "NOT": -68, "OR": -68, "PLUS": -68, "RI'
+    'GHT_CURLY_BRACE": -68, "RIGHT_PAREN": -68, "RIGHT_SQUARE_BRACKET": -68, '
+    '"SEMICOLON": -68, "STAR": -68, "TRUEDIV": -68}, {"FALSE": 68, "IDENTIFIE'
+    'R": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_S'
+    'QUARE_BRACKET": 69, "RIGHT_SQUARE_BRACKET": -85, "ST_DQ_STRING": 63, "ST'
+    '_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST'
+    '_SQ_STRING": 66, "TRUE": 52}, {"AND": 98, "EQ": 102, "GT": 99, "IN": 108'
+    ', "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": 106'
+    ', "SEMICOLON": 101, "STAR": 100, "TRUEDIV": 107}, {"RIGHT_PAREN": 111}, '
+    '{"CLASS": 8, "DEF": 11, "IMPORT": 10, "RIGHT_CURLY_BRACE": 112, "SEMICOL'
+    'ON": 5, "VAR": 9}, {"RIGHT_PAREN": -21, "SEMICOLON": -21}, {"COMMA": 46,'
+    ' "RIGHT_CURLY_BRACE": -38}, {"SEMICOLON": -10}, {"AND": -49, "COLON": -4'
+    '9, "COMMA": -49, "DOT": 115, "EQ": -49, "GT": -49, "IN": -49, "LEFT_CURL'
+    'Y_BRACE": -49, "LEFT_PAREN": 91, "LEFT_SQUARE_BRACKET": 114, "LT": -49, '
+    '"MINUS": -49, "NE": -49, "NOT": -49, "OR": -49, "PLUS": -49, "RIGHT_CURL'
+    'Y_BRACE": -49, "RIGHT_PAREN": -49, "RIGHT_SQUARE_BRACKET": -49, "SEMICOL'
+    'ON": -49, "STAR": -49, "TRUEDIV": -49}, {"AND": -67, "COLON": -67, "COMM'
+    'A": -67, "DOT": -67, "EQ": -67, "GT": -67, "IN": -67, "LEFT_CURLY_BRACE"'
+    ': -67, "LEFT_PAREN": -67, "LEFT_SQUARE_BRACKET": -67, "LT": -67, "MINUS"'
+    ': -67, "NE": -67, "NOT": -67, "OR": -67, "PLUS": -67, "RIGHT_CURLY_BRACE'
+    '": -67, "RIGHT_PAREN": -67, "RIGHT_SQUARE_BRACKET": -67, "SEMICOLON": -6'
+    '7, "STAR": -67, "TRUEDIV": -67}, {"AND": 98, "EQ": 102, "GT": 99, "IN": '
+    '108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": '
+    '106, "SEMICOLON": 116, "STAR": 100, "TRUEDIV": 107}, {"AND": 98, "EQ": 1'
+    '02, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109,'
+    ' "OR": 110, "PLUS": 106, "SEMICOLON": 117, "STAR": 100, "TRUEDIV": 107},'
+    ' {"AND": 98, "EQ": 102, "GT": 99, "IN": 108, "LEFT_CURLY_BRACE": 118, "L'
+    'T": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": 106, "S'
+    'TAR": 100, "TRUEDIV": 107}, {"AND": 98, "EQ": 102, "GT": 99, "IN": 108, '
+    '"LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": 106, '
+    '"RIGHT_PAREN": 119, "STAR": 100, "TRUEDIV": 107}, {"FALSE": 68, "IDENTIF'
+    'IER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT'
+    '_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RA'
+    'W_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52'
+    '}, {"RAW_CHAR": 121, "RAW_ESC": 123, "ST_ENDRAW": 122}, {"RAW_CHAR": 121'
+    ', "RAW_ESC": 123, "ST_ENDRAW": 124}, {"RIGHT_CURLY_BRACE": 125}, {"AND":'
+    ' 98, "COLON": 126, "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 1'
+    '04, "NE": 103, "NOT": 109, "OR": 110, "PLUS": 106, "STAR": 100, "TRUEDIV'
+    '": 107}, {"ST_ENDSTRING": 127, "ST_INTERP": 128}, {"CHAR": 131, "ESC_ESC'
+    '": 132, "ESC_HEX_16": 129, "ESC_HEX_8": 130, "ESC_HEX_ANY": 135, "ESC_QU'
+    'OTE": 136, "ESC_SIMPLE": 133, "ESC_UNRECOGNISED": 134, "ST_ENDSTRING": -'
+    '52, "ST_INTERP": -52}, {"CHAR": 131, "ESC_ESC": 132, "ESC_HEX_16": 129, '
+    '"ESC_HEX_8": 130, "ESC_HEX_ANY": 135, "ESC_QUOTE": 136, "ESC_SIMPLE": 13'
+    '3, "ESC_UNRECOGNISED": 134, "ST_ENDSTRING": 137}, {"FALSE": -14, "IDENTI'
+    'FIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14, "LEFT_PA'
+    'REN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN": -14, "RIG'
+    'HT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "ST_INTERP_'
+    'STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14, "ST_SQ_S'
+    'TRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14}, {"FALSE'
+    '": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PA'
+    'REN": 54, "LEFT_SQUARE_BRACKET": 69, "RIGHT_PAREN": -85, "ST_DQ_STRING":'
+    ' 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING":'
+    ' 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 77, "I'
+    'NTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRAC'
+    'KET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING"'
+    ': 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"IDENTIF'
+    'IER": 141}, {"CHAR": 131, "ESC_ESC": 132, "ESC_HEX_16": 129, "ESC_HEX_8"'
+    ': 130, "ESC_HEX_ANY": 135, "ESC_QUOTE": 136, "ESC_SIMPLE": 133, "ESC_UNR'
+    'ECOGNISED": 134, "ST_ENDSTRING": 142}, {"AND": 98, "EQ": 102, "GT": 99, '
+    '"IN": 108, "LEFT_CURLY_BRACE": 143, "LT": 105, "MINUS": 104, "NE": 103, '
+    '"NOT": 109, "OR": 110, "PLUS": 106, "STAR": 100, "TRUEDIV": 107}, {"RIGH'
+    'T_SQUARE_BRACKET": 144}, {"AND": 98, "COMMA": 146, "EQ": 102, "GT": 99, '
+    '"IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "P'
+    'LUS": 106, "RIGHT_PAREN": -88, "RIGHT_SQUARE_BRACKET": -88, "STAR": 100,'
+    ' "TRUEDIV": 107}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_C'
+    'URLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STR'
+    'ING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STR'
+    'ING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 7'
+    '7, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE'
+    '_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_ST'
+    'RING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FA'
+    'LSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT'
+    '_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_S'
+    'TRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRIN'
+    'G": 66, "TRUE": 52}, {"FALSE": -16, "IDENTIFIER": -16, "IF": -16, "INTEG'
+    'ER": -16, "LEFT_CURLY_BRACE": -16, "LEFT_PAREN": -16, "LEFT_SQUARE_BRACK'
+    'ET": -16, "RAISE": -16, "RETURN": -16, "RIGHT_CURLY_BRACE": -16, "SEMICO'
+    'LON": -16, "ST_DQ_STRING": -16, "ST_INTERP_STRING": -16, "ST_RAW_DQ_STRI'
+    'NG": -16, "ST_RAW_SQ_STRING": -16, "ST_SQ_STRING": -16, "TRUE": -16, "TR'
+    'Y": -16, "VAR": -16, "WHILE": -16}, {"FALSE": 68, "IDENTIFIER": 77, "INT'
+    'EGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKE'
+    'T": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": '
+    '59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 6'
+    '8, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN"'
+    ': 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING":'
+    ' 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66,'
+    ' "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY'
+    '_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING"'
+    ': 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING"'
+    ': 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 77, "'
+    'INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRA'
+    'CKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING'
+    '": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE"'
+    ': 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAR'
+    'EN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRIN'
+    'G": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": '
+    '66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CU'
+    'RLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRI'
+    'NG": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRI'
+    'NG": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER": 77'
+    ', "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_'
+    'BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STR'
+    'ING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"IN"'
+    ': 157}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE'
+    '": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, '
+    '"ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, '
+    '"ST_SQ_STRING": 66, "TRUE": 52}, {"LEFT_CURLY_BRACE": -42}, {"$end": -12'
+    ', "CLASS": -12, "DEF": -12, "IMPORT": -12, "RIGHT_CURLY_BRACE": -12, "SE'
+    'MICOLON": -12, "VAR": -12}, {"RIGHT_CURLY_BRACE": -37}, {"FALSE": 68, "I'
+    'DENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54,'
+    ' "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, '
+    '"ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRU'
+    'E": 52}, {"IDENTIFIER": 160}, {"FALSE": -27, "IDENTIFIER": -27, "IF": -2'
+    '7, "INTEGER": -27, "LEFT_CURLY_BRACE": -27, "LEFT_PAREN": -27, "LEFT_SQU'
+    'ARE_BRACKET": -27, "RAISE": -27, "RETURN": -27, "RIGHT_CURLY_BRACE": -27'
+    ', "SEMICOLON": -27, "ST_DQ_STRING": -27, "ST_INTERP_STRING": -27, "ST_RA'
+    'W_DQ_STRING": -27, "ST_RAW_SQ_STRING": -27, "ST_SQ_STRING": -27, "TRUE":'
+    ' -27, "TRY": -27, "VAR": -27, "WHILE": -27}, {"FALSE": -30, "IDENTIFIER"'
+    ': -30, "IF": -30, "INTEGER": -30, "LEFT_CURLY_BRACE": -30, "LEFT_PAREN":'
+    ' -30, "LEFT_SQUARE_BRACKET": -30, "RAISE": -30, "RETURN": -30, "RIGHT_CU'
+    'RLY_BRACE": -30, "SEMICOLON": -30, "ST_DQ_STRING": -30, "ST_INTERP_STRIN'
+    'G": -30, "ST_RAW_DQ_STRING": -30, "ST_RAW_SQ_STRING": -30, "ST_SQ_STRING'
+    '": -30, "TRUE": -30, "TRY": -30, "VAR": -30, "WHILE": -30}, {"FALSE": -1'
+    '4, "IDENTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14'
+    ', "LEFT_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN":'
+    ' -14, "RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "'
+    'ST_INTERP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14'
+    ', "ST_SQ_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14'
+    '}, {"AND": -70, "COLON": -70, "COMMA": -70, "DOT": -70, "EQ": -70, "GT":'
+    ' -70, "IN": -70, "LEFT_CURLY_BRACE": -70, "LEFT_PAREN": -70, "LEFT_SQUAR'
+    'E_BRACKET": -70, "LT": -70, "MINUS": -70, "NE": -70, "NOT": -70, "OR": -'
+    '70, "PLUS": -70, "RIGHT_CURLY_BRACE": -70, "RIGHT_PAREN": -70, "RIGHT_SQ'
+    'UARE_BRACKET": -70, "SEMICOLON": -70, "STAR": -70, "TRUEDIV": -70}, {"AN'
+    'D": 98, "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 1'
+    '03, "NOT": 109, "OR": 110, "PLUS": 106, "SEMICOLON": 162, "STAR": 100, "'
+    'TRUEDIV": 107}, {"RAW_CHAR": -64, "RAW_ESC": -64, "ST_ENDRAW": -64}, {"A'
+    'ND": -45, "COLON": -45, "COMMA": -45, "EQ": -45, "GT": -45, "IN": -45, "'
+    'LEFT_CURLY_BRACE": -45, "LT": -45, "MINUS": -45, "NE": -45, "NOT": -45, '
+    '"OR": -45, "PLUS": -45, "RIGHT_CURLY_BRACE": -45, "RIGHT_PAREN": -45, "R'
+    'IGHT_SQUARE_BRACKET": -45, "SEMICOLON": -45, "STAR": -45, "TRUEDIV": -45'
+    '}, {"RAW_CHAR": -65, "RAW_ESC": -65, "ST_ENDRAW": -65}, {"AND": -44, "CO'
+    'LON": -44, "COMMA": -44, "EQ": -44, "GT": -44, "IN": -44, "LEFT_CURLY_BR'
+    'ACE": -44, "LT": -44, "MINUS": -44, "NE": -44, "NOT": -44, "OR": -44, "P'
+    'LUS": -44, "RIGHT_CURLY_BRACE": -44, "RIGHT_PAREN": -44, "RIGHT_SQUARE_B'
+    'RACKET": -44, "SEMICOLON": -44, "STAR": -44, "TRUEDIV": -44}, {"AND": -7'
+    '3, "COLON": -73, "COMMA": -73, "DOT": -73, "EQ": -73, "GT": -73, "IN": -'
+    '73, "LEFT_CURLY_BRACE": -73, "LEFT_PAREN": -73, "LEFT_SQUARE_BRACKET": -'
+    '73, "LT": -73, "MINUS": -73, "NE": -73, "NOT": -73, "OR": -73, "PLUS": -'
+    '73, "RIGHT_CURLY_BRACE": -73, "RIGHT_PAREN": -73, "RIGHT_SQUARE_BRACKET"'
+    ': -73, "SEMICOLON": -73, "STAR": -73, "TRUEDIV": -73}, {"FALSE": 68, "ID'
+    'ENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, '
+    '"LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "'
+    'ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE'
+    '": 52}, {"AND": -48, "COLON": -48, "COMMA": -48, "EQ": -48, "GT": -48, "'
+    'IN": -48, "LEFT_CURLY_BRACE": -48, "LT": -48, "MINUS": -48, "NE": -48, "'
+    'NOT": -48, "OR": -48, "PLUS": -48, "RIGHT_CURLY_BRACE": -48, "RIGHT_PARE'
+    'N": -48, "RIGHT_SQUARE_BRACKET": -48, "SEMICOLON": -48, "STAR": -48, "TR'
+    'UEDIV": -48}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY'
+    '_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_STRING"'
+    ': 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING"'
+    ': 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"CHAR": -58, "ESC_ESC": -58, "ES'
+    'C_HEX_16": -58, "ESC_HEX_8": -58, "ESC_HEX_ANY": -58, "ESC_QUOTE": -58, '
+    '"ESC_SIMPLE": -58, "ESC_UNRECOGNISED": -58, "ST_ENDSTRING": -58, "ST_INT'
+    'ERP": -58}, {"CHAR": -59, "ESC_ESC": -59, "ESC_HEX_16": -59, "ESC_HEX_8"'
+    ': -59, "ESC_HEX_ANY": -59, "ESC_QUOTE": -59, "ESC_SIMPLE": -59, "ESC_UNR'
+    'ECOGNISED": -59, "ST_ENDSTRING": -59, "ST_INTERP": -59}, {"CHAR": -62, "'
+    'ESC_ESC": -62, "ESC_HEX_16": -62, "ESC_HEX_8": -62, "ESC_HEX_ANY": -62, '
+    '"ESC_QUOTE": -62, "ESC_SIMPLE": -62, "ESC_UNRECOGNISED": -62, "ST_ENDSTR'
+    'ING": -62, "ST_INTERP": -62}, {"CHAR": -56, "ESC_ESC": -56, "ESC_HEX_16"'
+    ': -56, "ESC_HEX_8": -56, "ESC_HEX_ANY": -56, "ESC_QUOTE": -56, "ESC_SIMP'
+    'LE": -56, "ESC_UNRECOGNISED": -56, "ST_ENDSTRING": -56, "ST_INTERP": -56'
+    '}, {"CHAR": -57, "ESC_ESC": -57, "ESC_HEX_16": -57, "ESC_HEX_8": -57, "E'
+    'SC_HEX_ANY": -57, "ESC_QUOTE": -57, "ESC_SIMPLE": -57, "ESC_UNRECOGNISED'
+    '": -57, "ST_ENDSTRING": -57, "ST_INTERP": -57}, {"CHAR": -61, "ESC_ESC":'
+    ' -61, "ESC_HEX_16": -61, "ESC_HEX_8": -61, "ESC_HEX_ANY": -61, "ESC_QUOT'
+    'E": -61, "ESC_SIMPLE": -61, "ESC_UNRECOGNISED": -61, "ST_ENDSTRING": -61'
+    ', "ST_INTERP": -61}, {"CHAR": -60, "ESC_ESC": -60, "ESC_HEX_16": -60, "E'
+    'SC_HEX_8": -60, "ESC_HEX_ANY": -60, "ESC_QUOTE": -60, "ESC_SIMPLE": -60,'
+    ' "ESC_UNRECOGNISED": -60, "ST_ENDSTRING": -60, "ST_INTERP": -60}, {"CHAR'
+    '": -55, "ESC_ESC": -55, "ESC_HEX_16": -55, "ESC_HEX_8": -55, "ESC_HEX_AN'
+    'Y": -55, "ESC_QUOTE": -55, "ESC_SIMPLE": -55, "ESC_UNRECOGNISED": -55, "'
+    'ST_ENDSTRING": -55, "ST_INTERP": -55}, {"AND": -47, "COLON": -47, "COMMA'
+    '": -47, "EQ": -47, "GT": -47, "IN": -47, "LEFT_CURLY_BRACE": -47, "LT": '
+    '-47, "MINUS": -47, "NE": -47, "NOT": -47, "OR": -47, "PLUS": -47, "RIGHT'
+    '_CURLY_BRACE": -47, "RIGHT_PAREN": -47, "RIGHT_SQUARE_BRACKET": -47, "SE'
+    'MICOLON": -47, "STAR": -47, "TRUEDIV": -47}, {"FALSE": 68, "IDENTIFIER":'
+    ' 58, "IF": 67, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, '
+    '"LEFT_SQUARE_BRACKET": 69, "RAISE": 49, "RETURN": 48, "RIGHT_CURLY_BRACE'
+    '": 165, "SEMICOLON": 53, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST'
+    '_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE":'
+    ' 52, "TRY": 64, "VAR": 9, "WHILE": 51}, {"RIGHT_PAREN": 166}, {"AND": 98'
+    ', "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "N'
+    'OT": 109, "OR": 110, "PLUS": 106, "RIGHT_SQUARE_BRACKET": 167, "STAR": 1'
+    '00, "TRUEDIV": 107}, {"AND": -71, "ASSIGN": 168, "DOT": -71, "EQ": -71, '
+    '"GT": -71, "IN": -71, "LEFT_PAREN": -71, "LEFT_SQUARE_BRACKET": -71, "LT'
+    '": -71, "MINUS": -71, "NE": -71, "NOT": -71, "OR": -71, "PLUS": -71, "SE'
+    'MICOLON": -71, "STAR": -71, "TRUEDIV": -71}, {"AND": -46, "COLON": -46, '
+    '"COMMA": -46, "EQ": -46, "GT": -46, "IN": -46, "LEFT_CURLY_BRACE": -46, '
+    '"LT": -46, "MINUS": -46, "NE": -46, "NOT": -46, "OR": -46, "PLUS": -46, '
+    '"RIGHT_CURLY_BRACE": -46, "RIGHT_PAREN": -46, "RIGHT_SQUARE_BRACKET": -4'
+    '6, "SEMICOLON": -46, "STAR": -46, "TRUEDIV": -46}, {"FALSE": -14, "IDENT'
+    'IFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14, "LEFT_P'
+    'AREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN": -14, "RI'
+    'GHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "ST_INTERP'
+    '_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14, "ST_SQ_'
+    'STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14}, {"AND"'
+    ': -72, "COLON": -72, "COMMA": -72, "DOT": -72, "EQ": -72, "GT": -72, "IN'
+    '": -72, "LEFT_CURLY_BRACE": -72, "LEFT_PAREN": -72, "LEFT_SQUARE_BRACKET'
+    '": -72, "LT": -72, "MINUS": -72, "NE": -72, "NOT": -72, "OR": -72, "PLUS'
+    '": -72, "RIGHT_CURLY_BRACE": -72, "RIGHT_PAREN": -72, "RIGHT_SQUARE_BRAC'
+    'KET": -72, "SEMICOLON": -72, "STAR": -72, "TRUEDIV": -72}, {"RIGHT_PAREN'
+    '": -86, "RIGHT_SQUARE_BRACKET": -86}, {"FALSE": 68, "IDENTIFIER": 77, "I'
+    'NTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRAC'
+    'KET": 69, "RIGHT_PAREN": -87, "RIGHT_SQUARE_BRACKET": -87, "ST_DQ_STRING'
+    '": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING'
+    '": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"AND": -51, "COLON": -51, "COMM'
+    'A": -51, "EQ": 102, "GT": 99, "IN": 108, "LEFT_CURLY_BRACE": -51, "LT": '
+    '105, "MINUS": 104, "NE": 103, "NOT": -51, "OR": 110, "PLUS": 106, "RIGHT'
+    '_CURLY_BRACE": -51, "RIGHT_PAREN": -51, "RIGHT_SQUARE_BRACKET": -51, "SE'
+    'MICOLON": -51, "STAR": 100, "TRUEDIV": 107}, {"AND": -78, "COLON": -78, '
+    '"COMMA": -78, "EQ": -78, "GT": -78, "IN": -78, "LEFT_CURLY_BRACE": -78, '
+    '"LT": -78, "MINUS": 104, "NE": -78, "NOT": -78, "OR": -78, "PLUS": 106, '
+    '"RIGHT_CURLY_BRACE": -78, "RIGHT_PAREN": -78, "RIGHT_SQUARE_BRACKET": -7'
+    '8, "SEMICOLON": -78, "STAR": 100, "TRUEDIV": 107}, {"AND": -81, "COLON":'
+    ' -81, "COMMA": -81, "EQ": -81, "GT": -81, "IN": -81, "LEFT_CURLY_BRACE":'
+    ' -81, "LT": -81, "MINUS": -81, "NE": -81, "NOT": -81, "OR": -81, "PLUS":'
+    ' -81, "RIGHT_CURLY_BRACE": -81, "RIGHT_PAREN": -81, "RIGHT_SQUARE_BRACKE'
+    'T": -81, "SEMICOLON": -81, "STAR": -81, "TRUEDIV": -81}, {"AND": -77, "C'
+    'OLON": -77, "COMMA": -77, "EQ": -77, "GT": -77, "IN": -77, "LEFT_CURLY_B'
+    'RACE": -77, "LT": -77, "MINUS": 104, "NE": -77, "NOT": -77, "OR": -77, "'
+    'PLUS": 106, "RIGHT_CURLY_BRACE": -77, "RIGHT_PAREN": -77, "RIGHT_SQUARE_'
+    'BRACKET": -77, "SEMICOLON": -77, "STAR": 100, "TRUEDIV": 107}, {"AND": -'
+    '75, "COLON": -75, "COMMA": -75, "EQ": -75, "GT": -75, "IN": -75, "LEFT_C'
+    'URLY_BRACE": -75, "LT": -75, "MINUS": 104, "NE": -75, "NOT": -75, "OR": '
+    '-75, "PLUS": 106, "RIGHT_CURLY_BRACE": -75, "RIGHT_PAREN": -75, "RIGHT_S'
+    'QUARE_BRACKET": -75, "SEMICOLON": -75, "STAR": 100, "TRUEDIV": 107}, {"A'
+    'ND": -82, "COLON": -82, "COMMA": -82, "EQ": -82, "GT": -82, "IN": -82, "'
+    'LEFT_CURLY_BRACE": -82, "LT": -82, "MINUS": -82, "NE": -82, "NOT": -82, '
+    '"OR": -82, "PLUS": -82, "RIGHT_CURLY_BRACE": -82, "RIGHT_PAREN": -82, "R'
+    'IGHT_SQUARE_BRACKET": -82, "SEMICOLON": -82, "STAR": 100, "TRUEDIV": 107'
+    '}, {"AND": -79, "COLON": -79, "COMMA": -79, "EQ": -79, "GT": -79, "IN": '
+    '-79, "LEFT_CURLY_BRACE": -79, "LT": -79, "MINUS": 104, "NE": -79, "NOT":'
+    ' -79, "OR": -79, "PLUS": 106, "RIGHT_CURLY_BRACE": -79, "RIGHT_PAREN": -'
+    '79, "RIGHT_SQUARE_BRACKET": -79, "SEMICOLON": -79, "STAR": 100, "TRUEDIV'
+    '": 107}, {"AND": -83, "COLON": -83, "COMMA": -83, "EQ": -83, "GT": -83, '
+    '"IN": -83, "LEFT_CURLY_BRACE": -83, "LT": -83, "MINUS": -83, "NE": -83, '
+    '"NOT": -83, "OR": -83, "PLUS": -83, "RIGHT_CURLY_BRACE": -83, "RIGHT_PAR'
+    'EN": -83, "RIGHT_SQUARE_BRACKET": -83, "SEMICOLON": -83, "STAR": 100, "T'
+    'RUEDIV": 107}, {"AND": -80, "COLON": -80, "COMMA": -80, "EQ": -80, "GT":'
+    ' -80, "IN": -80, "LEFT_CURLY_BRACE": -80, "LT": -80, "MINUS": -80, "NE":'
+    ' -80, "NOT": -80, "OR": -80, "PLUS": -80, "RIGHT_CURLY_BRACE": -80, "RIG'
+    'HT_PAREN": -80, "RIGHT_SQUARE_BRACKET": -80, "SEMICOLON": -80, "STAR": -'
+    '80, "TRUEDIV": -80}, {"AND": -76, "COLON": -76, "COMMA": -76, "EQ": -76,'
+    ' "GT": -76, "IN": -76, "LEFT_CURLY_BRACE": -76, "LT": -76, "MINUS": 104,'
+    ' "NE": -76, "NOT": -76, "OR": -76, "PLUS": 106, "RIGHT_CURLY_BRACE": -76'
+    ', "RIGHT_PAREN": -76, "RIGHT_SQUARE_BRACKET": -76, "SEMICOLON": -76, "ST'
+    'AR": 100, "TRUEDIV": 107}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57'
+    ', "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "'
+    'ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_R'
+    'AW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"AND": -50, "COLON"'
+    ': -50, "COMMA": -50, "EQ": 102, "GT": 99, "IN": 108, "LEFT_CURLY_BRACE":'
+    ' -50, "LT": 105, "MINUS": 104, "NE": 103, "NOT": -50, "OR": -50, "PLUS":'
+    ' 106, "RIGHT_CURLY_BRACE": -50, "RIGHT_PAREN": -50, "RIGHT_SQUARE_BRACKE'
+    'T": -50, "SEMICOLON": -50, "STAR": 100, "TRUEDIV": 107}, {"AND": 98, "EQ'
+    '": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": '
+    '109, "OR": 110, "PLUS": 106, "RIGHT_SQUARE_BRACKET": 172, "STAR": 100, "'
+    'TRUEDIV": 107}, {"AND": -71, "COLON": -71, "COMMA": -71, "DOT": -71, "EQ'
+    '": -71, "GT": -71, "IN": -71, "LEFT_CURLY_BRACE": -71, "LEFT_PAREN": -71'
+    ', "LEFT_SQUARE_BRACKET": -71, "LT": -71, "MINUS": -71, "NE": -71, "NOT":'
+    ' -71, "OR": -71, "PLUS": -71, "RIGHT_CURLY_BRACE": -71, "RIGHT_PAREN": -'
+    '71, "RIGHT_SQUARE_BRACKET": -71, "SEMICOLON": -71, "STAR": -71, "TRUEDIV'
+    '": -71}, {"FALSE": 68, "IDENTIFIER": 58, "IF": 67, "INTEGER": 57, "LEFT_'
+    'CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "RAISE": '
+    '49, "RETURN": 48, "RIGHT_CURLY_BRACE": 173, "SEMICOLON": 53, "ST_DQ_STRI'
+    'NG": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRI'
+    'NG": 60, "ST_SQ_STRING": 66, "TRUE": 52, "TRY": 64, "VAR": 9, "WHILE": 5'
+    '1}, {"FALSE": -24, "IDENTIFIER": -24, "IF": -24, "INTEGER": -24, "LEFT_C'
+    'URLY_BRACE": -24, "LEFT_PAREN": -24, "LEFT_SQUARE_BRACKET": -24, "RAISE"'
+    ': -24, "RETURN": -24, "RIGHT_CURLY_BRACE": -24, "SEMICOLON": -24, "ST_DQ'
+    '_STRING": -24, "ST_INTERP_STRING": -24, "ST_RAW_DQ_STRING": -24, "ST_RAW'
+    '_SQ_STRING": -24, "ST_SQ_STRING": -24, "TRUE": -24, "TRY": -24, "VAR": -'
+    '24, "WHILE": -24}, {"AND": 98, "COMMA": 175, "EQ": 102, "GT": 99, "IN": '
+    '108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": '
+    '106, "RIGHT_CURLY_BRACE": -93, "STAR": 100, "TRUEDIV": 107}, {"AND": 98,'
+    ' "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NO'
+    'T": 109, "OR": 110, "PLUS": 106, "RIGHT_CURLY_BRACE": 176, "STAR": 100, '
+    '"TRUEDIV": 107}, {"ELSE": 180, "EXCEPT": 179, "FALSE": -32, "FINALLY": 1'
+    '78, "IDENTIFIER": -32, "IF": -32, "INTEGER": -32, "LEFT_CURLY_BRACE": -3'
+    '2, "LEFT_PAREN": -32, "LEFT_SQUARE_BRACKET": -32, "RAISE": -32, "RETURN"'
+    ': -32, "RIGHT_CURLY_BRACE": -32, "SEMICOLON": -32, "ST_DQ_STRING": -32, '
+    '"ST_INTERP_STRING": -32, "ST_RAW_DQ_STRING": -32, "ST_RAW_SQ_STRING": -3'
+    '2, "ST_SQ_STRING": -32, "TRUE": -32, "TRY": -32, "VAR": -32, "WHILE": -3'
+    '2}, {"AND": -69, "COLON": -69, "COMMA": -69, "DOT": -69, "EQ": -69, "GT"'
+    ': -69, "IN": -69, "LEFT_CURLY_BRACE": -69, "LEFT_PAREN": -69, "LEFT_SQUA'
+    'RE_BRACKET": -69, "LT": -69, "MINUS": -69, "NE": -69, "NOT": -69, "OR": '
+    '-69, "PLUS": -69, "RIGHT_CURLY_BRACE": -69, "RIGHT_PAREN": -69, "RIGHT_S'
+    'QUARE_BRACKET": -69, "SEMICOLON": -69, "STAR": -69, "TRUEDIV": -69}, {"A'
+    'ND": -74, "ASSIGN": 181, "DOT": -74, "EQ": -74, "GT": -74, "IN": -74, "L'
+    'EFT_PAREN": -74, "LEFT_SQUARE_BRACKET": -74, "LT": -74, "MINUS": -74, "N'
+    'E": -74, "NOT": -74, "OR": -74, "PLUS": -74, "SEMICOLON": -74, "STAR": -'
+    '74, "TRUEDIV": -74}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEF'
+    'T_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "ST_DQ_'
+    'STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_'
+    'STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, "IDENTIFIER"'
+    ': 58, "IF": 67, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54,'
+    ' "LEFT_SQUARE_BRACKET": 69, "RAISE": 49, "RETURN": 48, "RIGHT_CURLY_BRAC'
+    'E": 183, "SEMICOLON": 53, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "S'
+    'T_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE"'
+    ': 52, "TRY": 64, "VAR": 9, "WHILE": 51}, {"AND": 98, "COMMA": 146, "EQ":'
+    ' 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 10'
+    '9, "OR": 110, "PLUS": 106, "RIGHT_PAREN": -88, "RIGHT_SQUARE_BRACKET": -'
+    '88, "STAR": 100, "TRUEDIV": 107}, {"AND": -84, "COLON": -84, "COMMA": -8'
+    '4, "EQ": -84, "GT": -84, "IN": -84, "LEFT_CURLY_BRACE": -84, "LT": -84, '
+    '"MINUS": 104, "NE": -84, "NOT": -84, "OR": -84, "PLUS": 106, "RIGHT_CURL'
+    'Y_BRACE": -84, "RIGHT_PAREN": -84, "RIGHT_SQUARE_BRACKET": -84, "SEMICOL'
+    'ON": -84, "STAR": 100, "TRUEDIV": 107}, {"AND": -74, "COLON": -74, "COMM'
+    'A": -74, "DOT": -74, "EQ": -74, "GT": -74, "IN": -74, "LEFT_CURLY_BRACE"'
+    ': -74, "LEFT_PAREN": -74, "LEFT_SQUARE_BRACKET": -74, "LT": -74, "MINUS"'
+    ': -74, "NE": -74, "NOT": -74, "OR": -74, "PLUS": -74, "RIGHT_CURLY_BRACE'
+    '": -74, "RIGHT_PAREN": -74, "RIGHT_SQUARE_BRACKET": -74, "SEMICOLON": -7'
+    '4, "STAR": -74, "TRUEDIV": -74}, {"FALSE": -28, "IDENTIFIER": -28, "IF":'
+    ' -28, "INTEGER": -28, "LEFT_CURLY_BRACE": -28, "LEFT_PAREN": -28, "LEFT_'
+    'SQUARE_BRACKET": -28, "RAISE": -28, "RETURN": -28, "RIGHT_CURLY_BRACE": '
+    '-28, "SEMICOLON": -28, "ST_DQ_STRING": -28, "ST_INTERP_STRING": -28, "ST'
+    '_RAW_DQ_STRING": -28, "ST_RAW_SQ_STRING": -28, "ST_SQ_STRING": -28, "TRU'
+    'E": -28, "TRY": -28, "VAR": -28, "WHILE": -28}, {"RIGHT_CURLY_BRACE": -9'
+    '1}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 6'
+    '1, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "RIGHT_CURLY_BRACE": -92'
+    ', "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "S'
+    'T_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"CHAR": -54, "ES'
+    'C_ESC": -54, "ESC_HEX_16": -54, "ESC_HEX_8": -54, "ESC_HEX_ANY": -54, "E'
+    'SC_QUOTE": -54, "ESC_SIMPLE": -54, "ESC_UNRECOGNISED": -54, "ST_ENDSTRIN'
+    'G": -54, "ST_INTERP": -54}, {"FALSE": -31, "IDENTIFIER": -31, "IF": -31,'
+    ' "INTEGER": -31, "LEFT_CURLY_BRACE": -31, "LEFT_PAREN": -31, "LEFT_SQUAR'
+    'E_BRACKET": -31, "RAISE": -31, "RETURN": -31, "RIGHT_CURLY_BRACE": -31, '
+    '"SEMICOLON": -31, "ST_DQ_STRING": -31, "ST_INTERP_STRING": -31, "ST_RAW_'
+    'DQ_STRING": -31, "ST_RAW_SQ_STRING": -31, "ST_SQ_STRING": -31, "TRUE": -'
+    '31, "TRY": -31, "VAR": -31, "WHILE": -31}, {"LEFT_CURLY_BRACE": 187}, {"'
+    'IDENTIFIER": 188}, {"LEFT_CURLY_BRACE": 189}, {"FALSE": 68, "IDENTIFIER"'
+    ': 77, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQU'
+    'ARE_BRACKET": 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ'
+    '_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {'
+    '"AND": 98, "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE"'
+    ': 103, "NOT": 109, "OR": 110, "PLUS": 106, "SEMICOLON": 191, "STAR": 100'
+    ', "TRUEDIV": 107}, {"FALSE": -29, "IDENTIFIER": -29, "IF": -29, "INTEGER'
+    '": -29, "LEFT_CURLY_BRACE": -29, "LEFT_PAREN": -29, "LEFT_SQUARE_BRACKET'
+    '": -29, "RAISE": -29, "RETURN": -29, "RIGHT_CURLY_BRACE": -29, "SEMICOLO'
+    'N": -29, "ST_DQ_STRING": -29, "ST_INTERP_STRING": -29, "ST_RAW_DQ_STRING'
+    '": -29, "ST_RAW_SQ_STRING": -29, "ST_SQ_STRING": -29, "TRUE": -29, "TRY"'
+    ': -29, "VAR": -29, "WHILE": -29}, {"RIGHT_PAREN": -89, "RIGHT_SQUARE_BRA'
+    'CKET": -89}, {"AND": 98, "COLON": 192, "EQ": 102, "GT": 99, "IN": 108, "'
+    'LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, "PLUS": 106, "'
+    'STAR": 100, "TRUEDIV": 107}, {"CHAR": 131, "ESC_ESC": 132, "ESC_HEX_16":'
+    ' 129, "ESC_HEX_8": 130, "ESC_HEX_ANY": 135, "ESC_QUOTE": 136, "ESC_SIMPL'
+    'E": 133, "ESC_UNRECOGNISED": 134, "ST_ENDSTRING": -53, "ST_INTERP": -53}'
+    ', {"FALSE": -14, "IDENTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CUR'
+    'LY_BRACE": -14, "LEFT_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": '
+    '-14, "RETURN": -14, "RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_S'
+    'TRING": -14, "ST_INTERP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_S'
+    'Q_STRING": -14, "ST_SQ_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14'
+    ', "WHILE": -14}, {"AS": 195, "LEFT_CURLY_BRACE": 194}, {"FALSE": -14, "I'
+    'DENTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14, "LE'
+    'FT_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN": -14,'
+    ' "RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "ST_IN'
+    'TERP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14, "ST'
+    '_SQ_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14}, {"'
+    'AND": 98, "EQ": 102, "GT": 99, "IN": 108, "LT": 105, "MINUS": 104, "NE":'
+    ' 103, "NOT": 109, "OR": 110, "PLUS": 106, "SEMICOLON": 197, "STAR": 100,'
+    ' "TRUEDIV": 107}, {"FALSE": -25, "IDENTIFIER": -25, "IF": -25, "INTEGER"'
+    ': -25, "LEFT_CURLY_BRACE": -25, "LEFT_PAREN": -25, "LEFT_SQUARE_BRACKET"'
+    ': -25, "RAISE": -25, "RETURN": -25, "RIGHT_CURLY_BRACE": -25, "SEMICOLON'
+    '": -25, "ST_DQ_STRING": -25, "ST_INTERP_STRING": -25, "ST_RAW_DQ_STRING"'
+    ': -25, "ST_RAW_SQ_STRING": -25, "ST_SQ_STRING": -25, "TRUE": -25, "TRY":'
+    ' -25, "VAR": -25, "WHILE": -25}, {"FALSE": 68, "IDENTIFIER": 77, "INTEGE'
+    'R": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET":'
+    ' 69, "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59,'
+    ' "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52}, {"FALSE": 68, '
+    '"IDENTIFIER": 58, "IF": 67, "INTEGER": 57, "LEFT_CURLY_BRACE": 61, "LEFT'
+    '_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "RAISE": 49, "RETURN": 48, "RIGH'
+    'T_CURLY_BRACE": 199, "SEMICOLON": 53, "ST_DQ_STRING": 63, "ST_INTERP_STR'
+    'ING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_STRING": 60, "ST_SQ_STRING"'
+    ': 66, "TRUE": 52, "TRY": 64, "VAR": 9, "WHILE": 51}, {"FALSE": -14, "IDE'
+    'NTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE": -14, "LEFT'
+    '_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETURN": -14, "'
+    'RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -14, "ST_INTE'
+    'RP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING": -14, "ST_S'
+    'Q_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE": -14}, {"ID'
+    'ENTIFIER": 201}, {"FALSE": 68, "IDENTIFIER": 58, "IF": 67, "INTEGER": 57'
+    ', "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "'
+    'RAISE": 49, "RETURN": 48, "RIGHT_CURLY_BRACE": 202, "SEMICOLON": 53, "ST'
+    '_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW'
+    '_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52, "TRY": 64, "VAR": 9, "W'
+    'HILE": 51}, {"FALSE": -26, "IDENTIFIER": -26, "IF": -26, "INTEGER": -26,'
+    ' "LEFT_CURLY_BRACE": -26, "LEFT_PAREN": -26, "LEFT_SQUARE_BRACKET": -26,'
+    ' "RAISE": -26, "RETURN": -26, "RIGHT_CURLY_BRACE": -26, "SEMICOLON": -26'
+    ', "ST_DQ_STRING": -26, "ST_INTERP_STRING": -26, "ST_RAW_DQ_STRING": -26,'
+    ' "ST_RAW_SQ_STRING": -26, "ST_SQ_STRING": -26, "TRUE": -26, "TRY": -26, '
+    '"VAR": -26, "WHILE": -26}, {"AND": 98, "COMMA": 175, "EQ": 102, "GT": 99'
+    ', "IN": 108, "LT": 105, "MINUS": 104, "NE": 103, "NOT": 109, "OR": 110, '
+    '"PLUS": 106, "RIGHT_CURLY_BRACE": -93, "STAR": 100, "TRUEDIV": 107}, {"F'
+    'ALSE": -35, "IDENTIFIER": -35, "IF": -35, "INTEGER": -35, "LEFT_CURLY_BR'
+    'ACE": -35, "LEFT_PAREN": -35, "LEFT_SQUARE_BRACKET": -35, "RAISE": -35, '
+    '"RETURN": -35, "RIGHT_CURLY_BRACE": -35, "SEMICOLON": -35, "ST_DQ_STRING'
+    '": -35, "ST_INTERP_STRING": -35, "ST_RAW_DQ_STRING": -35, "ST_RAW_SQ_STR'
+    'ING": -35, "ST_SQ_STRING": -35, "TRUE": -35, "TRY": -35, "VAR": -35, "WH'
+    'ILE": -35}, {"FALSE": 68, "IDENTIFIER": 58, "IF": 67, "INTEGER": 57, "LE'
+    'FT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": 69, "RAISE'
+    '": 49, "RETURN": 48, "RIGHT_CURLY_BRACE": 204, "SEMICOLON": 53, "ST_DQ_S'
+    'TRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "ST_RAW_SQ_S'
+    'TRING": 60, "ST_SQ_STRING": 66, "TRUE": 52, "TRY": 64, "VAR": 9, "WHILE"'
+    ': 51}, {"LEFT_CURLY_BRACE": 205}, {"FALSE": -36, "IDENTIFIER": -36, "IF"'
+    ': -36, "INTEGER": -36, "LEFT_CURLY_BRACE": -36, "LEFT_PAREN": -36, "LEFT'
+    '_SQUARE_BRACKET": -36, "RAISE": -36, "RETURN": -36, "RIGHT_CURLY_BRACE":'
+    ' -36, "SEMICOLON": -36, "ST_DQ_STRING": -36, "ST_INTERP_STRING": -36, "S'
+    'T_RAW_DQ_STRING": -36, "ST_RAW_SQ_STRING": -36, "ST_SQ_STRING": -36, "TR'
+    'UE": -36, "TRY": -36, "VAR": -36, "WHILE": -36}, {"RIGHT_CURLY_BRACE": -'
+    '94}, {"ELSE": 180, "EXCEPT": 179, "FALSE": -32, "FINALLY": 178, "IDENTIF'
+    'IER": -32, "IF": -32, "INTEGER": -32, "LEFT_CURLY_BRACE": -32, "LEFT_PAR'
+    'EN": -32, "LEFT_SQUARE_BRACKET": -32, "RAISE": -32, "RETURN": -32, "RIGH'
+    'T_CURLY_BRACE": -32, "SEMICOLON": -32, "ST_DQ_STRING": -32, "ST_INTERP_S'
+    'TRING": -32, "ST_RAW_DQ_STRING": -32, "ST_RAW_SQ_STRING": -32, "ST_SQ_ST'
+    'RING": -32, "TRUE": -32, "TRY": -32, "VAR": -32, "WHILE": -32}, {"FALSE"'
+    ': -14, "IDENTIFIER": -14, "IF": -14, "INTEGER": -14, "LEFT_CURLY_BRACE":'
+    ' -14, "LEFT_PAREN": -14, "LEFT_SQUARE_BRACKET": -14, "RAISE": -14, "RETU'
+    'RN": -14, "RIGHT_CURLY_BRACE": -14, "SEMICOLON": -14, "ST_DQ_STRING": -1'
+    '4, "ST_INTERP_STRING": -14, "ST_RAW_DQ_STRING": -14, "ST_RAW_SQ_STRING":'
+    ' -14, "ST_SQ_STRING": -14, "TRUE": -14, "TRY": -14, "VAR": -14, "WHILE":'
+    ' -14}, {"FALSE": -33, "IDENTIFIER": -33, "IF": -33, "INTEGER": -33, "LEF'
+    'T_CURLY_BRACE": -33, "LEFT_PAREN": -33, "LEFT_SQUARE_BRACKET": -33, "RAI'
+    'SE": -33, "RETURN": -33, "RIGHT_CURLY_BRACE": -33, "SEMICOLON": -33, "ST'
+    '_DQ_STRING": -33, "ST_INTERP_STRING": -33, "ST_RAW_DQ_STRING": -33, "ST_'
+    'RAW_SQ_STRING": -33, "ST_SQ_STRING": -33, "TRUE": -33, "TRY": -33, "VAR"'
+    ': -33, "WHILE": -33}, {"FALSE": 68, "IDENTIFIER": 58, "IF": 67, "INTEGER'
+    '": 57, "LEFT_CURLY_BRACE": 61, "LEFT_PAREN": 54, "LEFT_SQUARE_BRACKET": '
+    '69, "RAISE": 49, "RETURN": 48, "RIGHT_CURLY_BRACE": 208, "SEMICOLON": 53'
+    ', "ST_DQ_STRING": 63, "ST_INTERP_STRING": 62, "ST_RAW_DQ_STRING": 59, "S'
+    'T_RAW_SQ_STRING": 60, "ST_SQ_STRING": 66, "TRUE": 52, "TRY": 64, "VAR": '
+    '9, "WHILE": 51}, {"ELSE": 180, "EXCEPT": 179, "FALSE": -32, "FINALLY": 1'
+    '78, "IDENTIFIER": -32, "IF": -32, "INTEGER": -32, "LEFT_CURLY_BRACE": -3'
+    '2, "LEFT_PAREN": -32, "LEFT_SQUARE_BRACKET": -32, "RAISE": -32, "RETURN"'
+    ': -32, "RIGHT_CURLY_BRACE": -32, "SEMICOLON": -32, "ST_DQ_STRING": -32, '
+    '"ST_INTERP_STRING": -32, "ST_RAW_DQ_STRING": -32, "ST_RAW_SQ_STRING": -3'
+    '2, "ST_SQ_STRING": -32, "TRUE": -32, "TRY": -32, "VAR": -32, "WHILE": -3'
+    '2}, {"FALSE": -34, "IDENTIFIER": -34, "IF": -34, "INTEGER": -34, "LEFT_C'
+    'URLY_BRACE": -34, "LEFT_PAREN": -34, "LEFT_SQUARE_BRACKET": -34, "RAISE"'
+    ': -34, "RETURN": -34, "RIGHT_CURLY_BRACE": -34, "SEMICOLON": -34, "ST_DQ'
+    '_STRING": -34, "ST_INTERP_STRING": -34, "ST_RAW_DQ_STRING": -34, "ST_RAW'
+    '_SQ_STRING": -34, "ST_SQ_STRING": -34, "TRUE": -34, "TRY": -34, "VAR": -'
+    '34, "WHILE": -34}], "lr_goto": [{"body": 1, "program": 2}, {"body_elemen'
+    't": 4, "class_definition": 6, "function": 3, "var_declaration": 7}, {}, '
+    '{}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {"type_decl": 19}, {"dot_identif'
+    'ier_list": 20}, {"arglist": 22}, {"body": 24}, {}, {}, {"var_decl": 27},'
+    ' {"optional_import": 30}, {}, {}, {}, {"body_element": 4, "class_definit'
+    'ion": 6, "function": 3, "var_declaration": 7}, {}, {}, {}, {}, {}, {}, {'
+    '"dot_identifier_list": 41}, {"function_body": 42}, {}, {"type_decl": 43}'
+    ', {}, {}, {}, {"type_decl": 45}, {"identifier_list": 47}, {}, {}, {"atom'
+    '": 65, "expression": 70, "statement": 56, "var_declaration": 55}, {"var_'
+    'decl": 71}, {"body": 72}, {"var_decl": 73}, {}, {}, {"atom": 76, "expres'
+    'sion": 78}, {"atom": 76, "expression": 79}, {}, {"atom": 76, "expression'
+    '": 80}, {}, {}, {"atom": 76, "expression": 81}, {}, {}, {}, {}, {"rawstr'
+    'ingcontent": 83}, {"rawstringcontent": 84}, {"atom": 76, "dict_pair_list'
+    '": 85, "expression": 86}, {"interpstr": 87, "stringcontent": 88}, {"stri'
+    'ngcontent": 89}, {}, {}, {"stringcontent": 94}, {"atom": 76, "expression'
+    '": 95}, {}, {"atom": 76, "expression": 97, "expression_list": 96}, {}, {'
+    '}, {"body_element": 4, "class_definition": 6, "function": 3, "var_declar'
+    'ation": 7}, {}, {"identifier_list": 113}, {}, {}, {}, {}, {}, {}, {}, {"'
+    'atom": 76, "expression": 120}, {}, {}, {}, {}, {}, {}, {}, {"function_bo'
+    'dy": 138}, {"atom": 76, "expression": 97, "expression_list": 139}, {"ato'
+    'm": 76, "expression": 140}, {}, {}, {}, {}, {"expression_sublist": 145},'
+    ' {"atom": 76, "expression": 147}, {"atom": 76, "expression": 148}, {"ato'
+    'm": 76, "expression": 149}, {}, {"atom": 76, "expression": 150}, {"atom"'
+    ': 76, "expression": 151}, {"atom": 76, "expression": 152}, {"atom": 76, '
+    '"expression": 153}, {"atom": 76, "expression": 154}, {"atom": 76, "expre'
+    'ssion": 155}, {"atom": 76, "expression": 156}, {}, {"atom": 76, "express'
+    'ion": 158}, {}, {}, {}, {"atom": 76, "expression": 159}, {}, {}, {}, {"f'
+    'unction_body": 161}, {}, {}, {}, {}, {}, {}, {}, {"atom": 76, "expressio'
+    'n": 163}, {}, {"atom": 76, "expression": 164}, {}, {}, {}, {}, {}, {}, {'
+    '}, {}, {}, {"atom": 65, "expression": 70, "statement": 56, "var_declarat'
+    'ion": 55}, {}, {}, {}, {}, {"function_body": 169}, {}, {}, {"atom": 76, '
+    '"expression": 170}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {"atom": 76,'
+    ' "expression": 171}, {}, {}, {}, {"atom": 65, "expression": 70, "stateme'
+    'nt": 56, "var_declaration": 55}, {}, {"dict_pair_sublist": 174}, {}, {"e'
+    'xcept_finally_clauses": 177}, {}, {}, {"atom": 76, "expression": 182}, {'
+    '"atom": 65, "expression": 70, "statement": 56, "var_declaration": 55}, {'
+    '"expression_sublist": 184}, {}, {}, {}, {}, {"atom": 76, "expression": 1'
+    '85}, {"stringcontent": 186}, {}, {}, {}, {}, {"atom": 76, "expression": '
+    '190}, {}, {}, {}, {}, {}, {"function_body": 193}, {}, {"function_body": '
+    '196}, {}, {}, {"atom": 76, "expression": 198}, {"atom": 65, "expression"'
+    ': 70, "statement": 56, "var_declaration": 55}, {"function_body": 200}, {'
+    '}, {"atom": 65, "expression": 70, "statement": 56, "var_declaration": 55'
+    '}, {}, {"dict_pair_sublist": 203}, {}, {"atom": 65, "expression": 70, "s'
+    'tatement": 56, "var_declaration": 55}, {}, {}, {}, {"except_finally_clau'
+    'ses": 206}, {"function_body": 207}, {}, {"atom": 65, "expression": 70, "'
+    'statement": 56, "var_declaration": 55}, {"except_finally_clauses": 209},'
+    ' {}], "precedence": {"AND": ["left", 1], "DOT": ["left", 6], "EQ": ["lef'
+    't", 3], "GT": ["left", 3], "IN": ["left", 3], "LEFT_PAREN": ["left", 7],'
+    ' "LT": ["left", 3], "MINUS": ["left", 4], "NE": ["left", 3], "OR": ["lef'
+    't", 2], "PLUS": ["left", 4], "STAR": ["left", 5], "TRUEDIV": ["left", 5]'
+    '}, "productions": [["S\'", ["program"], ["right", 0]], ["program", ["body'
+    '"], ["right", 0]], ["body", [], ["right", 0]], ["body", ["body", "body_e'
+    'lement"], ["right", 0]], ["body_element", ["function"], ["right", 0]], ['
+    '"body_element", ["class_definition"], ["right", 0]], ["body_element", ["'
+    'SEMICOLON"], ["right", 0]], ["body_element", ["var_declaration"], ["righ'
+    't", 0]], ["body_element", ["IMPORT", "IDENTIFIER", "dot_identifier_list"'
+    ', "optional_import", "SEMICOLON"], ["right", 0]], ["optional_import", []'
+    ', ["right", 0]], ["optional_import", ["LEFT_CURLY_BRACE", "IDENTIFIER", '
+    '"identifier_list", "RIGHT_CURLY_BRACE"], ["right", 0]], ["class_definiti'
+    'on", ["CLASS", "IDENTIFIER", "LEFT_CURLY_BRACE", "body", "RIGHT_CURLY_BR'
+    'ACE"], ["right", 0]], ["class_definition", ["CLASS", "IDENTIFIER", "LEFT'
+    '_PAREN", "IDENTIFIER", "RIGHT_PAREN", "LEFT_CURLY_BRACE", "body", "RIGHT'
+    '_CURLY_BRACE"], ["right", 0]], ["function", ["DEF", "IDENTIFIER", "argli'
+    'st", "LEFT_CURLY_BRACE", "function_body", "RIGHT_CURLY_BRACE"], ["right"'
+    ', 0]], ["function_body", [], ["right", 0]], ["function_body", ["function'
+    '_body", "statement"], ["right", 0]], ["statement", ["expression", "SEMIC'
+    'OLON"], ["right", 0]], ["statement", ["SEMICOLON"], ["right", 0]], ["sta'
+    'tement", ["var_declaration"], ["right", 0]], ["var_declaration", ["VAR",'
+    ' "IDENTIFIER", "type_decl", "var_decl", "SEMICOLON"], ["right", 0]], ["v'
+    'ar_decl", [], ["right", 0]], ["var_decl", ["COMMA", "IDENTIFIER", "type_'
+    'decl", "var_decl"], ["right", 0]], ["type_decl", [], ["right", 0]], ["ty'
+    'pe_decl", ["COLON", "IDENTIFIER"], ["right", 0]], ["statement", ["IDENTI'
+    'FIER", "ASSIGN", "expression", "SEMICOLON"], ["right", 0]], ["statement"'
+    ', ["atom", "DOT", "IDENTIFIER", "ASSIGN", "expression", "SEMICOLON"], ["'
+    'right", 0]], ["statement", ["atom", "LEFT_SQUARE_BRACKET", "expression",'
+    ' "RIGHT_SQUARE_BRACKET", "ASSIGN", "expression", "SEMICOLON"], ["right",'
+    ' 0]], ["statement", ["RETURN", "expression", "SEMICOLON"], ["right", 0]]'
+    ', ["statement", ["WHILE", "expression", "LEFT_CURLY_BRACE", "function_bo'
+    'dy", "RIGHT_CURLY_BRACE"], ["right", 0]], ["statement", ["IF", "expressi'
+    'on", "LEFT_CURLY_BRACE", "function_body", "RIGHT_CURLY_BRACE"], ["right"'
+    ', 0]], ["statement", ["RAISE", "expression", "SEMICOLON"], ["right", 0]]'
+    ', ["statement", ["TRY", "LEFT_CURLY_BRACE", "function_body", "RIGHT_CURL'
+    'Y_BRACE", "except_finally_clauses"], ["right", 0]], ["except_finally_cla'
+    'uses", [], ["right", 0]], ["except_finally_clauses", ["EXCEPT", "IDENTIF'
+    'IER", "LEFT_CURLY_BRACE", "function_body", "RIGHT_CURLY_BRACE", "except_'
+    'finally_clauses"], ["right", 0]], ["except_finally_clauses", ["EXCEPT", '
+    '"IDENTIFIER", "AS", "IDENTIFIER", "LEFT_CURLY_BRACE", "function_body", "'
+    'RIGHT_CURLY_BRACE", "except_finally_clauses"], ["right", 0]], ["except_f'
+    'inally_clauses", ["FINALLY", "LEFT_CURLY_BRACE", "function_body", "RIGHT'
+    '_CURLY_BRACE"], ["right", 0]], ["except_finally_clauses", ["ELSE", "LEFT'
+    '_CURLY_BRACE", "function_body", "RIGHT_CURLY_BRACE"], ["right", 0]], ["i'
+    'dentifier_list", ["COMMA", "IDENTIFIER", "identifier_list"], ["right", 0'
+    ']], ["identifier_list", [], ["right", 0]], ["dot_identifier_list", ["DOT'
+    '", "IDENTIFIER", "dot_identifier_list"], ["right", 0]], ["dot_identifier'
+    '_list", [], ["right", 0]], ["arglist", ["LEFT_PAREN", "RIGHT_PAREN"], ["'
+    'right", 0]], ["arglist", ["LEFT_PAREN", "IDENTIFIER", "type_decl", "var_'
+    'decl", "RIGHT_PAREN"], ["right", 0]], ["expression", ["INTEGER"], ["righ'
+    't", 0]], ["expression", ["ST_RAW_SQ_STRING", "rawstringcontent", "ST_END'
+    'RAW"], ["right", 0]], ["expression", ["ST_RAW_DQ_STRING", "rawstringcont'
+    'ent", "ST_ENDRAW"], ["right", 0]], ["expression", ["ST_SQ_STRING", "stri'
+    'ngcontent", "ST_ENDSTRING"], ["right", 0]], ["expression", ["ST_DQ_STRIN'
+    'G", "stringcontent", "ST_ENDSTRING"], ["right", 0]], ["expression", ["ST'
+    '_INTERP_STRING", "interpstr", "ST_ENDSTRING"], ["right", 0]], ["expressi'
+    'on", ["atom"], ["right", 0]], ["expression", ["expression", "OR", "expre'
+    'ssion"], ["left", 2]], ["expression", ["expression", "AND", "expression"'
+    '], ["left", 1]], ["interpstr", ["stringcontent"], ["right", 0]], ["inter'
+    'pstr", ["interpstr", "ST_INTERP", "expression", "RIGHT_CURLY_BRACE", "st'
+    'ringcontent"], ["right", 0]], ["stringcontent", [], ["right", 0]], ["str'
+    'ingcontent", ["stringcontent", "ESC_QUOTE"], ["right", 0]], ["stringcont'
+    'ent", ["stringcontent", "ESC_ESC"], ["right", 0]], ["stringcontent", ["s'
+    'tringcontent", "ESC_SIMPLE"], ["right", 0]], ["stringcontent", ["stringc'
+    'ontent", "ESC_HEX_16"], ["right", 0]], ["stringcontent", ["stringcontent'
+    '", "ESC_HEX_8"], ["right", 0]], ["stringcontent", ["stringcontent", "ESC'
+    '_HEX_ANY"], ["right", 0]], ["stringcontent", ["stringcontent", "ESC_UNRE'
+    'COGNISED"], ["right", 0]], ["stringcontent", ["stringcontent", "CHAR"], '
+    '["right", 0]], ["rawstringcontent", [], ["right", 0]], ["rawstringconten'
+    't", ["rawstringcontent", "RAW_CHAR"], ["right", 0]], ["rawstringcontent"'
+    ', ["rawstringcontent", "RAW_ESC"], ["right", 0]], ["atom", ["TRUE"], ["r'
+    'ight", 0]], ["atom", ["IDENTIFIER"], ["right", 0]], ["atom", ["FALSE"], '
+    '["right", 0]], ["atom", ["atom", "LEFT_PAREN", "expression_list", "RIGHT'
+    '_PAREN"], ["right", 0]], ["atom", ["LEFT_PAREN", "expression", "RIGHT_PA'
+    'REN"], ["right", 0]], ["atom", ["atom", "DOT", "IDENTIFIER"], ["right", '
+    '0]], ["atom", ["LEFT_SQUARE_BRACKET", "expression_list", "RIGHT_SQUARE_B'
+    'RACKET"], ["right", 0]], ["atom", ["LEFT_CURLY_BRACE", "dict_pair_list",'
+    ' "RIGHT_CURLY_BRACE"], ["right", 0]], ["atom", ["atom", "LEFT_SQUARE_BRA'
+    'CKET", "expression", "RIGHT_SQUARE_BRACKET"], ["right", 0]], ["expressio'
+    'n", ["expression", "NE", "expression"], ["left", 3]], ["expression", ["e'
+    'xpression", "IN", "expression"], ["left", 3]], ["expression", ["expressi'
+    'on", "EQ", "expression"], ["left", 3]], ["expression", ["expression", "G'
+    'T", "expression"], ["left", 3]], ["expression", ["expression", "LT", "ex'
+    'pression"], ["left", 3]], ["expression", ["expression", "TRUEDIV", "expr'
+    'ession"], ["left", 5]], ["expression", ["expression", "STAR", "expressio'
+    'n"], ["left", 5]], ["expression", ["expression", "MINUS", "expression"],'
+    ' ["left", 4]], ["expression", ["expression", "PLUS", "expression"], ["le'
+    'ft", 4]], ["expression", ["expression", "NOT", "IN", "expression"], ["le'
+    'ft", 3]], ["expression_list", [], ["right", 0]], ["expression_list", ["e'
+    'xpression", "expression_sublist"], ["right", 0]], ["expression_sublist",'
+    ' ["COMMA"], ["right", 0]], ["expression_sublist", [], ["right", 0]], ["e'
+    'xpression_sublist", ["COMMA", "expression", "expression_sublist"], ["rig'
+    'ht", 0]], ["dict_pair_list", [], ["right", 0]], ["dict_pair_list", ["exp'
+    'ression", "COLON", "expression", "dict_pair_sublist"], ["right", 0]], ["'
+    'dict_pair_sublist", ["COMMA"], ["right", 0]], ["dict_pair_sublist", [], '
+    '["right", 0]], ["dict_pair_sublist", ["COMMA", "expression", "COLON", "e'
+    'xpression", "dict_pair_sublist"], ["right", 0]]], "rr_conflicts": [], "s'
+    'r_conflicts": [], "start": "program", "terminals": ["AND", "AS", "ASSIGN'
+    '", "CHAR", "CLASS", "COLON", "COMMA", "DEF", "DOT", "ELSE", "EQ", "ESC_E'
+    'SC", "ESC_HEX_16", "ESC_HEX_8", "ESC_HEX_ANY", "ESC_QUOTE", "ESC_SIMPLE"'
+    ', "ESC_UNRECOGNISED", "EXCEPT", "FALSE", "FINALLY", "GT", "IDENTIFIER", '
+    '"IF", "IMPORT", "IN", "INTEGER", "LEFT_CURLY_BRACE", "LEFT_PAREN", "LEFT'
+    '_SQUARE_BRACKET", "LT", "MINUS", "NE", "NOT", "OR", "PLUS", "RAISE", "RA'
+    'W_CHAR", "RAW_ESC", "RETURN", "RIGHT_CURLY_BRACE", "RIGHT_PAREN", "RIGHT'
+    '_SQUARE_BRACKET", "SEMICOLON", "STAR", "ST_DQ_STRING", "ST_ENDRAW", "ST_'
+    'ENDSTRING", "ST_INTERP", "ST_INTERP_STRING", "ST_RAW_DQ_STRING", "ST_RAW'
+    '_SQ_STRING", "ST_SQ_STRING", "TRUE", "TRUEDIV", "TRY", "VAR", "WHILE", "'
+    'error"]}'
+)
@@ -0,0 +1,197 @@
+""" Server mode. nolang-c --serve <socket> keeps the parser, the builtins
+and the parsed modules around and runs programs sent by
+nolang-c --connect <socket> <program.q>, one at a time, each in fresh
+modules with a fresh interpreter.
+
+Client and server exchange frames of a one character kind, the length of
+the data in decimal, a colon and the data. The client sends a run frame
+with the absolute path of the program or a stop frame. The server streams
+the program's stdout and stderr in frames and ends with an exit frame
+holding the exit status.
+"""
+
+import os
+import stat
+
+from rpython.rlib.rsocket import RSocket, UNIXAddress, AF_UNIX, SOCK_STREAM, \
+    SocketError
+
+from nolang.bytecache import ProgramCache
+from nolang.output import Output
+
+FRAME_RUN = 'r'
+FRAME_STOP = 's'
+FRAME_STDOUT = 'o'
+FRAME_STDERR = 'e'
+FRAME_EXIT = 'x'
+
+RECV_SIZE = 4096
+
+
+class ProtocolError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+
+def send_frame(sock, kind, data):
+    sock.sendall("%s%d:%s" % (kind, len(data), data))
+
+
+class FrameReader(object):
+    def __init__(self, sock):
+        self.sock = sock
+        self.buf = ""
+
+    def fill(self):
+        data = self.sock.recv(RECV_SIZE)
+        if not data:
+            raise ProtocolError("connection closed")
+        self.buf += data
+
+    def read_frame(self):
+        """ Returns the kind and the data of the next frame
+        """
+        while True:
+            colon = self.buf.find(":")
+            if colon >= 0:
+                break
+            if len(self.buf) > 20:
+                raise ProtocolError("malformed frame")
+            self.fill()
+        if colon < 2:
+            raise ProtocolError("malformed frame")
+        kind = self.buf[0]
+        length = 0
+        for i in range(1, colon):
+            c = self.buf[i]
+            if not c.isdigit():
+                raise ProtocolError("malformed frame")
+            length = length * 10 + (ord(c) - ord('0'))
+        start = colon + 1
+        while len(self.buf) < start + length:
+            self.fill()
+        end = start + length
+        assert end >= 0
+        data = self.buf[start:end]
+        self.buf = self.buf[end:]
+        return kind, data
+
+
+class SocketOutput(Output):
+    def __init__(self, sock):
+        Output.__init__(self)
+        self.sock = sock
+
+    def send_stdout(self, data):
+        send_frame(self.sock, FRAME_STDOUT, data)
+
+    def send_stderr(self, data):
+        send_frame(self.sock, FRAME_STDERR, data)
+
+
+def handle(space, sock, run_code, programs):
+    """ Serve one connection, returns False if the server should stop
+    """
+    kind, fname = FrameReader(sock).read_frame()
+    if kind == FRAME_STOP:
+        send_frame(sock, FRAME_EXIT, "0")
+        return False
+    if kind != FRAME_RUN:
+        raise ProtocolError("unexpected frame")
+    output = space.output
+    space.output = SocketOutput(sock)
+    try:
+        try:
+            status = run_code(fname, False, programs)
+        except SocketError:
+            raise
+        except ProtocolError:
+            raise
+        except Exception:
+            space.output.write_stderr("Internal error running %s\n" % fname)
+            status = 1
+        space.output.flush()
+    finally:
+        space.output = output
+    send_frame(sock, FRAME_EXIT, str(status))
+    return True
+
+
+def remove_socket(path):
+    """ Remove the socket at path, left over from an earlier server.
+    Returns False if there's something else than a socket, which is kept
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return True
+    if not stat.S_ISSOCK(st.st_mode):
+        return False
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+    return True
+
+
+def serve(space, path, run_code):
+    """ Accept connections on the unix socket at path until a client
+    sends a stop frame
+    """
+    if not remove_socket(path):
+        os.write(2, "Error starting server: %s exists and is not a socket\n"
+                 % path)
+        return 1
+    listener = RSocket(AF_UNIX, SOCK_STREAM)
+    listener.bind(UNIXAddress(path))
+    listener.listen(16)
+    programs = ProgramCache()
+    running = True
+    try:
+        while running:
+            fd, addr = listener.accept()
+            sock = RSocket(AF_UNIX, SOCK_STREAM, 0, fd)
+            try:
+                running = handle(space, sock, run_code, programs)
+            except (SocketError, ProtocolError):
+                pass  # the client went away
+            finally:
+                sock.close()
+    finally:
+        listener.close()
+        remove_socket(path)
+    return 0
+
+
+def connect(path, fname):
+    """ Run fname on the server at path, or stop it if fname is None,
+    returns the exit status
+    """
+    sock = RSocket(AF_UNIX, SOCK_STREAM)
+    try:
+        try:
+            sock.connect(UNIXAddress(path))
+            if fname is None:
+                send_frame(sock, FRAME_STOP, "")
+            else:
+                send_frame(sock, FRAME_RUN, os.path.abspath(fname))
+            reader = FrameReader(sock)
+            while True:
+                kind, data = reader.read_frame()
+                if kind == FRAME_STDOUT:
+                    os.write(1, data)
+                elif kind == FRAME_STDERR:
+                    os.write(2, data)
+                elif kind == FRAME_EXIT:
+                    return int(data)
+                else:
+                    raise ProtocolError("unexpected frame")
+        except SocketError as e:
+            os.write(2, "Error talking to server %s: %s\n" % (path,
+                                                              e.get_msg()))
+            return 1
+        except ProtocolError as e:
+            os.write(2, "Error talking to server %s: %s\n" % (path, e.msg))
+            return 1
+    finally:
+        sock.close()
@@ -3,9 +3,21 @@ def target(driver, args):
     driver.exe_name = 'nolang-c'
     config = driver.config
 
+    if '--jit' in args:
+        # same as passing -Ojit to rpython, but keeps the plain binary around
+        # so the two can be compared
+        args.remove('--jit')
+        config.translation.set(jit=True)
+        driver.exe_name = 'nolang-c-jit'
+
     from rpython.config.config import to_optparse, SUPPRESS_USAGE
     parser = to_optparse(config, parserkwargs={'usage': SUPPRESS_USAGE})
     parser.parse_args(args)
 
     from nolang.main import main
     return main, None
+
+
+def jitpolicy(driver):
+    from rpython.jit.codewriter.policy import JitPolicy
+    return JitPolicy()
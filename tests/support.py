@@ -41,16 +41,17 @@ class BaseTest(object):
         self.interpreter = Interpreter()
         self.space.setup(self.interpreter)
 
-    def compile(self, body):
+    def compile(self, body, opt_level=0):
         program = reformat_expr(body)
         ast = self.parse(program)
         imp = Importer(self.space)
         w_mod = compile_module(self.space, '<test>', 'self.test', program, ast,
                                imp)
-        return compile_bytecode(ast.elements[0], program, w_mod)
+        return compile_bytecode(self.space, ast.elements[0], program, w_mod,
+                                opt_level=opt_level)
 
     def parse(self, program):
-        return self.parser.parse(self.lexer.lex('<test>', program),
+        return self.parser.parse(self.lexer.tokenize('<test>', program),
                                  ParsingState('<test>', program))
 
     def interpret_expr(self, code):
@@ -63,6 +64,7 @@ class BaseTest(object):
         w_mod = compile_module(self.space, 'test', 'self.test', source, ast,
                                imp)
         w_mod.setup(self.space)
+        self.w_mod = w_mod
         if args is not None:
             args_w = [self.space.newlist([self.space.newtext(x) for x in args])]
         else:
@@ -0,0 +1,217 @@
+import os
+
+from support import BaseTest, reformat_code
+from nolang.bytecache import compile_file, load_module, cache_path, \
+    source_mtime, write_caches, ModuleSource, Writer, Reader
+from nolang.importer import Importer
+from nolang.main import run_code
+
+
+class NoParser(object):
+    def parse(self, tokens, state):
+        raise Exception("parsed although the cache is up to date")
+
+
+PROGRAM = reformat_code('''
+    class Base {
+        var x;
+        def __init__(self, x) {
+            self.x = x;
+        }
+    }
+
+    class Derived(Base) {
+        def get(self) {
+            return self.x + 1;
+        }
+    }
+
+    def main() {
+        var d;
+        d = Derived(3);
+        try {
+            raise Exception("foo");
+        } except Exception {
+            return d.get() + 2;
+        }
+    }
+    ''')
+
+
+class TestBytecodeCache(BaseTest):
+    def write(self, tmpdir, source):
+        fname = tmpdir.join('foo.q')
+        fname.write(source)
+        return str(fname)
+
+    def compile_file(self, fname, parser=None):
+        source = open(fname).read()
+        self.importer = Importer(self.space, str(os.path.dirname(fname)),
+                                 parser or self.parser, self.lexer)
+        return compile_file(self.space, parser or self.parser, self.lexer,
+                            self.importer, fname, 'self.foo', source)
+
+    def run(self, w_mod, name='main'):
+        """ Call name in w_mod and write the .qc file, like run_code
+        """
+        w_mod.setup(self.space)
+        w_res = self.space.call_method(w_mod, name, [])
+        write_caches(self.space, self.importer)
+        return self.space.int_w(w_res)
+
+    def load(self, data, source, mtime):
+        return load_module(self.space, data, ModuleSource(
+            self.parser, self.lexer, 'foo.q', source), mtime)
+
+    def test_write_and_load(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        assert self.run(self.compile_file(fname)) == 6
+        assert os.path.exists(cache_path(fname))
+        w_mod = self.compile_file(fname, NoParser())
+        assert self.run(w_mod) == 6
+        w_func = w_mod.functions[w_mod.name2index['main']]
+        assert w_func.bytecode.source == PROGRAM
+        assert len(w_func.bytecode.exception_blocks) == 1
+
+    def test_stale_source(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        self.run(self.compile_file(fname))
+        source = PROGRAM.replace("Derived(3)", "Derived(4)")
+        mtime = source_mtime(fname)
+        data = open(cache_path(fname)).read()
+        assert self.load(data, PROGRAM, mtime) is not None
+        assert self.load(data, source, mtime) is None
+        assert self.load(data, PROGRAM, mtime + 1) is None
+        self.write(tmpdir, source)
+        assert self.run(self.compile_file(fname)) == 7
+
+    def test_stale_opt_level(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        self.run(self.compile_file(fname))
+        data = open(cache_path(fname)).read()
+        mtime = source_mtime(fname)
+        self.space.opt_level = 0
+        try:
+            assert self.load(data, PROGRAM, mtime) is None
+        finally:
+            self.space.opt_level = 1
+
+    def test_inlined(self, tmpdir):
+        fname = self.write(tmpdir, reformat_code('''
+            def inc(x) {
+                return x + 1;
+            }
+
+            def main() {
+                return inc(inc(1));
+            }
+            '''))
+        self.space.opt_level = 2
+        try:
+            assert self.run(self.compile_file(fname)) == 3
+            w_mod = self.compile_file(fname, NoParser())
+        finally:
+            self.space.opt_level = 1
+        w_func = w_mod.functions[w_mod.name2index['main']]
+        assert [(inlined.name, inlined.start, inlined.end)
+                for inlined in w_func.bytecode.inlined] == [("inc", 6, 13),
+                                                            ("inc", 16, 23)]
+        assert self.run(w_mod) == 3
+
+    def test_corrupt_cache(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        self.run(self.compile_file(fname))
+        data = open(cache_path(fname)).read()
+        mtime = source_mtime(fname)
+        for lgt in [0, 5, 30, len(data) - 1]:
+            assert self.load(data[:lgt], PROGRAM, mtime) is None
+        assert self.load(data + "x", PROGRAM, mtime) is None
+        tmpdir.join('foo.qc').write_binary(data[:30])
+        assert self.run(self.compile_file(fname)) == 6
+
+    def test_corrupt_code(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        w_mod = self.compile_file(fname)
+        assert self.run(w_mod) == 6
+        code = w_mod.functions[w_mod.name2index['main']].bytecode.bytecode
+        data = open(cache_path(fname)).read()
+        assert data.count(code) == 1
+        start = data.index(code)
+        mtime = source_mtime(fname)
+        for i in range(start, start + len(code)):
+            corrupt = data[:i] + chr(ord(data[i]) ^ 0xff) + data[i + 1:]
+            assert self.load(corrupt, PROGRAM, mtime) is None
+        tmpdir.join('foo.qc').write_binary(corrupt)
+        assert self.run(self.compile_file(fname)) == 6
+
+    def test_uncalled_functions(self, tmpdir):
+        fname = self.write(tmpdir, reformat_code('''
+            class A {
+                def m(self) {
+                    return 5;
+                }
+            }
+
+            def unused() {
+                return y;
+            }
+
+            def other() {
+                return A().m();
+            }
+
+            def main() {
+                return 3;
+            }
+            '''))
+        assert self.run(self.compile_file(fname)) == 3
+        w_mod = self.compile_file(fname, NoParser())
+        for name in ['unused', 'other', 'main']:
+            w_func = w_mod.functions[w_mod.name2index[name]]
+            assert (w_func.bytecode is None) == (name != 'main')
+        assert self.run(w_mod) == 3
+        # parses the source, and writes the newly compiled functions
+        assert self.run(self.compile_file(fname), 'other') == 5
+        w_mod = self.compile_file(fname, NoParser())
+        assert self.run(w_mod, 'other') == 5
+        w_func = w_mod.functions[w_mod.name2index['unused']]
+        assert w_func.bytecode is None
+
+    def test_disabled(self, tmpdir):
+        fname = self.write(tmpdir, PROGRAM)
+        self.space.bytecode_cache = False
+        try:
+            self.compile_file(fname)
+        finally:
+            self.space.bytecode_cache = True
+        assert not os.path.exists(cache_path(fname))
+
+    def test_ints(self):
+        writer = Writer()
+        values = [0, 1, -1, 63, 64, -64, 127, 128, 300, -300, 2 ** 40,
+                  -2 ** 40]
+        for v in values:
+            writer.write_int(v)
+        reader = Reader(writer.build())
+        assert [reader.read_int() for v in values] == values
+        assert reader.at_end()
+
+    def test_import(self, tmpdir, capfd):
+        tmpdir.join('main.q').write(reformat_code('''
+            import self.foo.bar
+
+            def main() {
+                print(bar(3));
+            }
+            '''))
+        tmpdir.join('foo.q').write(reformat_code('''
+            def bar(i) {
+                return i + 3;
+            }
+            '''))
+        assert run_code(str(tmpdir.join('main.q'))) == 0
+        assert tmpdir.join('foo.qc').check()
+        assert tmpdir.join('main.qc').check()
+        assert run_code(str(tmpdir.join('main.q'))) == 0
+        out, err = capfd.readouterr()
+        assert out == "6\n6\n"
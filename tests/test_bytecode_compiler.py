@@ -1,6 +1,8 @@
 import re
 from support import BaseTest
 
+from nolang import opcodes
+
 
 class TestBytecodeCompiler(BaseTest):
 
@@ -134,3 +136,84 @@ class TestBytecodeCompiler(BaseTest):
             LOAD_NONE
             RETURN
         """)
+
+    def test_decoded_instructions(self):
+        bc = self.compile("""
+        var i
+        i = 0
+        while i < 10 {
+           i = i + 1
+        }
+        """)
+        # LOAD_CONSTANT 0; STORE 0; LOAD_VARIABLE 0 ...
+        assert bc.code_ops[0] == opcodes.LOAD_CONSTANT
+        assert bc.code_arg0[0] == 0
+        assert bc.code_next[0] == 3
+        assert bc.code_ops[3] == opcodes.STORE
+        assert bc.code_next[3] == 6
+        # JUMP_IF_FALSE 29 at position 13, followed by the loop body
+        assert bc.code_ops[13] == opcodes.JUMP_IF_FALSE
+        assert bc.code_arg0[13] == 29
+        assert bc.code_next[13] == 16
+        # LOAD_NONE; RETURN
+        assert bc.code_ops[29] == opcodes.LOAD_NONE
+        assert bc.code_next[29] == 30
+        assert bc.code_ops[30] == opcodes.RETURN
+
+    def test_constant_dedup(self):
+        bc = self.compile("""
+        var x;
+        x = 3;
+        x = x + 3;
+        x = "foo";
+        x = "foo";
+        """)
+        assert len(bc._constants) == 2
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            STORE 0
+            LOAD_VARIABLE 0
+            LOAD_CONSTANT 0
+            ADD
+            STORE 0
+            LOAD_CONSTANT 1
+            STORE 0
+            LOAD_CONSTANT 1
+            STORE 0
+            LOAD_NONE
+            RETURN
+            """)
+
+    def test_module_constant_pool(self):
+        bc = self.compile("""
+        var x;
+        x = 3;
+        x = "foo";
+        """)
+        other = self.compile("""
+        var x;
+        x = "foo";
+        x = 3;
+        """)
+        other.module = bc.module
+        bc.setup(self.space)
+        other.setup(self.space)
+        assert bc.constants[0] is other.constants[1]
+        assert bc.constants[1] is other.constants[0]
+
+    def test_call_method(self):
+        bc = self.compile("""
+        var x;
+        x.foo(1, 2);
+        """)
+        self.assert_equals(bc, """
+            LOAD_VARIABLE 0
+            LOAD_METHOD 0
+            LOAD_CONSTANT 1
+            LOAD_CONSTANT 2
+            CALL_METHOD 2
+            DISCARD
+            LOAD_NONE
+            RETURN
+            """)
+        assert bc.stack_depth == 4
@@ -116,3 +116,114 @@ class TestClasses(BaseTest):
                 raise
         else:
             raise Exception("did not raise")
+
+    def test_attr_cache(self):
+        w_res = self.interpret('''
+            class X {
+                var x;
+
+                def __init__(self) {
+                    self.x = 1;
+                }
+
+                def get(self) {
+                    return self.x;
+                }
+            }
+
+            class Y {
+                def get(self) {
+                    return 2;
+                }
+            }
+
+            def main() {
+                var i, s, objs;
+                i = 0;
+                s = 0;
+                objs = [X(), X(), Y(), X()];
+                while i < 4 {
+                    s = s + objs[i].get();
+                    i = i + 1;
+                }
+                return s;
+            }
+            ''')
+        assert self.space.int_w(w_res) == 5
+        w_x = self.w_mod.getattr(self.space, 'X')
+        cache = w_x.lookup('get').bytecode.attr_caches[0]
+        assert cache.attrname == 'x'
+        assert (cache.hits, cache.misses) == (2, 1)
+        setter = w_x.lookup('__init__').bytecode.attr_caches[0]
+        assert (setter.hits, setter.misses) == (2, 1)
+        w_main = self.w_mod.getattr(self.space, 'main')
+        call_cache = w_main.bytecode.attr_caches[0]
+        assert call_cache.attrname == 'get'
+        # X, X, Y, X
+        assert (call_cache.hits, call_cache.misses) == (1, 3)
+
+    def test_maps(self):
+        w_res = self.interpret('''
+            class X {
+                var a, b;
+
+                def __init__(self) {
+                    self.b = 1;
+                }
+            }
+
+            class Y {
+                def __init__(self, dynamic) {
+                    self.x = 1;
+                    if dynamic {
+                        self.y = 2;
+                    }
+                }
+            }
+
+            def main() {
+                return [X(), X(), Y(false), Y(false), Y(true)];
+            }
+            ''')
+        x1, x2, y1, y2, y3 = self.space.listview(w_res)
+        assert x1.map is x2.map
+        assert len(x1.storage_w) == 2
+        assert x1.storage_w[0] is None
+        assert self.space.getattr(x1, 'b') is x1.storage_w[1]
+        assert y1.map is y2.map
+        assert y3.map is not y1.map
+        assert y3.map is y1.map.add_attribute('y')
+        assert len(y1.storage_w) == 1
+        assert self.space.int_w(self.space.getattr(y3, 'y')) == 2
+
+    def test_call_method_fallbacks(self):
+        w_res = self.interpret('''
+            def double(x) {
+                return x * 2;
+            }
+
+            class X {
+                def __init__(self) {
+                    self.callback = double;
+                }
+
+                def method(self, a, b) {
+                    return a - b;
+                }
+            }
+
+            def main() {
+                var x, m;
+                x = X();
+                m = x.method;
+                return x.callback(3) + x.method(10, 4) * 10 + m(2, 1) * 100;
+            }
+            ''')
+        assert self.space.int_w(w_res) == 166
+
+    def test_load_method_property(self):
+        space = self.space
+        w_exc = space.call(space.w_exception, [space.newtext("foo")])
+        w_callable, w_self = space.load_method(w_exc, 'message')
+        assert w_self is None
+        assert space.utf8_w(w_callable) == "foo"
@@ -1,5 +1,7 @@
-
 from support import BaseTest, reformat_code
+from nolang import opcodes
+from nolang.astnodes import StoringIntoGlobal
+from nolang.bytecode import UndeclaredVariable, NameAlreadyDefined
 from nolang.compiler import compile_module
 from nolang.module import W_Module
 from nolang.importer import Importer
@@ -16,4 +18,142 @@ class TestCompiler(BaseTest):
         w_mod = compile_module(self.space, 'test', 'self.test', code,
                                self.parse(code), imp)
         assert isinstance(w_mod, W_Module)
-        assert w_mod.name2index['foo'] == len(self.space.builtins_w)
+        assert w_mod.name2index == {'foo': 0}
+        assert len(w_mod.functions) == 1
+
+    def compile_module(self, code):
+        imp = Importer(self.space)
+        w_mod = compile_module(self.space, 'test', 'self.test', code,
+                               self.parse(code), imp)
+        w_mod.setup(self.space)
+        return w_mod
+
+    def test_lazy_compile(self):
+        code = reformat_code('''
+            def unused() {
+                return 1;
+            }
+
+            def main() {
+                return 3;
+            }
+        ''')
+        w_mod = self.compile_module(code)
+        w_unused = w_mod.getattr(self.space, 'unused')
+        w_main = w_mod.getattr(self.space, 'main')
+        assert w_unused.bytecode is None
+        assert w_main.bytecode is None
+        w_res = self.space.call_method(w_mod, 'main', [])
+        assert self.space.int_w(w_res) == 3
+        assert w_main.bytecode is not None
+        assert w_main.bytecode.constants is not None
+        assert w_unused.bytecode is None
+
+    def test_lazy_compiler_error(self):
+        code = reformat_code('''
+            def broken() {
+                var x;
+                x = 1;
+                return y;
+            }
+
+            def main() {
+                return 3;
+            }
+        ''')
+        w_mod = self.compile_module(code)
+        assert self.space.int_w(self.space.call_method(w_mod, 'main', [])) == 3
+        try:
+            self.space.call_method(w_mod, 'broken', [])
+        except UndeclaredVariable as e:
+            assert e.get_message() == "undeclared variable y"
+            assert e.filename == 'test'
+            assert e.get_lineno() == 4
+            assert e.get_line() == "        return y;"
+        else:
+            raise Exception("did not raise")
+
+    def test_eager_compile(self):
+        code = reformat_code('''
+            def broken() {
+                y = 1;
+            }
+        ''')
+        self.space.eager_compile = True
+        try:
+            self.compile_module(code)
+        except UndeclaredVariable as e:
+            assert e.get_lineno() == 2
+        else:
+            raise Exception("did not raise")
+        finally:
+            self.space.eager_compile = False
+
+    def test_builtins(self):
+        code = reformat_code('''
+            def main() {
+                return len([1, 2]);
+            }
+
+            def store() {
+                len = 3;
+            }
+        ''')
+        w_mod = self.compile_module(code)
+        assert self.space.int_w(self.space.call_method(w_mod, 'main', [])) == 2
+        bytecode = w_mod.getattr(self.space, 'main').bytecode
+        assert bytecode.code_ops[0] == opcodes.LOAD_BUILTIN
+        assert (self.space.builtins_w[bytecode.code_arg0[0]] is
+                self.space.builtin_dict['len'])
+        try:
+            self.space.call_method(w_mod, 'store', [])
+        except StoringIntoGlobal as e:
+            assert e.get_message() == "cannot assign to global len"
+        else:
+            raise Exception("did not raise")
+        try:
+            self.compile_module("def len(x) { return 1; }")
+        except NameAlreadyDefined as e:
+            assert e.name == 'len'
+        else:
+            raise Exception("did not raise")
+
+    def test_link_globals(self):
+        code = reformat_code('''
+            class A {
+                def get(self) {
+                    return double(3);
+                }
+            }
+
+            def double(x) {
+                return x * 2;
+            }
+
+            def pick(a, b) {
+                return a;
+            }
+
+            def main() {
+                var a;
+                a = A();
+                return double(a.get()) + pick(double, 1 or 2)(5);
+            }
+        ''')
+        w_mod = self.compile_module(code)
+        assert w_mod.linked
+        w_res = self.space.call_method(w_mod, 'main', [])
+        assert self.space.int_w(w_res) == 22
+        bytecode = w_mod.getattr(self.space, 'main').bytecode
+        assert opcodes.LOAD_GLOBAL in bytecode.code_ops
+        assert opcodes.LOAD_GLOBAL not in bytecode.quick_ops
+        calls = [bytecode.quick_ops[i] for i in range(len(bytecode.code_ops))
+                 if bytecode.code_ops[i] == opcodes.CALL]
+        # A is a class, double(a.get()) is a known function call, the
+        # arguments of pick() jump and the call of its result is not known
+        assert calls == [opcodes.CALL, opcodes.CALL_FUNCTION, opcodes.CALL,
+                         opcodes.CALL]
+        w_a = w_mod.getattr(self.space, 'A')
+        consts = [w_const for w_const in bytecode.constants]
+        assert w_a in consts
+        assert w_mod.getattr(self.space, 'double') in consts
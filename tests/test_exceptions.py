@@ -1,5 +1,6 @@
 import py
 from support import BaseTest
+from nolang.error import AppError, TracebackRing
 
 
 class TestExceptions(BaseTest):
@@ -150,3 +151,67 @@ class TestExceptions(BaseTest):
         }
         ''')
         # assert did not explode in compile()
+
+    def test_deep_traceback(self):
+        try:
+            self.interpret('''
+            def f(n) {
+                if n < 1 {
+                    raise Exception("foo");
+                }
+                return f(n - 1);
+            }
+            def main() {
+                try {
+                    f(3);
+                } except Exception {
+                }
+                return f(2000);
+            }
+            ''')
+        except AppError as e:
+            tb = e.get_traceback()
+        else:
+            raise Exception("did not raise")
+        names = []
+        while tb is not None:
+            names.append(tb.name)
+            tb = tb.next
+        assert names == ['main'] + ['f'] * 2001
+
+
+class TestTracebackRing(object):
+    def names(self, apperr):
+        names = []
+        tb = apperr.get_traceback()
+        while tb is not None:
+            names.append(tb.name)
+            tb = tb.next
+        return names
+
+    def test_wrap(self):
+        ring = TracebackRing(4)
+        a = AppError(None)
+        for i in range(6):
+            a.record_position(ring, "f%d" % i, None, i)
+        assert self.names(a) == ["f5", "f4", "f3", "f2", "f1", "f0"]
+
+    def test_interleaved(self):
+        ring = TracebackRing(4)
+        a = AppError(None)
+        b = AppError(None)
+        a.record_position(ring, "a0", None, 0)
+        b.record_position(ring, "b0", None, 0)
+        a.record_position(ring, "a1", None, 0)
+        assert self.names(a) == ["a1", "a0"]
+        assert self.names(b) == ["b0"]
+
+    def test_overwritten(self):
+        ring = TracebackRing(4)
+        a = AppError(None)
+        a.record_position(ring, "a0", None, 0)
+        b = AppError(None)
+        for i in range(4):
+            b.record_position(ring, "b%d" % i, None, 0)
+        assert self.names(a) == []
+        assert self.names(b) == ["b3", "b2", "b1", "b0"]
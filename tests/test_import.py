@@ -1,5 +1,8 @@
+import os
+
 from support import BaseTest, reformat_code
-from nolang.main import run_code
+from nolang.importer import ModuleFinder, parse_search_path
+from nolang.main import run_code, main
 
 
 class TestImport(BaseTest):
@@ -21,3 +24,85 @@ class TestImport(BaseTest):
             }
         '''))
         run_code(str(main_file))
+
+    def test_search_path(self, tmpdir, monkeypatch, capfd):
+        tmpdir.join('prog', 'main.q').write(reformat_code('''
+            import self.util.double
+            import self.other
+
+            def main() {
+                print(double(3) + other.inc(1));
+            }
+            '''), ensure=True)
+        tmpdir.join('lib', 'util.q').write(reformat_code('''
+            def double(i) {
+                return i * 2;
+            }
+            '''), ensure=True)
+        tmpdir.join('lib2', 'other.q').write(reformat_code('''
+            def inc(i) {
+                return i + 1;
+            }
+            '''), ensure=True)
+        fname = str(tmpdir.join('prog', 'main.q'))
+        monkeypatch.delenv('NOLANG_PATH', raising=False)
+        assert main(['nolang-c', fname]) == 1
+        assert main(['nolang-c', '--path=%s:%s' % (tmpdir.join('lib'),
+                                                   tmpdir.join('lib2')),
+                     fname]) == 0
+        monkeypatch.setenv('NOLANG_PATH', str(tmpdir.join('lib2')))
+        assert main(['nolang-c', '--path=%s' % tmpdir.join('lib'),
+                     fname]) == 0
+        out, err = capfd.readouterr()
+        assert out.endswith("8\n8\n")
+
+    def test_many_imports(self, tmpdir, capfd):
+        tmpdir.join('lib.q').write("".join([
+            "def f%d() { return %d; }\n" % (i, i) for i in range(20)]))
+        tmpdir.join('main.q').write(reformat_code('''
+            import core;
+            import self.lib{f0, f1, f2};
+            %s
+
+            def main() {
+                core.reflect.get_current_frame();
+                print(f0() + f1() + f2() + f19() + g());
+            }
+
+            def g() {
+                return 100;
+            }
+            ''') % "\n".join(["import self.lib.f%d;" % i
+                              for i in range(3, 20)]))
+        assert run_code(str(tmpdir.join('main.q'))) == 0
+        out, err = capfd.readouterr()
+        assert out.splitlines()[-1] == "122"
+
+
+class TestModuleFinder(object):
+    def test_find(self, tmpdir, monkeypatch):
+        tmpdir.join('a', 'foo.q').write('', ensure=True)
+        tmpdir.join('b', 'foo', 'bar.q').write('', ensure=True)
+        tmpdir.join('b', 'foo.q').write('', ensure=True)
+        listed = []
+        orig_listdir = os.listdir
+
+        def listdir(dirname):
+            listed.append(dirname)
+            return orig_listdir(dirname)
+
+        monkeypatch.setattr(os, 'listdir', listdir)
+        finder = ModuleFinder([str(tmpdir.join('a')), str(tmpdir.join('b')),
+                               str(tmpdir.join('missing'))])
+        for i in range(2):
+            assert finder.find(['foo']) == str(tmpdir.join('a', 'foo.q'))
+            assert finder.find(['foo', 'bar']) == str(tmpdir.join('b', 'foo',
+                                                                  'bar.q'))
+            assert finder.find(['foo', 'baz']) is None
+            assert finder.find(['baz']) is None
+        assert sorted(listed) == sorted(set(listed))
+        assert len(listed) == 6
+
+    def test_parse_search_path(self):
+        assert parse_search_path("") == []
+        assert parse_search_path("a::b:") == ["a", "b"]
@@ -1,4 +1,9 @@
+import sys
+
 from support import BaseTest
+from nolang import opcodes
+from nolang.error import AppError
+from nolang.interpreter import Interpreter
 
 
 class TestInterpreterBasic(BaseTest):
@@ -141,3 +146,187 @@ class TestInterpreter(BaseTest):
             }
             ''')
         assert self.space.int_w(w_res) == 8
+
+    def test_call_locals_and_args(self):
+        w_res = self.interpret('''
+            def f(a, b) {
+                var c, d;
+                c = a - b;
+                d = c * 10;
+                return d + b;
+            }
+            def main() {
+                var x;
+                x = 100;
+                return x + f(5, 2) + f(f(1, 1), 3);
+            }
+            ''')
+        # 100 + 32 + f(1, 3) = 100 + 32 + (-20 + 3)
+        assert self.space.int_w(w_res) == 115
+
+    def test_recursion_limit(self):
+        self.space.setup(Interpreter(stack_size=100))
+        try:
+            self.interpret('''
+                def f(n) {
+                    return f(n + 1);
+                }
+                def main() {
+                    return f(0);
+                }
+                ''')
+        except AppError as e:
+            assert e.match(self.space, self.space.w_recursionerror)
+        else:
+            raise Exception("did not raise")
+        finally:
+            self.space.setup(self.interpreter)
+
+    def test_deep_recursion(self):
+        # far deeper than the host stack allows if calls recursed natively
+        w_res = self.interpret('''
+            def f(n) {
+                if n < 1 {
+                    return 0;
+                }
+                return f(n - 1) + 1;
+            }
+            def main() {
+                return f(5000);
+            }
+            ''')
+        assert self.space.int_w(w_res) == 5000
+
+    def test_recursion_depth_limit(self):
+        self.space.recursion_limit = 100
+        try:
+            self.interpret('''
+                def f(n) {
+                    if n < 1 {
+                        return 0;
+                    }
+                    return f(n - 1) + 1;
+                }
+                def main() {
+                    return f(99) + f(100);
+                }
+                ''')
+        except AppError as e:
+            assert e.match(self.space, self.space.w_recursionerror)
+        else:
+            raise Exception("did not raise")
+        finally:
+            self.space.recursion_limit = 10000
+
+    def test_frames_release_values(self):
+        self.interpret('''
+            def f(a) {
+                var l;
+                l = [a, a];
+                return 1;
+            }
+            def g(a) {
+                var l;
+                l = [a];
+                raise Exception("foo");
+            }
+            def main() {
+                f("x");
+                try {
+                    g("y");
+                } except Exception {
+                }
+                return 0;
+            }
+            ''')
+        assert [w for w in self.interpreter.valuestack_w if w is not None] == []
+
+    def test_unwind_frames(self):
+        code = '''
+            def g(n) {
+                if n < 1 {
+                    raise Exception("foo");
+                }
+                return g(n - 1) + 1;
+            }
+            def f(n) {
+                try {
+                    return g(n);
+                } except Exception {
+                    return 0 - n;
+                }
+            }
+            def main() {
+                return [f(3), g(2)];
+            }
+            '''
+        try:
+            self.interpret(code)
+        except AppError as e:
+            tb = e.get_traceback()
+        else:
+            raise Exception("did not raise")
+        names = []
+        while tb is not None:
+            names.append(tb.name)
+            tb = tb.next
+        assert names == ['main', 'g', 'g', 'g']
+        assert self.interpreter.topframeref is None
+
+    def test_quickening(self):
+        w_res = self.interpret('''
+            def add(a, b) {
+                return a + b;
+            }
+            def main() {
+                var i, s;
+                i = 0;
+                s = 0;
+                while i < 3 {
+                    s = add(s, i);
+                    i = i + 1;
+                }
+                return [s, add("a", "b"), add(2, 3)];
+            }
+            ''')
+        s, w_str, w_int = self.space.listview(w_res)
+        assert self.space.int_w(s) == 3
+        assert self.space.utf8_w(w_str) == "ab"
+        assert self.space.int_w(w_int) == 5
+        main = self.w_mod.getattr(self.space, 'main').bytecode
+        assert opcodes.LT_INT in main.quick_ops
+        assert opcodes.ADD_INT in main.quick_ops
+        assert opcodes.LT not in main.quick_ops
+        # ADD_INT, deoptimized when it saw strings and generic from then on
+        add = self.w_mod.getattr(self.space, 'add').bytecode
+        assert opcodes.ADD_GENERIC in add.quick_ops
+        assert opcodes.ADD_INT not in add.quick_ops
+        assert opcodes.ADD_STR not in add.quick_ops
+        assert opcodes.ADD in add.code_ops
+
+    def test_mixed_operands_type_error(self):
+        for expr in ['1 + "a"', '"a" + 1', '1 < "a"', '[] - 1']:
+            try:
+                self.interpret_expr('return %s;' % expr)
+            except AppError as e:
+                assert e.match(self.space, self.space.w_typeerror)
+            else:
+                raise Exception("did not raise")
+
+    def test_small_int_cache(self):
+        space = self.space
+        assert space.newint(3) is space.newint(3)
+        assert space.newint(-5) is space.newint(-5)
+        assert space.newint(100000) is not space.newint(100000)
+        assert space.int_w(space.newint(100000)) == 100000
+        w_res = self.interpret_expr('return [1, 2, 3];')
+        assert space.len(w_res) == 3
+
+    def test_int_overflow(self):
+        for expr in ['%d + 1', '%d * 2', '0 - %d - 2']:
+            try:
+                self.interpret_expr('return %s;' % (expr % sys.maxint))
+            except AppError as e:
+                assert e.match(self.space, self.space.w_overflowerror)
+            else:
+                raise Exception("did not raise")
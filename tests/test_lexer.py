@@ -1,4 +1,5 @@
-from nolang.lexer import get_lexer
+from nolang.lexer import get_lexer, keyword_type, LexerRule, ParseError, \
+    KEYWORDS, TOKENS
 
 
 class TestLexing(object):
@@ -16,3 +17,89 @@ class TestLexing(object):
         assert tokens == ['INTEGER', 'PLUS', 'IDENTIFIER']
         tokens = [x.name for x in get_lexer().lex('', '1 + var')]
         assert tokens == ['INTEGER', 'PLUS', 'VAR']
+
+    def test_positions(self):
+        source = 'a = 1;\nbb = "x\ny" + 12;\n\n  c'
+        tokens = list(get_lexer().lex('', source))
+        positions = [(x.name, x.source_pos.lineno, x.source_pos.colno)
+                     for x in tokens if x.name != 'CHAR']
+        assert positions == [
+            ('IDENTIFIER', 1, 1), ('ASSIGN', 1, 3), ('INTEGER', 1, 5),
+            ('SEMICOLON', 1, 6),
+            ('IDENTIFIER', 2, 1), ('ASSIGN', 2, 4), ('ST_DQ_STRING', 2, 6),
+            ('ST_ENDSTRING', 3, 2), ('PLUS', 3, 4), ('INTEGER', 3, 6),
+            ('SEMICOLON', 3, 8), ('IDENTIFIER', 5, 3)]
+
+    def test_leading_newline(self):
+        tokens = [x.name for x in get_lexer().lex('', '\n\n1')]
+        assert tokens == ['INTEGER']
+
+    def test_error_line(self):
+        source = "a = 1\n" + "b" * 1000 + " = $ 2\nc = 3\n"
+        try:
+            list(get_lexer().lex('', source))
+        except ParseError as e:
+            assert e.lineno == 2
+            assert e.get_line() == "b" * 1000 + " = $ 2"
+            assert e.start_colno == 1003
+        else:
+            raise Exception("did not raise")
+
+    def test_keywords(self):
+        for word in KEYWORDS:
+            assert TOKENS[keyword_type(word, 0, len(word))] == word.upper()
+        for word in ['', 'x', 'defx', 'clas', 'IF', 'tru', 'raises']:
+            assert keyword_type(word, 0, len(word)) == -1
+        assert TOKENS[keyword_type('(while)', 1, 6)] == 'WHILE'
+        tokens = [x.name for x in get_lexer().lex('', '`${if}` "if"')]
+        assert tokens == ['ST_INTERP_STRING', 'ST_INTERP', 'IF',
+                          'RIGHT_CURLY_BRACE', 'ST_ENDSTRING', 'ST_DQ_STRING',
+                          'CHAR', 'CHAR', 'ST_ENDSTRING']
+
+    def test_rule_kinds(self):
+        lexer = get_lexer()
+        rules = dict([(rule.name, rule)
+                      for rule in lexer.get_state('INITIAL').rules])
+        assert rules['TRUEDIV'].kind == LexerRule.KIND_LITERAL
+        assert rules['IDENTIFIER'].kind == LexerRule.KIND_RUN
+        assert rules['IDENTIFIER'].match('_a1 b', 0) == 3
+        assert rules['IDENTIFIER'].match('1a', 0) == -1
+        assert rules['INTEGER'].match('123', 1) == 3
+        rules = dict([(rule.name, rule)
+                      for rule in lexer.get_state('DQ_STRING').rules])
+        assert rules['ESC_HEX_ANY'].kind == LexerRule.KIND_REGEX
+        assert rules['ESC_HEX_ANY'].match('\\u{1F}x', 0) == 6
+
+    def test_dispatch_order(self):
+        # rules that start with the same character keep their order
+        state = get_lexer().get_state('INITIAL')
+        names = [rule.name for rule in state.dispatch[ord('r')]]
+        assert names == ['ST_RAW_DQ_STRING', 'ST_RAW_SQ_STRING', 'IDENTIFIER']
+        assert state.dispatch[ord('$')] == []
+        tokens = [(x.name, x.value) for x in get_lexer().lex('', 'r rx r"a"')]
+        assert tokens == [('IDENTIFIER', 'r'), ('IDENTIFIER', 'rx'),
+                          ('ST_RAW_DQ_STRING', 'r"'), ('RAW_CHAR', 'a'),
+                          ('ST_ENDRAW', '"')]
+
+    def test_token_buffer(self):
+        source = 'a = 1;\nbb = "x\ny" + 12\n\n  c'
+        expected = list(get_lexer().lex('', source))
+        buffer = get_lexer().tokenize('', source)
+        tokens = list(buffer)
+        assert len(buffer) == len(expected)
+        for tok, exp in zip(tokens, expected):
+            assert tok.gettokentype() == exp.gettokentype()
+            assert tok.getstr() == exp.getstr()
+            assert tok.getsrcpos() == exp.getsrcpos()
+            pos = tok.getsourcepos()
+            assert (pos.lineno, pos.colno) == (exp.source_pos.lineno,
+                                               exp.source_pos.colno)
+
+    def test_token_buffer_fill(self):
+        buffer = get_lexer().tokenize('', 'def f() {\n}\n')
+        buffer.fill()
+        assert [TOKENS[tp] for tp in buffer.types] == [
+            'DEF', 'IDENTIFIER', 'LEFT_PAREN', 'RIGHT_PAREN',
+            'LEFT_CURLY_BRACE', 'RIGHT_CURLY_BRACE', 'SEMICOLON']
+        assert buffer.getstr(1) == 'f'
+        assert buffer.getsourcepos(5).lineno == 2
@@ -2,7 +2,7 @@
 import re
 
 from support import reformat_code
-from nolang.main import main
+from nolang.main import main, space
 
 
 class TestMain(object):
@@ -15,7 +15,42 @@ class TestMain(object):
         """))
         assert main(['nolang-c', str(fname)]) == 0
 
-    def test_main_lex_error(self, tmpdir, capsys):
+    def test_main_opt_level(self, tmpdir):
+        fname = tmpdir.join("foo.q")
+        fname.write(reformat_code("""
+        def main() {
+            print(3);
+        }
+        """))
+        assert main(['nolang-c', '-O0', str(fname)]) == 0
+        assert main(['nolang-c', '-O1', str(fname)]) == 0
+        assert main(['nolang-c', '-Ox', str(fname)]) == 1
+
+    def test_main_recursion_limit(self, tmpdir, capfd):
+        fname = tmpdir.join("foo.q")
+        fname.write(reformat_code("""
+        def f(n) {
+            if n < 1 {
+                return 0;
+            }
+            return f(n - 1) + 1;
+        }
+
+        def main() {
+            print(f(50));
+        }
+        """))
+        try:
+            assert main(['nolang-c', '--recursion-limit=100', str(fname)]) == 0
+            assert main(['nolang-c', '--recursion-limit=20', str(fname)]) == 1
+            assert main(['nolang-c', '--recursion-limit=x', str(fname)]) == 1
+        finally:
+            space.recursion_limit = 10000
+        out, err = capfd.readouterr()
+        assert out.startswith("50\n")
+        assert "RecursionError: maximum recursion depth exceeded" in err
+
+    def test_main_lex_error(self, tmpdir, capfd):
         fname = tmpdir.join("foo.q")
         fname.write(reformat_code("""
             def main() {
@@ -23,7 +58,7 @@ class TestMain(object):
             }
             """))
         assert main(['nolang-c', str(fname)]) == 1
-        out, err = capsys.readouterr()
+        out, err = capfd.readouterr()
         assert out.find("unrecognized token") > 0
 
     def test_main_traceback_formatting(self, tmpdir, capfd):
@@ -50,3 +85,28 @@ class TestMain(object):
         assert len(lines) == len(expected)
         for i in range(len(lines)):
             assert re.search(expected[i], lines[i])
+
+    def test_main_compiler_error(self, tmpdir, capfd):
+        fname = tmpdir.join("foo.q")
+        fname.write(reformat_code("""
+            def main() {
+                print(3);
+                foo();
+            }
+            """))
+        assert main(['nolang-c', '--no-cache', str(fname)]) == 1
+        out, err = capfd.readouterr()
+        assert out.startswith("Error compiling file ")
+        assert "line 3: undeclared variable foo" in out
+        assert main(['nolang-c', '--no-cache', '--eager', str(fname)]) == 1
+        out, err = capfd.readouterr()
+        assert "line 3: undeclared variable foo" in out
+
+    def test_main_prebuilt_state(self):
+        # built at import, so translation puts it into the binary
+        from nolang.main import space
+        from nolang.bytecache import builtins_hash
+        assert space.builtins_hash != -1
+        assert builtins_hash(space) == space.builtins_hash
+        w_reflect = space.coremod.getattr(space, 'reflect')
+        assert w_reflect.getattr(space, 'get_current_frame') is not None
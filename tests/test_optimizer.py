@@ -0,0 +1,261 @@
+import re
+from support import BaseTest
+from nolang import opcodes
+from nolang.error import AppError
+from nolang.frameobject import format_traceback
+
+
+class TestOptimizer(BaseTest):
+
+    def assert_equals(self, bytecode, expected):
+        lines = bytecode.repr(False).splitlines()
+        exp_lines = [line.strip(" ") for line in expected.splitlines()
+                     if line.strip(" ")]
+        assert [line.strip(" ") for line in lines] == exp_lines
+
+    def constants(self, bytecode):
+        return [getattr(c, '_intval', getattr(c, '_strval', None))
+                for c in bytecode._constants]
+
+    def test_fold_arithmetic(self):
+        bc = self.compile("""
+        var x;
+        x = 2 * 3 + 1;
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            STORE 0
+            LOAD_NONE
+            RETURN
+            """)
+        assert self.constants(bc) == [7]
+
+    def test_no_fold_division_by_zero(self):
+        bc = self.compile("""
+        var x;
+        x = 1 // 0;
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            LOAD_CONSTANT 1
+            TRUEDIV
+            STORE 0
+            LOAD_NONE
+            RETURN
+            """)
+
+    def test_fold_text_build(self):
+        bc = self.compile("""
+        var x;
+        x = `a${1}b${"c"}`;
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            STORE 0
+            LOAD_NONE
+            RETURN
+            """)
+        assert self.constants(bc) == ["a1bc"]
+
+    def test_fold_string_add(self):
+        bc = self.compile("""
+        var x;
+        x = "a" + "b";
+        """, opt_level=1)
+        assert self.constants(bc) == ["ab"]
+
+    def test_discard_constant(self):
+        bc = self.compile("""
+        3;
+        "foo";
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_NONE
+            RETURN
+            """)
+        assert self.constants(bc) == []
+
+    def test_not_in_branch(self):
+        bc = self.compile("""
+        var x;
+        x = 0;
+        if x not in [1] {
+            x = 1;
+        }
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            STORE 0
+            LOAD_VARIABLE 0
+            LOAD_CONSTANT 1
+            LIST_BUILD 1
+            IN
+            JUMP_IF_TRUE 25
+            LOAD_CONSTANT 1
+            STORE 0
+            LOAD_NONE
+            RETURN
+            """)
+
+    def test_constant_condition(self):
+        bc = self.compile("""
+        var x;
+        x = 0;
+        while true {
+            x = x + 1;
+            if 10 < x {
+                return x;
+            }
+        }
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            LOAD_CONSTANT 0
+            STORE 0
+            LOAD_VARIABLE 0
+            LOAD_CONSTANT 1
+            ADD
+            STORE 0
+            LOAD_CONSTANT 2
+            LOAD_VARIABLE 0
+            LT
+            JUMP_IF_FALSE 6
+            LOAD_VARIABLE 0
+            RETURN
+            """)
+
+    def test_unreachable_after_return(self):
+        bc = self.compile("""
+        try {
+        } finally {
+            return 3;
+        }
+        """, opt_level=1)
+        self.assert_equals(bc, """
+            PUSH_RESUME_STACK 4
+            POP_RESUME_STACK
+            LOAD_CONSTANT 0
+            RETURN
+            """)
+
+    def test_exception_targets(self):
+        bc = self.compile("""
+        try {
+            raise Exception("foo");
+        } except Exception {
+        }
+        """, opt_level=1)
+        text = bc.repr()
+        m = re.search(r"PUSH_RESUME_STACK (\d+)", text)
+        handler = int(m.group(1))
+        assert re.search(r"\n *%d  COMPARE_EXCEPTION" % handler, text)
+        assert len(bc.lnotab) == len(bc.bytecode)
+
+    def test_optimized_execution(self):
+        w_res = self.interpret_expr("""
+        var x, i;
+        x = 0;
+        i = 0;
+        while i < 2 * 5 {
+            if i not in [3, 4] {
+                x = x + i + 2 * 3 - 6;
+            }
+            i = i + 1;
+        }
+        return x;
+        """)
+        assert self.space.int_w(w_res) == 38
+
+
+class TestInlining(BaseTest):
+    def interpret(self, code, args=None):
+        self.space.opt_level = 2
+        try:
+            return BaseTest.interpret(self, code, args)
+        finally:
+            self.space.opt_level = 1
+
+    def get_bytecode(self, name):
+        w_func = self.w_mod.functions[self.w_mod.name2index[name]]
+        return w_func.get_bytecode(self.space)
+
+    def calls(self, bytecode):
+        return [op for op in bytecode.code_ops if op == opcodes.CALL]
+
+    def test_inline(self):
+        w_res = self.interpret("""
+        def sq(x) {
+            return x * x;
+        }
+
+        def add(a, b) {
+            return a + b;
+        }
+
+        def main() {
+            var i, s;
+            i = 0;
+            s = 0;
+            while i < 3 {
+                s = add(s, sq(i) + sq(sq(2)));
+                i = i + 1;
+            }
+            return s;
+        }
+        """)
+        assert self.space.int_w(w_res) == 53
+        bc = self.get_bytecode('main')
+        assert self.calls(bc) == []
+        assert [inlined.name for inlined in bc.inlined] == ['sq', 'sq', 'sq',
+                                                            'add']
+        assert len(bc.varnames) == 4  # the calls share two variables
+        assert len(bc.lnotab) == len(bc.bytecode)
+
+    def test_not_inlined(self):
+        w_res = self.interpret("""
+        def fact(n) {
+            if n < 2 {
+                return 1;
+            }
+            return n * fact(n - 1);
+        }
+
+        def local(x) {
+            var y;
+            y = x + 1;
+            return y;
+        }
+
+        def big(x) {
+            return x + x + x + x + x + x + x + x + x + x + x + x + x;
+        }
+
+        def main() {
+            return fact(3) + local(1) + big(0);
+        }
+        """)
+        assert self.space.int_w(w_res) == 8
+        assert len(self.calls(self.get_bytecode('main'))) == 3
+        assert len(self.calls(self.get_bytecode('fact'))) == 1
+
+    def test_traceback(self):
+        try:
+            self.interpret("""
+            def sq(x) {
+                return x * x;
+            }
+
+            def main() {
+                return sq("a");
+            }
+            """)
+        except AppError as e:
+            tb = format_traceback(self.space, e)
+        else:
+            raise Exception("did not raise")
+        assert self.get_bytecode('main').inlined
+        assert tb.splitlines()[:4] == [
+            'file "test", line 2, in sq',
+            '  return x * x;',
+            'file "test", line 5, in main',
+            '  return sq("a");',
+        ]
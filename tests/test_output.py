@@ -0,0 +1,43 @@
+from nolang.output import Output, BUFFER_SIZE
+
+
+class RecordingOutput(Output):
+    def __init__(self):
+        Output.__init__(self)
+        self.sent = []
+
+    def send_stdout(self, data):
+        self.sent.append(('o', data))
+
+    def send_stderr(self, data):
+        self.sent.append(('e', data))
+
+
+class TestOutput(object):
+    def test_buffered(self):
+        output = RecordingOutput()
+        output.write_stdout("foo\n")
+        output.write_stdout("bar\n")
+        assert output.sent == []
+        output.flush()
+        assert output.sent == [('o', "foo\nbar\n")]
+        output.flush()
+        assert output.sent == [('o', "foo\nbar\n")]
+
+    def test_stderr_keeps_order(self):
+        output = RecordingOutput()
+        output.write_stdout("foo\n")
+        output.write_stderr("error\n")
+        assert output.sent == [('o', "foo\n"), ('e', "error\n")]
+        output.write_stderr("again\n")
+        assert output.sent[2:] == [('e', "again\n")]
+
+    def test_full_buffer(self):
+        output = RecordingOutput()
+        line = "x" * 99 + "\n"
+        for i in range(BUFFER_SIZE // len(line)):
+            output.write_stdout(line)
+        assert output.sent == []
+        output.write_stdout(line)
+        assert len(output.sent) == 1
+        assert output.sent[0][1] == line * (BUFFER_SIZE // len(line) + 1)
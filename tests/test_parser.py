@@ -1,5 +1,10 @@
+import json
+
+from rply.parsergenerator import LRTable
+
 from nolang.lexer import get_lexer
-from nolang.parser import get_parser, ParsingState, ParseError
+from nolang.parser import get_parser, ParsingState, ParseError, \
+    make_parser_generator, table_cache_name
 from nolang import astnodes as ast
 
 from tests.support import reformat_expr, reformat_code
@@ -319,3 +324,31 @@ class TestFullProgram(BaseTest):
             def main() {
             }
             ''')
+
+
+class TestParserTables(object):
+    def tables(self, parser):
+        table = parser.lr_table
+        return table.lr_action, table.lr_goto, table.default_reductions
+
+    def test_table_cache(self, tmpdir, monkeypatch):
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+        expected = self.tables(get_parser())
+        assert len(tmpdir.join('rply').listdir('nolang-*.json')) == 1
+        assert self.tables(get_parser()) == expected
+
+    def test_shipped_table_is_current(self, tmpdir, monkeypatch):
+        # if this fails, run make parsetab
+        from nolang import parsetab
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+        make_parser_generator().build()
+        [cache] = tmpdir.join('rply').listdir()
+        assert cache.basename == table_cache_name(parsetab.GRAMMAR_HASH)
+        assert json.loads(cache.read()) == json.loads(parsetab.TABLE)
+
+    def test_shipped_table_is_used(self, tmpdir, monkeypatch):
+        def from_grammar(grammar):
+            raise Exception("generated the tables")
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+        monkeypatch.setattr(LRTable, 'from_grammar', staticmethod(from_grammar))
+        get_parser()
@@ -0,0 +1,91 @@
+import os
+import time
+
+from rpython.rlib.rsocket import socketpair, AF_UNIX, SOCK_STREAM
+
+from support import reformat_code
+from nolang.bytecache import ProgramCache
+from nolang.main import run_code, space
+from nolang.server import FrameReader, send_frame, serve, connect
+
+
+class TestFrames(object):
+    def test_roundtrip(self):
+        a, b = socketpair(AF_UNIX, SOCK_STREAM)
+        try:
+            send_frame(a, 'o', "foo")
+            send_frame(a, 'e', "")
+            send_frame(a, 'x', "a:b" * 5000)
+            reader = FrameReader(b)
+            assert reader.read_frame() == ('o', "foo")
+            assert reader.read_frame() == ('e', "")
+            assert reader.read_frame() == ('x', "a:b" * 5000)
+        finally:
+            a.close()
+            b.close()
+
+
+class TestProgramCache(object):
+    def test_get_put(self):
+        programs = ProgramCache()
+        assert programs.get("foo.q", "x") is None
+        program = object()
+        programs.put("foo.q", "x", program)
+        assert programs.get("foo.q", "x") is program
+        assert programs.get("foo.q", "y") is None
+
+
+class TestServer(object):
+    def start(self, path):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = serve(space, path, run_code)
+            finally:
+                os._exit(status)
+        for i in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+        return pid
+
+    def test_run(self, tmpdir, capfd):
+        tmpdir.join('main.q').write(reformat_code('''
+            def main() {
+                print("foo");
+                raise Exception("bar");
+            }
+            '''))
+        tmpdir.join('parse_error.q').write("def main( {")
+        path = str(tmpdir.join('server.sock'))
+        pid = self.start(path)
+        try:
+            assert connect(path, str(tmpdir.join('main.q'))) == 1
+            assert connect(path, str(tmpdir.join('main.q'))) == 1
+            assert connect(path, str(tmpdir.join('parse_error.q'))) == 1
+            assert connect(path, str(tmpdir.join('missing.q'))) == 1
+        finally:
+            assert connect(path, None) == 0
+            _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        assert not os.path.exists(path)
+        out, err = capfd.readouterr()
+        lines = out.splitlines()
+        assert lines[:2] == ["foo", "foo"]
+        assert lines[2].startswith("Error parsing input file")
+        assert lines[-1].startswith("Error reading file")
+        assert err.count("Exception: bar") == 2
+
+    def test_not_a_socket(self, tmpdir, capfd):
+        path = tmpdir.join('server.sock')
+        path.write("precious")
+        assert serve(space, str(path), run_code) == 1
+        assert path.read() == "precious"
+        out, err = capfd.readouterr()
+        assert err.startswith("Error starting server")
+
+    def test_no_server(self, tmpdir, capfd):
+        assert connect(str(tmpdir.join('missing.sock')), None) == 1
+        out, err = capfd.readouterr()
+        assert err.startswith("Error talking to server")